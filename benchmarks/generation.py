@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Full generation pipeline benchmark with a memory regression check.
+
+Each scenario runs an interactive setup in a fresh interpreter: prompts are
+answered from a script instead of InquirerPy, and npm/git go to a stub
+CommandRunner that only records them. Model i gets 1 + i % 50 attributes.
+For every scenario the benchmark records wall time, peak RSS, files written,
+and the time spent registering routes / rendering routes/index.js (what
+update_index_routes used to do), rendering templates and in each generator.
+
+The fastest of --runs runs is compared with generation_baseline.json: a
+scenario fails the check (exit 1) when it is slower or uses more memory than
+the baseline beyond the tolerances.
+
+    python benchmarks/generation.py                    # 1, 100, 1000, 10000 models
+    python benchmarks/generation.py --models 1 100     # a subset
+    python benchmarks/generation.py --update           # record a new baseline
+"""
+import argparse
+import contextlib
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BENCH_DIR, '..', 'src')
+BASELINE_FILE = os.path.join(BENCH_DIR, 'generation_baseline.json')
+SCENARIOS = [1, 100, 1000, 10000]
+MAX_ATTRIBUTES = 50
+MONGOOSE_TYPES = ['String', 'Number', 'Boolean', 'Date']
+
+
+class ScriptedInquirer:
+    """Replaces InquirerPy: every prompt returns the next scripted answer"""
+
+    def __init__(self, answers):
+        self._answers = iter(answers)
+
+    def _prompt(self, message=None, **kwargs):
+        answer = next(self._answers, None)
+        if answer is None:
+            raise RuntimeError(f"The script has no answer left for: {message}")
+        return _Answer(answer)
+
+    text = select = confirm = checkbox = _prompt
+
+
+class _Answer:
+    def __init__(self, value):
+        self.value = value
+
+    def execute(self):
+        return self.value
+
+
+def script(models: int, middleware_count: int) -> list:
+    """Answers of an interactive MongoDB setup with cors and the given number of models"""
+    answers = ['Yes', 'MongoDB']
+    answers += ['Yes'] + ['No'] * (middleware_count - 1)
+    answers += ['Production', 'Yes']
+    for index in range(models):
+        answers.append(f"Model{index}")
+        for attribute in range(1 + index % MAX_ATTRIBUTES):
+            answers += [
+                f"field{attribute}",
+                MONGOOSE_TYPES[attribute % len(MONGOOSE_TYPES)],
+                attribute == 0,
+                False,
+                attribute % 10 == 1,
+                'No Default',
+            ]
+        answers += ['done', False]
+    answers.append('')
+    return answers
+
+
+class Timings:
+    """Cumulative time spent in wrapped functions"""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self.calls = defaultdict(int)
+
+    def wrap(self, owner, attribute: str, label: str):
+        function = getattr(owner, attribute)
+        totals, calls = self.totals, self.calls
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                totals[label] += time.perf_counter() - start
+                calls[label] += 1
+
+        setattr(owner, attribute, timed)
+
+
+def run_scenario(models: int) -> dict:
+    """Run one scenario in this process and return its measurements"""
+    sys.path.insert(0, SRC_DIR)
+    import logging
+    import templates.index_js
+    from core.project_initializer import ProjectInitializer
+    from modules import controller_generator, database_selector, middleware_selector, model_generator, route_generator
+    from templates.registry import TemplateRegistry
+    from utils.async_command_runner import AsyncCommandRunner
+    from utils.command_runner import CommandRecord
+    from utils.file_tree import FileTree
+    from utils.logger import setup_logger
+
+    class StubCommandRunner(AsyncCommandRunner):
+        """Records npm/git commands instead of running them"""
+
+        def run_command(self, command, error_message="Command failed", timeout=None, cwd=None):
+            self.run_log.add(CommandRecord(command=list(command), started_at=time.time(), exit_code=0))
+            return subprocess.CompletedProcess(command, 0, '', '')
+
+        async def run_command_async(self, command, error_message="Command failed", cwd=None, timeout=None):
+            return self.run_command(command, error_message, timeout, cwd)
+
+    setup_logger(logging.WARNING)
+    scripted = ScriptedInquirer(script(models, len(middleware_selector.MiddlewareSelector.OPTIONAL_MIDDLEWARE)))
+    for module in (model_generator, database_selector, middleware_selector):
+        module.inquirer = scripted
+
+    timings = Timings()
+    timings.wrap(route_generator.RouteGenerator, 'register_routes', 'routes_index')
+    timings.wrap(route_generator.RouteGenerator, 'generate_routes_index', 'routes_index')
+    timings.wrap(TemplateRegistry, 'render', 'template_render')
+    timings.wrap(model_generator.ModelGenerator, 'generate_model', 'generate_model')
+    timings.wrap(controller_generator.ControllerGenerator, 'generate_controller', 'generate_controller')
+    timings.wrap(route_generator.RouteGenerator, 'generate_routes', 'generate_routes')
+    timings.wrap(templates.index_js, 'generate_index_js', 'generate_index_js')
+    timings.wrap(FileTree, 'flush', 'flush')
+
+    workspace = tempfile.mkdtemp(prefix='xpressgen-bench-')
+    try:
+        initializer = ProjectInitializer(output_dir=os.path.join(workspace, 'project'))
+        stub = StubCommandRunner(initializer.logger, run_log=initializer.command_runner.run_log)
+        initializer.command_runner = stub
+        initializer.__dict__['async_runner'] = stub
+
+        start = time.perf_counter()
+        # The generators report every file on stdout
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            initializer.generate()
+        wall_time = time.perf_counter() - start
+        files_written = sum(len(files) for _, _, files in os.walk(initializer.file_tree.root))
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    peak_rss_mb = peak_rss / (1024 * 1024) if sys.platform == 'darwin' else peak_rss / 1024
+    return {
+        'models': models,
+        'wall_time': round(wall_time, 4),
+        'peak_rss_mb': round(peak_rss_mb, 1),
+        'files_written': files_written,
+        'commands': len(initializer.command_runner.run_log.records()),
+        'functions': {label: round(total, 4) for label, total in sorted(timings.totals.items())},
+        'calls': dict(sorted(timings.calls.items())),
+    }
+
+
+def measure(models: int, runs: int) -> dict:
+    """
+    Run one scenario in fresh interpreters, so peak RSS is its own, and keep
+    the fastest run (disk writes make single runs noisy)
+    """
+    results = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--run-scenario', str(models)],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"{models} models scenario failed:\n{result.stderr}")
+        results.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return min(results, key=lambda result: result['wall_time'])
+
+
+def compare(result: dict, baseline: dict, tolerance: float, memory_tolerance: float, min_delta: float) -> list:
+    failures = []
+    name = f"{result['models']} models"
+    time_limit = max(baseline['wall_time'] * (1 + tolerance), baseline['wall_time'] + min_delta)
+    if result['wall_time'] > time_limit:
+        failures.append(f"{name}: {result['wall_time']:.3f} s > {time_limit:.3f} s")
+    memory_limit = baseline['peak_rss_mb'] * (1 + memory_tolerance)
+    if result['peak_rss_mb'] > memory_limit:
+        failures.append(f"{name}: peak RSS {result['peak_rss_mb']:.1f} MB > {memory_limit:.1f} MB")
+    if result['files_written'] != baseline['files_written']:
+        failures.append(f"{name}: {result['files_written']} files written, baseline {baseline['files_written']}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', type=int, nargs='+', default=SCENARIOS, help='Scenarios to run (default: 1 100 1000 10000)')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per scenario, the fastest is kept (default: 3)')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='Baseline JSON file')
+    parser.add_argument('--update', action='store_true', help='Write the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.5, help='Allowed wall time increase (default: 0.5 = 50%%)')
+    parser.add_argument('--memory-tolerance', type=float, default=0.25, help='Allowed peak RSS increase (default: 0.25)')
+    parser.add_argument('--min-delta', type=float, default=0.05, help='Wall time increase always allowed, in seconds (default: 0.05)')
+    parser.add_argument('--run-scenario', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_scenario is not None:
+        print(json.dumps(run_scenario(args.run_scenario)))
+        return
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    failures = []
+    results = {}
+    print(f"{'models':>7}  {'wall (s)':>9}  {'rss (MB)':>9}  {'files':>6}  {'routes idx':>10}  {'render':>8}  {'flush':>8}")
+    for models in args.models:
+        result = measure(models, args.runs)
+        results[str(models)] = result
+        functions = result['functions']
+        print(
+            f"{models:>7}  {result['wall_time']:>9.3f}  {result['peak_rss_mb']:>9.1f}  {result['files_written']:>6}"
+            f"  {functions.get('routes_index', 0):>10.3f}  {functions.get('template_render', 0):>8.3f}  {functions.get('flush', 0):>8.3f}"
+        )
+        if not args.update and str(models) in baseline:
+            failures += compare(result, baseline[str(models)], args.tolerance, args.memory_tolerance, args.min_delta)
+
+    if args.update:
+        baseline.update(results)
+        with open(args.baseline, 'w') as file:
+            json.dump(dict(sorted(baseline.items(), key=lambda item: int(item[0]))), file, indent=2)
+            file.write('\n')
+        print(f"\nBaseline written to {args.baseline}")
+    elif failures:
+        print("\nGeneration benchmark regressed:\n  - " + "\n  - ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Cold-start import budget of the xpressgen CLI.
+
+Each scenario imports what one kind of run needs in a fresh interpreter under
+`python -X importtime` and keeps the median cumulative time over several runs.
+The check fails (exit 1) when a scenario exceeds its budget in
+startup_budget.json or loads a module it must not load (InquirerPy for
+non-interactive runs, generators nobody asked for).
+
+    python benchmarks/startup_budget.py            # check against the budget
+    python benchmarks/startup_budget.py --runs 15  # more samples on noisy hosts
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'startup_budget.json')
+
+# name -> (statement executed in a fresh interpreter, top-level modules whose cumulative time counts)
+SCENARIOS = {
+    'cli': ("import main; main.build_parser()", ['main', 'core']),
+    'spec': (
+        "import core.project_spec, core.project_initializer",
+        ['core', 'core.project_spec', 'core.project_initializer'],
+    ),
+}
+
+# Modules no scenario above may load
+FORBIDDEN = ['InquirerPy', 'prompt_toolkit', 'modules.controller_generator', 'modules.route_generator']
+
+
+def measure(statement: str, modules: list):
+    """Return (cumulative import time in ms of the given modules, every imported module name)"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    total_us = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        # Only top-level imports: nested ones are already in their parent's cumulative time
+        if name.strip() in modules and not name.startswith('   '):
+            total_us += int(cumulative)
+        imported.add(name.strip())
+    return total_us / 1000, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=7, help='Fresh interpreters per scenario (default: 7)')
+    parser.add_argument('--budget', default=BUDGET_FILE, help='JSON file of per-scenario budgets in ms')
+    args = parser.parse_args()
+
+    with open(args.budget) as file:
+        budgets = json.load(file)
+
+    failures = []
+    for name, (statement, modules) in SCENARIOS.items():
+        samples = []
+        for _ in range(args.runs):
+            elapsed, imported = measure(statement, modules)
+            samples.append(elapsed)
+            for module in FORBIDDEN:
+                if module in imported:
+                    failures.append(f"{name}: imports {module}")
+        median = statistics.median(samples)
+        budget = budgets[name]
+        status = 'ok' if median <= budget else 'OVER BUDGET'
+        print(f"{name:<6} median {median:7.1f} ms  (budget {budget} ms, min {min(samples):.1f} ms)  {status}")
+        if median > budget:
+            failures.append(f"{name}: {median:.1f} ms > {budget} ms")
+
+    if failures:
+        print("\nStartup budget check failed:\n  - " + "\n  - ".join(sorted(set(failures))))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Render throughput of the template registry.
+
+Generates model, controller and routes files for many synthetic models into an
+in-memory FileTree (nothing touches the disk) and reports the total time and the
+time per model. With --budget the check fails (exit 1) above that many seconds.
+
+    python benchmarks/template_render.py                   # 10k models per database
+    python benchmarks/template_render.py --models 1000 --budget 0.5
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from modules.controller_generator import ControllerGenerator  # noqa: E402
+from modules.model_generator import ModelGenerator  # noqa: E402
+from modules.route_generator import RouteGenerator  # noqa: E402
+from utils.file_tree import FileTree  # noqa: E402
+
+
+def synthetic_model(index: int, db_type: str) -> dict:
+    string_type = 'String'
+    number_type = 'Number' if db_type == 'mongodb' else 'Integer'
+    return {
+        'name': f"Model{index}",
+        'db_type': db_type,
+        'attributes': [
+            {'name': 'title', 'type': string_type, 'required': True, 'unique': True, 'default': None},
+            {'name': 'body', 'type': string_type, 'required': False, 'unique': False, 'default': 'draft'},
+            {'name': 'count', 'type': number_type, 'required': False, 'unique': False, 'default': '0'},
+        ],
+    }
+
+
+def render_models(count: int, db_type: str) -> FileTree:
+    file_tree = FileTree('.')
+    models = ModelGenerator(file_tree)
+    controllers = ControllerGenerator(file_tree)
+    routes = RouteGenerator(file_tree)
+    # The generators report every file on stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        for index in range(count):
+            model_info = synthetic_model(index, db_type)
+            models.generate_model(model_info)
+            controllers.generate_controller(model_info)
+            routes.generate_routes(model_info)
+            routes.register_routes(model_info)
+        routes.generate_routes_index()
+    return file_tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', type=int, default=10000, help='Models rendered per database (default: 10000)')
+    parser.add_argument('--budget', type=float, help='Fail when a database takes longer than this many seconds')
+    args = parser.parse_args()
+
+    failures = []
+    for db_type in ('mongodb', 'postgresql'):
+        start = time.perf_counter()
+        file_tree = render_models(args.models, db_type)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{db_type:<10} {args.models} models  {elapsed:7.3f} s  "
+            f"({elapsed / args.models * 1e6:6.1f} us/model, {file_tree.bytes_rendered / 1e6:.1f} MB)"
+        )
+        if args.budget is not None and elapsed > args.budget:
+            failures.append(f"{db_type}: {elapsed:.3f} s > {args.budget} s")
+
+    if failures:
+        print("\nRender budget check failed:\n  - " + "\n  - ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
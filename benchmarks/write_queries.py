@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Database round trips per request of the generated controllers.
+
+Renders the model, controller, errors and utils files of one model per
+database into a temporary directory, then runs each single-item handler
+(create, get, update, delete, list, and a poll: a get with the
+If-None-Match of an unchanged item) with the generated scripts/query-count.js,
+which runs them against a model stub that counts the queries it is sent
+(npm run bench:queries in a generated project). Reports the queries per
+request and the handler time without any database latency. The check
+fails (exit 1) when a handler sends more queries than QUERY_BUDGET.
+
+    python benchmarks/write_queries.py
+    python benchmarks/write_queries.py --iterations 100000
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'src'))
+
+from modules.controller_generator import ControllerGenerator  # noqa: E402
+from modules.create_errors_files import ErrorClassesGenerator  # noqa: E402
+from modules.model_generator import ModelGenerator  # noqa: E402
+from utils.file_tree import FileTree  # noqa: E402
+from utils.logger import setup_logger  # noqa: E402
+
+# One round trip for every single-item request
+QUERY_BUDGET = {'create': 1, 'get': 1, 'poll': 1, 'update': 1, 'delete': 1, 'list': 1}
+
+
+def render_project(root: str, db_type: str):
+    """The files a controller of the 'BlogPost' model requires (PascalCase, like most model names)"""
+    model_info = {
+        'name': 'BlogPost',
+        'db_type': db_type,
+        'attributes': [{'name': 'title', 'type': 'String', 'required': True, 'unique': False, 'default': None}],
+    }
+    file_tree = FileTree(root)
+    controllers = ControllerGenerator(file_tree)
+    # The generators report every file on stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        ModelGenerator(file_tree).generate_model(model_info)
+        controllers.generate_controller(model_info)
+        controllers.generate_pagination_helper(db_type, 20, 100)
+        controllers.generate_bulk_helper(1000)
+        controllers.generate_conditional_helper()
+        controllers.generate_query_count_script(db_type, [model_info])
+        ErrorClassesGenerator(file_tree).generate_error_classes()
+    file_tree.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=10000, help='Requests per handler (default: 10000)')
+    args = parser.parse_args()
+
+    setup_logger(logging.WARNING)
+    if shutil.which('node') is None:
+        print("node is not installed, skipping")
+        return
+
+    failures = []
+    print(f"{'database':>10}  {'request':>7}  {'status':>6}  {'queries':>7}  {'us/req':>8}  sent")
+    for db_type in ('mongodb', 'postgresql'):
+        workspace = tempfile.mkdtemp(prefix='xpressgen-queries-')
+        try:
+            render_project(workspace, db_type)
+            result = subprocess.run(
+                ['node', os.path.join(workspace, 'scripts', 'query-count.js'), 'blogpost', str(args.iterations)],
+                capture_output=True,
+                text=True,
+                env=dict(os.environ, QUERY_COUNT_JSON='1')
+            )
+        finally:
+            shutil.rmtree(workspace, ignore_errors=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"{db_type} handlers failed:\n{result.stderr}")
+        for request, measured in json.loads(result.stdout.strip().splitlines()[-1])['blogpost'].items():
+            count = len(measured['queries'])
+            print(
+                f"{db_type:>10}  {request:>7}  {measured['status']:>6}  {count:>7}"
+                f"  {measured['microseconds']:>8.2f}  {', '.join(measured['queries'])}"
+            )
+            if count > QUERY_BUDGET[request]:
+                failures.append(f"{db_type} {request}: {count} queries > {QUERY_BUDGET[request]}")
+
+    if failures:
+        print("\nWrite paths need more round trips than budgeted:\n  - " + "\n  - ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,21 @@
-from .project_initializer import ProjectInitializer
+import importlib
 
-__all__ = ["ProjectInitializer"]
\ No newline at end of file
+__version__ = "1.0.0"
+
+# Submodules are loaded on first access to keep the CLI startup fast
+_EXPORTS = {
+    "ProjectInitializer": ".project_initializer",
+    "load_spec": ".project_spec",
+    "validate_spec": ".project_spec",
+    "SpecError": ".project_spec",
+    "load_project_spec": ".project_additions",
+    "load_manifest": ".fleet",
+    "run_fleet": ".fleet",
+}
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = list(_EXPORTS)
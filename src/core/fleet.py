@@ -0,0 +1,225 @@
+import os
+import re
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional
+
+from core.project_spec import SpecError, load_document, validate_spec
+
+SERVICE_NAME = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]*$')
+# Keys of a service entry that are not part of its project spec
+SERVICE_KEYS = ('name', 'spec', 'path')
+
+
+@dataclass
+class FleetService:
+    """One service of a fleet manifest, with its validated project spec"""
+    name: str
+    output_dir: str
+    spec: Dict[str, Any]
+
+
+@dataclass
+class FleetOptions:
+    """Run options shared by every service of a fleet"""
+    command_timeout: Optional[float] = None
+    offline: bool = False
+    use_cache: bool = True
+    cache_dir: Optional[str] = None
+    cache_max_size: int = 2048
+    cache_max_age: int = 30
+    template_dir: Optional[str] = None
+    verbose: bool = False
+
+
+@dataclass
+class ServiceResult:
+    """Outcome of generating one service"""
+    name: str
+    output_dir: str
+    succeeded: bool
+    duration: float
+    error: Optional[str] = None
+    profile: Dict[str, Any] = field(default_factory=dict)
+
+
+def load_manifest(path: str) -> List[FleetService]:
+    """
+    Load and validate a YAML or JSON fleet manifest.
+
+    Example:
+        output_dir: services        # relative to the manifest (default: its directory)
+        defaults:                   # merged into every service spec
+          database: mongodb
+          middleware: [cors]
+        services:
+          - name: users
+            spec: users.yaml        # a project spec file, relative to the manifest
+          - name: orders
+            database: postgresql    # or the spec inline
+            models:
+              - name: Order
+                attributes:
+                  - {name: total, type: Float, required: true}
+
+    Each service is generated into output_dir/<name> unless it sets `path`.
+
+    Returns:
+        The services, in manifest order
+    """
+    raw = load_document(path)
+    if not isinstance(raw, dict):
+        raise SpecError(["the manifest must be a mapping"])
+    base_dir = os.path.dirname(os.path.abspath(path))
+    output_dir = os.path.join(base_dir, str(raw.get('output_dir') or '.'))
+
+    defaults = raw.get('defaults') or {}
+    entries = raw.get('services')
+    errors = []
+    if not isinstance(defaults, dict):
+        errors.append("defaults must be a mapping")
+        defaults = {}
+    if not isinstance(entries, list) or not entries:
+        raise SpecError(errors + ["services must be a non-empty list"])
+
+    services = []
+    seen_names = set()
+    seen_dirs = set()
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            errors.append(f"services[{index}] must be a mapping")
+            continue
+        name = str(entry.get('name') or '')
+        if not SERVICE_NAME.match(name):
+            errors.append(f"services[{index}].name must be a directory-safe name, got '{name}'")
+            continue
+        if name in seen_names:
+            errors.append(f"service '{name}' is defined more than once")
+        seen_names.add(name)
+
+        service_dir = os.path.join(base_dir, entry['path']) if entry.get('path') else os.path.join(output_dir, name)
+        service_dir = os.path.normpath(service_dir)
+        if service_dir in seen_dirs:
+            errors.append(f"service '{name}' shares its output directory with another service")
+        seen_dirs.add(service_dir)
+
+        try:
+            if entry.get('spec'):
+                document = load_document(os.path.join(base_dir, entry['spec']))
+                if not isinstance(document, dict):
+                    raise SpecError([f"{entry['spec']} must be a mapping"])
+                # The spec file's own settings win over the defaults
+                spec = validate_spec(dict(defaults, **document))
+            else:
+                raw_spec = dict(defaults)
+                raw_spec.update({key: value for key, value in entry.items() if key not in SERVICE_KEYS})
+                spec = validate_spec(raw_spec)
+        except SpecError as e:
+            errors.extend(f"{name}: {error}" for error in e.errors)
+            continue
+        services.append(FleetService(name=name, output_dir=service_dir, spec=spec))
+
+    if errors:
+        raise SpecError(errors)
+    return services
+
+
+def generate_service(service: FleetService, options: FleetOptions) -> ServiceResult:
+    """Generate one service (runs in a pool worker)"""
+    import logging
+    from core.project_initializer import ProjectInitializer
+    from utils.logger import setup_logger
+
+    start = time.perf_counter()
+    logger = setup_logger(logging.DEBUG if options.verbose else None, label=service.name)
+    if options.template_dir:
+        from templates.registry import registry
+        registry.set_template_dir(options.template_dir)
+
+    dependency_cache = None
+    if options.use_cache:
+        from utils.dependency_cache import DependencyCache
+        dependency_cache = DependencyCache(
+            logger,
+            cache_dir=options.cache_dir,
+            max_size_mb=options.cache_max_size,
+            max_age_days=options.cache_max_age
+        )
+    initializer = ProjectInitializer(
+        dependency_cache=dependency_cache,
+        offline=options.offline,
+        command_timeout=options.command_timeout,
+        output_dir=service.output_dir
+    )
+    error = None
+    try:
+        initializer.generate(service.spec)
+    except Exception as e:
+        logger.error(f"Setup failed: {e}")
+        error = str(e) or type(e).__name__
+    return ServiceResult(
+        name=service.name,
+        output_dir=service.output_dir,
+        succeeded=error is None,
+        duration=time.perf_counter() - start,
+        error=error,
+        profile=initializer.profiler.report()
+    )
+
+
+def run_fleet(services: List[FleetService], options: FleetOptions, jobs: Optional[int] = None) -> List[ServiceResult]:
+    """
+    Generate every service concurrently in a process pool.
+
+    Each worker has its own ProjectInitializer, output root and event loop; the
+    dependency cache directory is shared, and its per-key lock makes services
+    with the same dependency set install it once.
+
+    Returns:
+        One result per service, in manifest order
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    existing = [service.output_dir for service in services if os.path.exists(service.output_dir)]
+    if existing:
+        raise SpecError([f"output directory already exists: {path}" for path in existing])
+
+    jobs = jobs or min(len(services), os.cpu_count() or 1)
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {service.name: executor.submit(generate_service, service, options) for service in services}
+        for service in services:
+            try:
+                results[service.name] = futures[service.name].result()
+            except Exception as e:
+                # The worker itself died (e.g. killed by the OS)
+                results[service.name] = ServiceResult(
+                    name=service.name,
+                    output_dir=service.output_dir,
+                    succeeded=False,
+                    duration=0.0,
+                    error=f"worker failed: {e}"
+                )
+    return [results[service.name] for service in services]
+
+
+def format_results(results: List[ServiceResult], wall_time: float) -> str:
+    """Human-readable summary table of a fleet run"""
+    width = max([len(result.name) for result in results] + [7])
+    lines = [f"{'service':<{width}}  {'status':<6}  {'time (s)':>8}  detail", '-' * (width + 40)]
+    for result in results:
+        status = 'ok' if result.succeeded else 'FAILED'
+        detail = result.output_dir if result.succeeded else result.error
+        lines.append(f"{result.name:<{width}}  {status:<6}  {result.duration:>8.2f}  {detail}")
+    failed = sum(not result.succeeded for result in results)
+    lines.append('-' * (width + 40))
+    lines.append(f"{len(results) - failed}/{len(results)} services generated in {wall_time:.2f}s")
+    return '\n'.join(lines)
+
+
+def results_report(results: List[ServiceResult], wall_time: float) -> Dict[str, Any]:
+    """Machine-readable report of a fleet run"""
+    return {
+        'wall_time': round(wall_time, 6),
+        'services': [asdict(result) for result in results],
+    }
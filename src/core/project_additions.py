@@ -0,0 +1,50 @@
+import copy
+from typing import Any, Dict, List
+
+from core.project_spec import SpecError, validate_spec
+from utils.generation_lock import GenerationLock
+
+# Building blocks of `xpressgen add ...`: each function returns the project spec
+# with one addition, which is then regenerated incrementally from the lock.
+
+
+def load_project_spec(logger, project_dir: str = '.') -> Dict[str, Any]:
+    """The spec recorded in the project's .xpressgen.lock"""
+    lock = GenerationLock(logger, project_dir)
+    if not lock.exists or not lock.previous.get('spec'):
+        raise SpecError([f"{project_dir} is not an xpressgen project (no usable .xpressgen.lock)"])
+    return validate_spec(copy.deepcopy(lock.previous['spec']))
+
+
+def add_models(spec: Dict[str, Any], models: List[Any]) -> Dict[str, Any]:
+    """Add raw model definitions (as written in a spec file)"""
+    if not spec['database']:
+        raise SpecError(["the project has no database, add one first with `xpressgen add db`"])
+    existing = {model['name'].lower() for model in spec['models']}
+    new_models = validate_spec({'database': spec['database'], 'models': models})['models']
+    errors = [f"model '{model['name']}' already exists" for model in new_models if model['name'].lower() in existing]
+    if errors:
+        raise SpecError(errors)
+    return dict(spec, models=spec['models'] + new_models)
+
+
+def import_models(spec: Dict[str, Any], path: str) -> List[Dict[str, Any]]:
+    """Models of a JSON Schema / OpenAPI / SQL DDL file, typed for the project's database"""
+    from modules.schema_importer import SchemaImporter
+    if not spec['database']:
+        raise SpecError(["the project has no database, add one first with `xpressgen add db`"])
+    return list(SchemaImporter(spec['database']).import_file(path))
+
+
+def add_middleware(spec: Dict[str, Any], packages: List[str]) -> Dict[str, Any]:
+    """Add middleware packages (already present ones are ignored)"""
+    middleware = list(spec['middleware'])
+    middleware.extend(package for package in packages if package not in middleware)
+    return validate_spec(dict(spec, middleware=middleware))
+
+
+def add_database(spec: Dict[str, Any], database: str) -> Dict[str, Any]:
+    """Add a database to a project that has none"""
+    if spec['database']:
+        raise SpecError([f"the project already uses {spec['database']}"])
+    return validate_spec(dict(spec, database=database))
@@ -1,106 +1,460 @@
 import os
 import sys
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from utils.command_runner import CommandRunner
 from utils.logger import setup_logger
-from modules.middleware_selector import MiddlewareSelector
-from modules.database_selector import DatabaseSelector
-from modules.model_generator import ModelGenerator
-from modules.route_generator import RouteGenerator
-from modules.controller_generator import ControllerGenerator
-from modules.create_middleware_files import MiddlewareGenerator
-from modules.create_errors_files import ErrorClassesGenerator
-from templates.index_js import generate_index_js
-from templates.env_template import generate_env_template
-from templates.readme_template import generate_readme_template
+from utils.dependency_plan import DependencyPlan
+from utils.file_tree import FileTree
+from utils.profiler import PhaseProfiler
+
+if TYPE_CHECKING:
+    from utils.dependency_cache import DependencyCache
+
+# Generator modules and templates are imported where they are first used, so
+# only the stages a run actually needs are loaded.
 
 class ProjectInitializer:
-    def __init__(self):
+    def __init__(
+        self,
+        dependency_cache: 'DependencyCache' = None,
+        offline: bool = False,
+        command_timeout: float = None,
+        profile_path: str = None,
+        output_dir: str = '.',
+        schema_import: str = None,
+        cluster: bool = False
+    ):
         self.logger = setup_logger()
-        self.command_runner = CommandRunner(self.logger)
-        self.middleware_selector = MiddlewareSelector(self.logger)
-        self.database_selector = DatabaseSelector(self.command_runner)
-        self.model_generator = ModelGenerator()
-        self.route_generator = RouteGenerator()
-        self.controller_generator = ControllerGenerator()
-        self.create_error_file = ErrorClassesGenerator()
+        # Every npm/git call of the run is timed in command_runner.run_log
+        self.command_runner = CommandRunner(self.logger, default_timeout=command_timeout)
+        self.dependency_cache = dependency_cache
+        self.offline = offline
+        self.dependency_plan = DependencyPlan()
+        # Every generator renders into this tree (paths relative to output_dir); it is written to disk once
+        self.file_tree = FileTree(output_dir)
+        # Phase timings, written as a report when profile_path is set
+        self.profiler = PhaseProfiler(self.command_runner.run_log, self.file_tree)
+        self.profile_path = profile_path
+        # JSON Schema / OpenAPI / SQL DDL file to generate models from
+        self.schema_import = schema_import
+        # Cluster mode for an interactive run (a spec has its own `cluster` option)
+        self.cluster_mode = cluster
         self.CORE_DEPENDENCIES = [
             'express', 
             'dotenv', 
             'express-async-errors', 
             'http-status-codes'
         ]
+        self.DEV_DEPENDENCIES = ['nodemon']
+        # Background npm install, started once the dependency set is known
+        self.install_future = None
+        # Models generated in this run, recorded in the generation lock
+        self.generated_models = []
+        self.package_json_written = False
+
+    @cached_property
+    def generation_lock(self):
+        from core import __version__
+        from templates.registry import registry
+        from utils.generation_lock import GenerationLock, generator_fingerprint
+        return GenerationLock(
+            self.logger,
+            self.file_tree.root,
+            fingerprint=f"{__version__}:{generator_fingerprint()}:{registry.fingerprint()}"
+        )
+
+    @cached_property
+    def async_runner(self):
+        from utils.async_command_runner import AsyncCommandRunner
+        return AsyncCommandRunner(
+            self.logger,
+            run_log=self.command_runner.run_log,
+            default_timeout=self.command_runner.default_timeout
+        )
+
+    @cached_property
+    def middleware_selector(self):
+        from modules.middleware_selector import MiddlewareSelector
+        return MiddlewareSelector(self.logger, self.dependency_plan)
+
+    @cached_property
+    def database_selector(self):
+        from modules.database_selector import DatabaseSelector
+        return DatabaseSelector(self.dependency_plan, self.file_tree)
+
+    @cached_property
+    def model_generator(self):
+        from modules.model_generator import ModelGenerator
+        return ModelGenerator(self.file_tree)
+
+    @cached_property
+    def route_generator(self):
+        from modules.route_generator import RouteGenerator
+        return RouteGenerator(self.file_tree)
+
+    @cached_property
+    def controller_generator(self):
+        from modules.controller_generator import ControllerGenerator
+        return ControllerGenerator(self.file_tree)
+
+    @cached_property
+    def create_error_file(self):
+        from modules.create_errors_files import ErrorClassesGenerator
+        return ErrorClassesGenerator(self.file_tree)
 
-    def setup_project(self):
-        """Main project setup method"""
+    def setup_project(self, spec: dict = None):
+        """
+        Main project setup method
+
+        Args:
+            spec (dict, optional): A validated project spec (see core.project_spec).
+                When given, every decision is taken from it and nothing is prompted.
+        """
+        try:
+            self.generate(spec)
+        except Exception as e:
+            self.logger.error(f"Setup failed: {e}")
+            sys.exit(1)
+
+    def generate(self, spec: dict = None):
+        """Generate the project under the output directory, raising on failure"""
+        phase = self.profiler.phase
         try:
             # Project initialization
-            self.initialize_project()
-            self.create_project_structure()
+            with phase('initialize_project'):
+                self.initialize_project()
+            with phase('create_project_structure'):
+                self.create_project_structure()
             
+            if spec is not None:
+                self.pagination = spec['pagination']
+                self.bulk = spec['bulk']
+                self.cache = spec['cache']
+                self.cluster = spec['cluster']
+                self.pool = spec['pool']
+            else:
+                from core.project_spec import DEFAULT_BULK, DEFAULT_CACHE, DEFAULT_PAGINATION, DEFAULT_POOL
+                self.pagination = dict(DEFAULT_PAGINATION)
+                self.bulk = dict(DEFAULT_BULK)
+                self.cache = dict(DEFAULT_CACHE, store='memory')
+                self.cluster = None
+                self.pool = dict(DEFAULT_POOL)
+            if self.cluster is None and self.cluster_mode:
+                self.cluster = {'workers': 0}
+
             # Database setup can reterun none or mongodb or postgress 
-            database_config = self.database_selector.select_and_setup_database()
+            with phase('database_setup'):
+                if spec is None:
+                    database_config = self.database_selector.select_and_setup_database(self.pool)
+                elif spec['database']:
+                    database_config = self.database_selector.setup_database(spec['database'], self.pool)
+                else:
+                    database_config = None
             self.use_db = database_config is not None
             self.db_type = database_config.lower() if self.use_db else None   
+            if self.db_type == 'postgresql':
+                # Changed models get a new migration, written migrations are kept
+                previous_spec = self.generation_lock.previous.get('spec') or {}
+                self.model_generator.track_migrations(
+                    previous_spec.get('models') or [],
+                    self.generation_lock.previous.get('files', {})
+                )
+            if self.generation_lock.exists:
+                self.logger.info("🔁 Found .xpressgen.lock, regenerating only what changed")
             
             # Middleware setup
-            self.middleware_imports, self.middleware_uses , self.middleware_packeges = self.middleware_selector.full_middleware_setup()
-            
-            # Create index.js file
-            self.create_index_file()
+            with phase('middleware_setup'):
+                if spec is None:
+                    self.middleware_imports, self.middleware_uses , self.middleware_packeges = self.middleware_selector.full_middleware_setup()
+                    self.dev_middleware = self.middleware_selector.dev
+                    if 'cache' in self.middleware_packeges:
+                        self.cache['store'] = self.middleware_selector.select_cache_store('redis' if self.cluster else 'memory')
+                else:
+                    self.middleware_imports, self.middleware_uses , self.middleware_packeges = self.middleware_selector.setup_middleware(
+                        spec['middleware'],
+                        dev=spec['dev_middleware']
+                    )
+                    self.dev_middleware = spec['dev_middleware']
+            # GET routes read through the response cache, writes invalidate it
+            self.response_cache = 'cache' in self.middleware_packeges
+            self.controller_generator.response_cache = self.response_cache
+            self.route_generator.response_cache = self.response_cache
+            if self.response_cache and self.cache['store'] == 'redis':
+                self.dependency_plan.add(['redis'])
+            elif self.response_cache and self.cluster:
+                self.logger.warning(
+                    "⚠️ Cluster workers each keep their own in-memory response cache and a write only invalidates "
+                    "the worker that handled it: the others serve stale responses until CACHE_TTL. Use the redis store."
+                )
+
+            # The dependency set is complete: install it while the rest is prompted and rendered
+            with phase('start_dependency_install'):
+                self.start_dependency_install()
             
-            # # Model, route, and controller generation
-            self.interactive_model_generation()
+            # # Model, route, and controller generation (one phase per generated file)
+            if spec is not None:
+                self.spec_model_generation(spec['models'])
+            elif not self.schema_import:
+                self.interactive_model_generation()
+            if self.schema_import:
+                with phase('import_models'):
+                    self.imported_model_generation(self.schema_import)
+
+            # List, read and bulk handlers share utils/pagination.js, utils/conditional.js and utils/bulk.js;
+            # scripts/query-count.js (npm run bench:queries) measures their round trips per request
+            if self.generated_models:
+                with phase('pagination_helper'):
+                    self.render_unit('pagination', [self.db_type, self.pagination], self.create_pagination_helper)
+                with phase('conditional_helper'):
+                    self.render_unit('conditional', [], self.controller_generator.generate_conditional_helper)
+                with phase('bulk_helper'):
+                    self.render_unit('bulk', [self.bulk], lambda: self.controller_generator.generate_bulk_helper(self.bulk['max_items']))
+                with phase('query_count_script'):
+                    self.render_unit('query_count', [self.db_type, [model_info['name'] for model_info in self.generated_models]], lambda: self.controller_generator.generate_query_count_script(
+                        self.db_type, self.generated_models
+                    ))
+            if any(model_info.get('export') for model_info in self.generated_models):
+                with phase('ndjson_helper'):
+                    self.render_unit('ndjson', [], self.controller_generator.generate_ndjson_helper)
+
+            # Create index.js file once every route is known
+            with phase('index_file'):
+                self.render_unit('index', [
+                    self.middleware_imports, self.middleware_uses, self.use_db, self.db_type, self.route_generator.routes()
+                ], self.create_index_file)
+            if self.cluster:
+                with phase('cluster_primary'):
+                    self.render_unit('cluster', [], self.create_cluster_primary)
             
             
             # # Create dotenv files
-            self.create_env_file()
+            with phase('env_file'):
+                self.render_unit('env', [
+                    self.use_db, self.db_type, self.response_cache and self.cache, self.cluster, self.pool
+                ], self.create_env_file)
 
 
             # # Create middleware files
-            self.create_middleware_files()
+            with phase('middleware_files'):
+                self.render_unit('middleware_files', [], self.create_middleware_files)
+            if self.response_cache:
+                with phase('cache_middleware'):
+                    self.render_unit('cache', [self.cache], self.create_cache_middleware)
             
             # Create a error file 
-            self.create_error_file.generate_error_classes()
+            with phase('error_classes'):
+                self.render_unit('error_classes', [], self.create_error_file.generate_error_classes)
             
             
+            with phase('readme'):
+                self.render_unit('readme', [], self.create_readme)
+
+            # Imported models are recorded like spec models, so `xpressgen add` keeps them (and --cluster like `cluster`)
+            self.generation_lock.spec = self.stored_spec(dict(spec or {
+                'database': self.db_type,
+                'middleware': self.middleware_packeges,
+                'dev_middleware': self.dev_middleware,
+                'pagination': self.pagination,
+                'bulk': self.bulk,
+                'cache': self.cache,
+                'pool': self.pool,
+            }, models=self.generated_models, cluster=self.cluster))
+
+            # Migrations of earlier runs stay, they may have run somewhere already
+            self.generation_lock.keep('migrations/')
+
+            # Write every generated file at once
+            with phase('write_project_files'):
+                self.write_project_files()
+
+            # The install must be done before the first commit
+            with phase('wait_for_dependencies'):
+                self.wait_for_dependencies()
+
+            with phase('generation_lock'):
+                self.write_generation_lock()
+
             # # Git initialization
-            self.create_readme() 
-            self.initialize_git()
+            with phase('git'):
+                self.initialize_git()
 
             self.logger.info("🎉 Express.js project setup completed successfully!")
 
-        except Exception as e:
-            self.logger.error(f"Setup failed: {e}")
-            sys.exit(1)
+        finally:
+            # Stops a still running install when the setup failed
+            self.async_runner.close()
+            for record in self.command_runner.run_log.summary():
+                self.logger.debug(f"Command log: {record}")
+            if self.profile_path:
+                self.write_profile()
+
+    def write_profile(self):
+        """Write the JSON phase report and log its table"""
+        try:
+            report = self.profiler.write(self.profile_path)
+            self.logger.info(f"⏱️ Profile written to {self.profile_path}\n{self.profiler.format_report(report)}")
+        except OSError as e:
+            self.logger.warning(f"Failed to write profile: {e}")
 
     def initialize_project(self):
         """
-        Initialize npm project and install core dependencies 
-            1- npm init -y
-            2- install core dependencies
-            3- install dev dependencies
+        Start the npm project's dependency plan
+            1- core dependencies
+            2- dev dependencies
+        Later stages (database, middleware) add to the same plan, which is
+        installed once by start_dependency_install.
         """
         self.logger.info("🚀 Initializing Express.js Project Setup")
-        
-        # Initialize npm project
-        self.command_runner.run_command(
-            ['npm', 'init', '-y'], 
-            "Failed to initialize npm project"
-        )
-        # Install core dependencies
-        for dep in self.CORE_DEPENDENCIES:
-            self.command_runner.run_command(
-                ['npm', 'install', dep], 
-                f"Failed to install {dep}"
-            )
-        
-        
-        # Install dev dependencies
-        self.command_runner.run_command(
-            ['npm', 'install', 'nodemon', '--save-dev'], 
-            "Failed to install nodemon"
-        )
+        self.dependency_plan.add(self.CORE_DEPENDENCIES)
+        self.dependency_plan.add(self.DEV_DEPENDENCIES, dev=True)
+
+    def create_package_json(self) -> bool:
+        """
+        Create package.json from the dependency plan, on disk right away since npm reads it
+
+        Returns:
+            Whether package.json was written (False when it is unchanged or edited by hand)
+        """
+        project_name = os.path.basename(os.path.abspath(self.file_tree.root))
+        package_tree = FileTree(self.file_tree.root)
+        from utils.dependency_plan import DEFAULT_SCRIPTS, MIGRATION_SCRIPTS, QUERY_COUNT_SCRIPTS
+        scripts = dict(DEFAULT_SCRIPTS)
+        if self.cluster:
+            # Production runs the cluster primary, development a single nodemon process
+            scripts['start'] = 'node server.js'
+        if self.use_db:
+            scripts.update(QUERY_COUNT_SCRIPTS)
+        if self.db_type == 'postgresql':
+            scripts.update(MIGRATION_SCRIPTS)
+        package_tree.write('package.json', self.dependency_plan.render_package_json(project_name, scripts))
+        if not self.generation_lock.sync(package_tree):
+            return False
+        package_tree.flush()
+        self.logger.info("✅ package.json file created successfully")
+        return True
+
+    def stored_spec(self, spec: dict) -> dict:
+        """The spec to record in .xpressgen.lock, normalized so that `xpressgen add` can load it again"""
+        from core.project_spec import SpecError, normalize_stored_spec
+        try:
+            return normalize_stored_spec(spec)
+        except SpecError as e:
+            self.logger.warning(f"⚠️ The project spec cannot be loaded again, `xpressgen add` will not work here: {e}")
+            return spec
+
+    def render_unit(self, unit: str, inputs, render):
+        """
+        Run a render step, unless the generation lock shows it already ran with
+        the same inputs (and the same generator and templates)
+
+        Returns:
+            Whether the step was rendered
+        """
+        input_hash = self.generation_lock.input_hash(inputs)
+        if self.generation_lock.is_fresh(unit, input_hash):
+            self.generation_lock.reuse(unit)
+            return False
+        with self.file_tree.recording() as paths:
+            render()
+        self.generation_lock.record(unit, input_hash, paths)
+        return True
+
+    def write_project_files(self):
+        """Flush the changed files of the rendered project to disk in one parallel, atomic step"""
+        try:
+            self.generation_lock.sync(self.file_tree)
+            written = self.file_tree.flush()
+            self.generation_lock.remove_stale()
+            self.logger.info(f"✅ {len(written)} project files written")
+        except OSError as e:
+            self.logger.error(f"Failed to write project files, nothing was written: {e}")
+            raise
+
+    def write_generation_lock(self):
+        """Write .xpressgen.lock once npm is done with package.json"""
+        from core import __version__
+        if self.install_future is not None and self.package_json_written:
+            # npm may rewrite package.json in its own format
+            self.generation_lock.refresh('package.json')
+        self.generation_lock.write(__version__)
+
+    def start_dependency_install(self):
+        """Write package.json and start installing the dependency plan in the background"""
+        self.package_json_written = self.create_package_json()
+        if not self.package_json_written and os.path.isdir(os.path.join(self.file_tree.root, 'node_modules')):
+            self.logger.info("📦 Dependencies unchanged, skipping install")
+            return
+        self.install_future = self.async_runner.submit(self.install_dependencies())
+
+    def wait_for_dependencies(self):
+        """Block until the background install is done, re-raising its error"""
+        if self.install_future is None:
+            return
+        if not self.install_future.done():
+            self.logger.info("⏳ Waiting for dependency installation to finish")
+        self.install_future.result()
+
+    async def install_dependencies(self):
+        """Install the dependency plan with a single npm install (or from the cache)"""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        project_dir = self.file_tree.root
+        if os.path.isdir(os.path.join(project_dir, 'node_modules')):
+            # Existing project: the cache holds whole trees, only add what is missing
+            await self.install_missing(project_dir)
+            return
+        if not self.dependency_cache:
+            await self.run_install(project_dir)
+            return
+
+        cache_key = self.dependency_cache.key(self.dependency_plan)
+        # A shared lock lets concurrent runs restore the same entry while eviction waits for them
+        shared_lock = self.dependency_cache.lock(cache_key, shared=True)
+        await loop.run_in_executor(None, shared_lock.acquire)
+        try:
+            if await loop.run_in_executor(None, self.dependency_cache.restore, cache_key, project_dir):
+                return
+        finally:
+            shared_lock.release()
+        # Another run may be installing the same set right now: wait for it and reuse its result
+        lock = self.dependency_cache.lock(cache_key)
+        await loop.run_in_executor(None, lock.acquire)
+        try:
+            if await loop.run_in_executor(None, self.dependency_cache.restore, cache_key, project_dir):
+                return
+            await self.run_install(project_dir)
+            await loop.run_in_executor(None, self.store_dependencies, cache_key)
+        finally:
+            lock.release()
+
+    async def run_install(self, project_dir: str):
+        """npm install / npm ci of the dependency plan"""
+        install_cmd = self.dependency_plan.install_command(project_dir)
+        if self.offline:
+            # Cache miss on an air-gapped host: only npm's own cache can help now
+            install_cmd.append('--offline')
+        self.logger.info(f"📦 Installing {len(self.dependency_plan.packages())} packages in the background")
+        await self.async_runner.run_command_async(install_cmd, "Failed to install dependencies", cwd=project_dir)
+
+    async def install_missing(self, project_dir: str):
+        """npm install of only the planned packages missing from node_modules"""
+        missing = self.dependency_plan.missing(project_dir)
+        if missing.is_empty():
+            self.logger.info("📦 Every dependency is already installed")
+            return
+        self.logger.info(f"📦 Installing missing packages: {', '.join(missing.packages())}")
+        for command in missing.add_commands():
+            if self.offline:
+                command.append('--offline')
+            await self.async_runner.run_command_async(command, "Failed to install dependencies", cwd=project_dir)
+
+    def store_dependencies(self, cache_key: str):
+        """Snapshot the installed dependencies into the cache and trim it"""
+        self.dependency_cache.store(cache_key, self.file_tree.root)
+        self.dependency_cache.evict()
 
     def create_project_structure(self):
         """Create basic project directories"""
@@ -108,74 +462,139 @@ class ProjectInitializer:
             'controllers', 'models', 'routes', 'middleware', 'db'
         ]
         for directory in directories:
-            os.makedirs(directory, exist_ok=True)
+            self.file_tree.makedirs(directory)
 
     def create_env_file(self):
         """Create .env file with default configurations"""
+        from templates.env_template import generate_env_template
 
-        env_content = generate_env_template(use_db=self.use_db , db_type=self.db_type)
-        try:
-            with open('.env', 'w') as file:
-                file.write(env_content)
-            self.logger.info("✅ .env file created successfully")
-        except IOError as e:
-            self.logger.error(f"Failed to create .env file: {e}")
-            sys.exit(1)
+        env_content = generate_env_template(
+            use_db=self.use_db,
+            db_type=self.db_type,
+            cache=self.cache if self.response_cache else None,
+            web_concurrency=self.cluster['workers'] if self.cluster else None,
+            pool=self.pool
+        )
+        self.file_tree.write('.env', env_content)
+        self.logger.info("✅ .env file created successfully")
 
     def create_index_file(self):
-        """Create index.js with dynamic configuration"""
-        index_content = generate_index_js(middleware_imports=self.middleware_imports ,middleware_uses=self.middleware_uses ,use_db=self.use_db , db_type=self.db_type)
-        try:
-            with open('index.js', 'w') as file:
-                file.write(index_content)
-            self.logger.info("✅ index.js file created successfully")
-        except IOError as e:
-            self.logger.error(f"Failed to create index.js: {e}")
-            sys.exit(1)
+        """Create index.js (and routes/index.js) with dynamic configuration"""
+        from templates.index_js import generate_index_js
+        routes = self.route_generator.routes()
+        if routes:
+            self.route_generator.generate_routes_index()
+        index_content = generate_index_js(
+            middleware_imports=self.middleware_imports,
+            middleware_uses=self.middleware_uses,
+            use_db=self.use_db,
+            db_type=self.db_type,
+            routes=routes
+        )
+        self.file_tree.write('index.js', index_content)
+        self.logger.info("✅ index.js file created successfully")
+
+    def create_cluster_primary(self):
+        """Create server.js, the cluster primary running index.js in one worker per CPU"""
+        from templates.registry import render
+        self.file_tree.write('server.js', render('server.js'))
+        self.logger.info("✅ server.js (cluster mode) created successfully")
+
+    def create_pagination_helper(self):
+        self.controller_generator.generate_pagination_helper(
+            self.db_type,
+            self.pagination['page_size'],
+            self.pagination['max_page_size']
+        )
 
     def create_middleware_files(self):
         """Create Not Found and Error Handler middleware files"""
-        middleware_genrator = MiddlewareGenerator()
+        from modules.create_middleware_files import MiddlewareGenerator
+        middleware_genrator = MiddlewareGenerator(self.file_tree)
         middleware_genrator.create_middleware_files()
 
+    def create_cache_middleware(self):
+        from modules.create_middleware_files import MiddlewareGenerator
+        MiddlewareGenerator(self.file_tree).create_cache_middleware(self.cache)
+
     def interactive_model_generation(self):
         """Interactive model, route, and controller generation"""
         if not self.use_db:
             self.logger.info("Skipping model, route, and controller generation")
             return
         while True:
-            model_info = self.model_generator.create_schema(db_type=self.db_type)
+            with self.profiler.phase('model_prompts'):
+                model_info = self.model_generator.create_schema(db_type=self.db_type)
             if not model_info:
                 break
-            print(model_info)
-            # Generate model, controller, and routes
+            self.generate_resource(model_info)
+
+    def spec_model_generation(self, models: list):
+        """Model, route, and controller generation from spec models"""
+        if not self.use_db:
+            self.logger.info("Skipping model, route, and controller generation")
+            return
+        for model_info in models:
+            self.generate_resource(model_info)
+
+    def imported_model_generation(self, path: str):
+        """Model, route, and controller generation for every entity of a schema file, as it is read"""
+        from modules.schema_importer import SchemaImporter, SchemaImportError
+        if not self.use_db:
+            raise SchemaImportError("Importing models requires a database")
+        existing = {model_info['name'].lower() for model_info in self.generated_models}
+        count = 0
+        for model_info in SchemaImporter(self.db_type).import_file(path):
+            if model_info['name'].lower() in existing:
+                raise SchemaImportError(f"{path} defines the model '{model_info['name']}', which already exists")
+            self.generate_resource(model_info)
+            count += 1
+        self.logger.info(f"✅ {count} models imported from {path}")
+
+    def generate_resource(self, model_info: dict):
+        """Generate the model, controller and routes of one model and register its routes"""
+        self.generated_models.append(model_info)
+        self.render_unit(
+            f"resource:{model_info['name']}",
+            [model_info, self.response_cache],
+            lambda: self.render_resource(model_info)
+        )
+
+        # Register the router, index files are rendered once at the end
+        self.route_generator.register_routes(model_info)
+
+    def render_resource(self, model_info: dict):
+        """Render the model, controller and routes files of one model"""
+        name = model_info['name']
+        with self.profiler.phase(f"model:{name}"):
             model_file = self.model_generator.generate_model(model_info)
+        with self.profiler.phase(f"controller:{name}"):
             controller_file = self.controller_generator.generate_controller(model_info)
+        with self.profiler.phase(f"routes:{name}"):
             route_file = self.route_generator.generate_routes(model_info)
 
-            # Update index.js with new routes
-            self.route_generator.update_index_routes(
-                model_info['name'], 
-                model_info['name'].lower()
-            )
-
     def create_readme(self):
         """Create a comprehensive README.md for the project"""
+        from templates.readme_template import generate_readme_template
         readme_content = generate_readme_template()
         
-        with open('README.md', 'w') as f:
-            f.write(readme_content)
+        self.file_tree.write('README.md', readme_content)
         
         self.logger.info("✅ README.md created successfully")
 
     def initialize_git(self):
         """Initialize git repository"""
+        project_dir = self.file_tree.root
+        if os.path.isdir(os.path.join(project_dir, '.git')):
+            self.logger.info("Existing git repository left as is, review and commit the changes yourself")
+            return
         try:
-            self.command_runner.run_command(['git', 'init'], "Failed to initialize git")
-            self.command_runner.run_command(['git', 'add', '.'], "Failed to add files to git")
+            self.command_runner.run_command(['git', 'init'], "Failed to initialize git", cwd=project_dir)
+            self.command_runner.run_command(['git', 'add', '.'], "Failed to add files to git", cwd=project_dir)
             self.command_runner.run_command(
                 ['git', 'commit', '-m', 'Initial project setup'], 
-                "Failed to commit initial setup"
+                "Failed to commit initial setup",
+                cwd=project_dir
             )
         except Exception as e:
             self.logger.warning(f"Git initialization failed: {e}")
\ No newline at end of file
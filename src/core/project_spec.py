@@ -0,0 +1,335 @@
+import json
+import os
+import re
+from typing import Any, Dict, List
+
+from modules.database_selector import DatabaseSelector
+from modules.model_generator import ModelGenerator
+from modules.middleware_selector import MiddlewareSelector
+
+DATABASES = ['mongodb', 'postgresql']
+IDENTIFIER = re.compile(r'^[A-Za-z_$][A-Za-z0-9_$]*$')
+# Page sizes of the generated list endpoints (PAGE_SIZE / MAX_PAGE_SIZE override them at runtime)
+DEFAULT_PAGINATION = {'page_size': 20, 'max_page_size': 100}
+# Items per bulk request (BULK_MAX_ITEMS overrides it at runtime)
+DEFAULT_BULK = {'max_items': 1000}
+# Response cache of the `cache` middleware (CACHE_* environment variables override it)
+CACHE_STORES = ['memory', 'redis']
+DEFAULT_CACHE = {'ttl': 60, 'max_entries': 10000, 'max_size_mb': 64}
+# Production connection pool of db/connect.js (DB_POOL_* environment variables override it)
+DEFAULT_POOL = dict(DatabaseSelector.POOL_DEFAULTS, auto_index=None)
+
+
+class SpecError(ValueError):
+    """Raised when a project spec file cannot be loaded or is invalid"""
+
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        super().__init__("Invalid project spec:\n  - " + "\n  - ".join(errors))
+
+
+def load_spec(path: str) -> Dict[str, Any]:
+    """
+    Load and validate a YAML or JSON project spec.
+
+    Example:
+        database: mongodb          # mongodb, postgresql or none
+        middleware: [cors, helmet]
+        dev_middleware: false
+        pagination: {page_size: 20, max_page_size: 100}
+        bulk: {max_items: 1000}
+        cache: {store: memory, ttl: 60}   # with the cache middleware
+        cluster: {workers: auto}  # or true: npm start runs a cluster primary (server.js)
+        models:
+          - name: User
+            export: true             # GET /users/export streams every user as NDJSON
+            attributes:
+              - {name: email, type: String, required: true, unique: true}
+              - {name: country, type: String, indexed: true}
+              - {name: referrer, type: String, indexed: true, sparse: true}
+            indexes:                 # compound indexes, '-' for descending
+              - {fields: [country, -createdAt]}
+
+    Returns:
+        The normalized spec
+    """
+    return validate_spec(load_document(path))
+
+
+def load_document(path: str) -> Any:
+    """Parse a YAML (.yaml/.yml) or JSON file, reporting problems as SpecError"""
+    try:
+        with open(path, 'r') as file:
+            text = file.read()
+    except OSError as e:
+        raise SpecError([f"cannot read {path}: {e}"])
+
+    if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise SpecError(["PyYAML is required for YAML specs (pip install pyyaml)"])
+        try:
+            raw = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise SpecError([f"{path} is not valid YAML: {e}"])
+    else:
+        try:
+            raw = json.loads(text)
+        except ValueError as e:
+            raise SpecError([f"{path} is not valid JSON: {e}"])
+    return raw
+
+
+def validate_spec(raw: Any) -> Dict[str, Any]:
+    """Validate a raw spec document, reporting every problem at once"""
+    if not isinstance(raw, dict):
+        raise SpecError(["the spec must be a mapping"])
+    errors = []
+
+    database = raw.get('database') or 'none'
+    database = str(database).lower()
+    if database == 'none':
+        database = None
+    elif database not in DATABASES:
+        errors.append(f"database must be one of {DATABASES + ['none']}, got '{raw.get('database')}'")
+        database = None
+
+    middleware = raw.get('middleware') or []
+    known_middleware = MiddlewareSelector.available_packages()
+    if not isinstance(middleware, list):
+        errors.append("middleware must be a list of package names")
+        middleware = []
+    for package in middleware:
+        if package not in known_middleware:
+            errors.append(f"unknown middleware '{package}' (choose from {', '.join(known_middleware)})")
+
+    models = raw.get('models') or []
+    if not isinstance(models, list):
+        errors.append("models must be a list")
+        models = []
+    if models and database is None:
+        errors.append("models require a database")
+
+    normalized_models = []
+    seen_models = set()
+    for index, model in enumerate(models):
+        model_info = _validate_model(model, index, database or 'mongodb', errors)
+        if model_info is None:
+            continue
+        if model_info['name'].lower() in seen_models:
+            errors.append(f"model '{model_info['name']}' is defined more than once")
+        seen_models.add(model_info['name'].lower())
+        normalized_models.append(model_info)
+
+    pagination = _validate_limits('pagination', raw.get('pagination'), DEFAULT_PAGINATION, errors)
+    if pagination['page_size'] > pagination['max_page_size']:
+        errors.append("pagination.page_size cannot be larger than pagination.max_page_size")
+    bulk = _validate_limits('bulk', raw.get('bulk'), DEFAULT_BULK, errors)
+    cluster = _validate_cluster(raw.get('cluster'), errors)
+    cache = _validate_limits('cache', raw.get('cache'), DEFAULT_CACHE, errors)
+    # Cluster workers only share a cache (and its invalidations) through redis
+    default_store = 'redis' if cluster else 'memory'
+    cache['store'] = str(raw['cache'].get('store', default_store)) if isinstance(raw.get('cache'), dict) else default_store
+    if cache['store'] not in CACHE_STORES:
+        errors.append(f"cache.store must be one of {CACHE_STORES}, got '{cache['store']}'")
+    pool = _validate_pool(raw.get('pool'), errors)
+
+    if errors:
+        raise SpecError(errors)
+
+    return {
+        'database': database,
+        'middleware': middleware,
+        'dev_middleware': bool(raw.get('dev_middleware', False)),
+        'pagination': pagination,
+        'bulk': bulk,
+        'cache': cache,
+        'cluster': cluster,
+        'pool': pool,
+        'models': normalized_models,
+    }
+
+
+def normalize_stored_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The spec as it is recorded in .xpressgen.lock. `xpressgen add` validates it
+    again, so validating the normalized spec must give it back unchanged.
+    """
+    normalized = validate_spec(spec)
+    if validate_spec(json.loads(json.dumps(normalized))) != normalized:
+        raise SpecError(["the normalized spec does not validate to itself"])
+    return normalized
+
+
+def _validate_cluster(cluster: Any, errors: List[str]):
+    """None when cluster mode is off, else {'workers': N} with 0 for one per CPU"""
+    if cluster is None or cluster is False:
+        return None
+    if cluster is True:
+        return {'workers': 0}
+    if not isinstance(cluster, dict):
+        errors.append("cluster must be true, false or a mapping")
+        return None
+    workers = cluster.get('workers', 'auto')
+    if workers == 'auto':
+        workers = 0
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 0:
+        errors.append(f"cluster.workers must be 'auto' or a number of processes, got '{workers}'")
+        workers = 0
+    return {'workers': workers}
+
+
+def _validate_pool(pool: Any, errors: List[str]) -> Dict[str, Any]:
+    """Connection pool sizes and timeouts, with auto_index None for 'on outside production'"""
+    limits = {key: value for key, value in pool.items() if key != 'auto_index'} if isinstance(pool, dict) else pool
+    normalized = _validate_limits('pool', limits, DatabaseSelector.POOL_DEFAULTS, errors, minimum=0)
+    if normalized['max'] < 1:
+        errors.append("pool.max must be a positive integer")
+    if normalized['min'] > normalized['max']:
+        errors.append("pool.min cannot be larger than pool.max")
+    auto_index = pool.get('auto_index') if isinstance(pool, dict) else None
+    # None is the normalized 'auto', as recorded in .xpressgen.lock
+    if auto_index == 'auto':
+        auto_index = None
+    elif auto_index is not None and not isinstance(auto_index, bool):
+        errors.append(f"pool.auto_index must be true, false or 'auto', got '{auto_index}'")
+        auto_index = None
+    normalized['auto_index'] = auto_index
+    return normalized
+
+
+def _validate_limits(
+    section: str, limits: Any, defaults: Dict[str, int], errors: List[str], minimum: int = 1
+) -> Dict[str, int]:
+    """The integers (positive by default) of a settings mapping, missing keys taking their default"""
+    if limits is None:
+        return dict(defaults)
+    if not isinstance(limits, dict):
+        errors.append(f"{section} must be a mapping")
+        return dict(defaults)
+    normalized = {}
+    for key, default in defaults.items():
+        value = limits.get(key, default)
+        if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+            kind = 'a positive integer' if minimum == 1 else f"an integer of at least {minimum}"
+            errors.append(f"{section}.{key} must be {kind}, got '{value}'")
+            value = default
+        normalized[key] = value
+    return normalized
+
+
+def _validate_model(model: Any, index: int, db_type: str, errors: List[str]):
+    where = f"models[{index}]"
+    if not isinstance(model, dict):
+        errors.append(f"{where} must be a mapping")
+        return None
+
+    name = str(model.get('name') or '').strip()
+    if not IDENTIFIER.match(name):
+        errors.append(f"{where}.name must be a valid identifier, got '{name}'")
+        return None
+    # Ensure the first letter of model name is uppercase
+    name = name[0].upper() + name[1:]
+
+    type_choices = ModelGenerator.MONGOOSE_TYPES if db_type == 'mongodb' else ModelGenerator.POSTGRES_TYPES
+    attributes = []
+    seen_attributes = set()
+    for attr_index, attr in enumerate(model.get('attributes') or []):
+        attr_where = f"{name}.attributes[{attr_index}]"
+        if not isinstance(attr, dict):
+            errors.append(f"{attr_where} must be a mapping")
+            continue
+        attr_name = str(attr.get('name') or '')
+        if not IDENTIFIER.match(attr_name):
+            errors.append(f"{attr_where}.name must be a valid identifier, got '{attr_name}'")
+            continue
+        if attr_name in seen_attributes:
+            errors.append(f"{name}.{attr_name} is defined more than once")
+        seen_attributes.add(attr_name)
+        attr_type = attr.get('type', 'String')
+        if attr_type not in type_choices:
+            errors.append(f"{name}.{attr_name} has type '{attr_type}', expected one of {', '.join(type_choices)}")
+        # Defaults are kept as text, like the interactive prompt returns them
+        default = attr.get('default')
+        if isinstance(default, bool):
+            default = str(default).lower()
+        elif default is not None:
+            default = str(default)
+        if default is not None and attr_type in type_choices:
+            try:
+                ModelGenerator.default_literal(attr_type, default, db_type)
+            except ValueError as e:
+                errors.append(f"{name}.{attr_name} has an invalid {attr_type} default: {e}")
+        unique = bool(attr.get('unique', False))
+        indexed = bool(attr.get('indexed', False))
+        sparse = bool(attr.get('sparse', False))
+        if sparse and not (unique or indexed):
+            errors.append(f"{name}.{attr_name} is sparse but neither indexed nor unique")
+        attribute = {
+            'name': attr_name,
+            'type': attr_type,
+            'required': bool(attr.get('required', False)),
+            'unique': unique,
+            'indexed': indexed,
+            'sparse': sparse,
+            'default': default
+        }
+        expires = attr.get('expires')
+        if expires is not None:
+            # TTL index: the document is removed `expires` seconds after this date
+            if db_type != 'mongodb':
+                errors.append(f"{name}.{attr_name}: expires (TTL index) requires mongodb")
+            elif attr_type != 'Date':
+                errors.append(f"{name}.{attr_name}: expires requires a Date attribute")
+            elif isinstance(expires, bool) or not isinstance(expires, int) or expires < 0:
+                errors.append(f"{name}.{attr_name}.expires must be a number of seconds, got '{expires}'")
+            else:
+                attribute['expires'] = expires
+        attributes.append(attribute)
+
+    indexes = _validate_indexes(model.get('indexes'), name, seen_attributes, errors)
+
+    return {
+        'name': name,
+        'attributes': attributes,
+        'indexes': indexes,
+        'export': bool(model.get('export', False)),
+        'db_type': db_type
+    }
+
+
+def _validate_indexes(indexes: Any, model_name: str, attribute_names, errors: List[str]) -> List[Dict[str, Any]]:
+    """Compound indexes of a model, as {'fields': [[name, 1 | -1], ...], 'unique', 'sparse'}"""
+    if indexes is None:
+        return []
+    if not isinstance(indexes, list):
+        errors.append(f"{model_name}.indexes must be a list")
+        return []
+    known_fields = set(attribute_names) | set(ModelGenerator.TIMESTAMP_FIELDS)
+    normalized = []
+    for index_number, index in enumerate(indexes):
+        where = f"{model_name}.indexes[{index_number}]"
+        if not isinstance(index, dict) or not isinstance(index.get('fields'), list) or not index['fields']:
+            errors.append(f"{where} must be a mapping with a non-empty fields list")
+            continue
+        fields = []
+        for field in index['fields']:
+            if isinstance(field, (list, tuple)) and len(field) == 2 and field[1] in (1, -1):
+                # The normalized [name, 1 | -1] pair, as recorded in .xpressgen.lock
+                field, order = str(field[0]), field[1]
+            else:
+                field = str(field)
+                order = -1 if field.startswith('-') else 1
+                field = field.lstrip('-')
+            if field not in known_fields:
+                errors.append(f"{where} refers to unknown field '{field}'")
+            fields.append([field, order])
+        if len({field for field, _ in fields}) != len(fields):
+            errors.append(f"{where} lists a field more than once")
+        normalized.append({
+            'fields': fields,
+            'unique': bool(index.get('unique', False)),
+            'sparse': bool(index.get('sparse', False)),
+        })
+    return normalized
@@ -1,19 +1,298 @@
 #!/usr/bin/env python3
+import argparse
+import os
 import sys
-from core.project_initializer import ProjectInitializer
+
+# Keep module-level imports to the standard library: everything else is
+# imported in main() once the arguments are known, so --help and --version
+# return without loading the generator.
+
+def add_run_options(parser: argparse.ArgumentParser, defaults: bool = True):
+    """
+    Options shared by single-project and fleet runs.
+
+    Subcommands add them again with defaults=False, so an option given before
+    the subcommand is not reset by the subcommand's default.
+    """
+    def default(value):
+        return value if defaults else argparse.SUPPRESS
+
+    parser.add_argument(
+        "--command-timeout",
+        type=float,
+        default=default(900),
+        metavar="SECONDS",
+        help="Kill any npm/git command running longer than this (default: 900, 0 disables)"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="xpressgen-profile.json",
+        default=default(None),
+        metavar="FILE",
+        help="Time every generation phase and write a JSON report (default: xpressgen-profile.json)"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        default=default(False),
+        help="Stream npm/git output to the log"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        default=default(False),
+        help="Never touch the network: use the dependency cache, then npm's own cache"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=default(False),
+        help="Always run npm install instead of reusing cached node_modules"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=default(None),
+        help="Dependency cache location (default: $XPRESSGEN_CACHE_DIR or ~/.cache/xpressgen/deps)"
+    )
+    parser.add_argument(
+        "--templates",
+        metavar="DIR",
+        default=default(None),
+        help="Directory of template overrides, searched before the built-in templates"
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        type=int,
+        default=default(2048),
+        help="Evict cached dependency sets above this total size in MB (default: 2048)"
+    )
+    parser.add_argument(
+        "--cache-max-age",
+        type=int,
+        default=default(30),
+        help="Evict cached dependency sets unused for this many days (default: 30)"
+    )
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line options of the generator"""
+    from core import __version__
+
+    parser = argparse.ArgumentParser(
+        prog="xpressgen",
+        description="Generate an Express.js project"
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}"
+    )
+    parser.add_argument(
+        "--spec",
+        metavar="FILE",
+        help="Generate the project from a YAML/JSON spec file without any prompt"
+    )
+    parser.add_argument(
+        "--import",
+        dest="schema_import",
+        metavar="FILE",
+        help="Generate models from a JSON Schema / OpenAPI (.json/.yaml) or PostgreSQL DDL (.sql) file"
+    )
+    parser.add_argument(
+        "--cluster",
+        action="store_true",
+        help="Run the generated server on every CPU core through a server.js cluster primary (like `cluster: true` in a spec)"
+    )
+    add_run_options(parser)
+
+    subcommands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    fleet = subcommands.add_parser(
+        "fleet",
+        help="Generate several services from a manifest in parallel",
+        description="Generate every service of a YAML/JSON fleet manifest in a process pool"
+    )
+    fleet.add_argument("manifest", help="Fleet manifest file")
+    fleet.add_argument(
+        "-j", "--jobs",
+        type=int,
+        metavar="N",
+        help="Services generated at once (default: number of CPUs)"
+    )
+    add_run_options(fleet, defaults=False)
+
+    add = subcommands.add_parser(
+        "add",
+        help="Add models, middleware or a database to an existing project",
+        description="Add to the project in the current directory, regenerating only what changes"
+    )
+    additions = add.add_subparsers(dest="addition", metavar="WHAT", required=True)
+    add_model = additions.add_parser("model", help="Add models (prompted, or from a spec file)")
+    add_model.add_argument(
+        "--spec",
+        metavar="FILE",
+        default=argparse.SUPPRESS,
+        help="Take the models from the `models` list of a YAML/JSON spec file"
+    )
+    add_model.add_argument(
+        "--import",
+        dest="schema_import",
+        metavar="FILE",
+        default=argparse.SUPPRESS,
+        help="Import the models of a JSON Schema / OpenAPI (.json/.yaml) or PostgreSQL DDL (.sql) file"
+    )
+    add_middleware = additions.add_parser("middleware", help="Add middleware packages")
+    add_middleware.add_argument("packages", nargs="+", metavar="NAME", help="Middleware package, e.g. cors")
+    add_db = additions.add_parser("db", help="Add a database to a project without one")
+    add_db.add_argument("database", choices=["mongodb", "postgresql"], help="Database to add")
+    for addition in (add, add_model, add_middleware, add_db):
+        add_run_options(addition, defaults=False)
+    return parser
+
+def create_initializer(args: argparse.Namespace, schema_import: str = None, cluster: bool = False):
+    """ProjectInitializer for the current directory, configured from the run options"""
+    import logging
+    from core.project_initializer import ProjectInitializer
+    from utils.logger import setup_logger
+
+    logger = setup_logger(logging.DEBUG if args.verbose else None)
+    if args.templates:
+        from templates.registry import registry
+        registry.set_template_dir(args.templates)
+    dependency_cache = None
+    if not args.no_cache:
+        from utils.dependency_cache import DependencyCache
+        dependency_cache = DependencyCache(
+            logger,
+            cache_dir=args.cache_dir,
+            max_size_mb=args.cache_max_size,
+            max_age_days=args.cache_max_age
+        )
+    return ProjectInitializer(
+        dependency_cache=dependency_cache,
+        offline=args.offline,
+        command_timeout=args.command_timeout or None,
+        profile_path=os.path.abspath(args.profile) if args.profile else None,
+        schema_import=schema_import,
+        cluster=cluster
+    )
+
+def run_add(args: argparse.Namespace):
+    """Add models, middleware or a database to the project in the current directory"""
+    from core import project_additions
+    from core.project_spec import SpecError, load_document
+    from modules.schema_importer import SchemaImportError
+    from utils.logger import setup_logger
+
+    try:
+        spec = project_additions.load_project_spec(setup_logger())
+        if args.addition == "model":
+            if args.schema_import:
+                models = project_additions.import_models(spec, args.schema_import)
+            elif args.spec:
+                document = load_document(args.spec)
+                models = document.get('models') if isinstance(document, dict) else None
+                if not models:
+                    raise SpecError([f"{args.spec} has no models"])
+            else:
+                models = prompt_models(spec['database'])
+            spec = project_additions.add_models(spec, models)
+        elif args.addition == "middleware":
+            spec = project_additions.add_middleware(spec, args.packages)
+        else:
+            spec = project_additions.add_database(spec, args.database)
+    except (SpecError, SchemaImportError) as e:
+        print(e)
+        sys.exit(2)
+
+    try:
+        create_initializer(args).setup_project(spec)
+    except Exception as e:
+        print(f"Error during project update: {e}")
+        sys.exit(1)
+
+def prompt_models(db_type: str) -> list:
+    """Ask for models until an empty name, like the interactive setup does"""
+    if not db_type:
+        return []
+    from modules.model_generator import ModelGenerator
+    from utils.file_tree import FileTree
+
+    model_generator = ModelGenerator(FileTree('.'))
+    models = []
+    while True:
+        model_info = model_generator.create_schema(db_type=db_type)
+        if not model_info:
+            return models
+        models.append(model_info)
+
+def run_fleet(args: argparse.Namespace):
+    """Generate every service of a fleet manifest and report each outcome"""
+    import time
+    from core.fleet import FleetOptions, format_results, load_manifest, results_report, run_fleet as run_services
+    from core.project_spec import SpecError
+
+    try:
+        services = load_manifest(args.manifest)
+    except SpecError as e:
+        print(e)
+        sys.exit(2)
+
+    options = FleetOptions(
+        command_timeout=args.command_timeout or None,
+        offline=args.offline,
+        use_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
+        cache_max_size=args.cache_max_size,
+        cache_max_age=args.cache_max_age,
+        template_dir=os.path.abspath(args.templates) if args.templates else None,
+        verbose=args.verbose
+    )
+    start = time.perf_counter()
+    try:
+        results = run_services(services, options, jobs=args.jobs)
+    except SpecError as e:
+        print(e)
+        sys.exit(2)
+    wall_time = time.perf_counter() - start
+
+    print(format_results(results, wall_time))
+    if args.profile:
+        import json
+        with open(args.profile, 'w') as file:
+            json.dump(results_report(results, wall_time), file, indent=2)
+        print(f"Fleet report written to {args.profile}")
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
 
 def main():
     """
     Entry point for the Express.js project generator.
     Initializes the project setup process.
     """
+    args = build_parser().parse_args()
+    if args.command == "fleet":
+        run_fleet(args)
+        return
+    if args.command == "add":
+        run_add(args)
+        return
+
+    # Validate the spec before anything is written
+    spec = None
+    if args.spec:
+        from core.project_spec import load_spec, SpecError
+        try:
+            spec = load_spec(args.spec)
+        except SpecError as e:
+            print(e)
+            sys.exit(2)
+
     try:
-        project_setup = ProjectInitializer()
-        project_setup.setup_project()
-    
+        create_initializer(args, schema_import=args.schema_import, cluster=args.cluster).setup_project(spec)
+
     except Exception as e:
         print(f"Error during project setup: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
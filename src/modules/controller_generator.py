@@ -1,173 +1,229 @@
-import os
-from typing import Dict, Any
+import json
+from typing import Dict, Any, List, Tuple
+from utils.file_tree import FileTree
+from templates.registry import render
 
 class ControllerGenerator:
+    # (handler template, exported function name) in the order they are emitted
+    HANDLERS = [
+        ('create', 'create{model_name}'),
+        ('list', 'get{model_name}s'),
+        ('get', 'get{model_name}ById'),
+        ('update', 'update{model_name}'),
+        ('delete', 'delete{model_name}'),
+        ('get_many', 'get{model_name}sByIds'),
+        ('bulk_create', 'bulkCreate{model_name}s'),
+        ('bulk_update', 'bulkUpdate{model_name}s'),
+        ('bulk_delete', 'bulkDelete{model_name}s'),
+    ]
+    # Handlers generated only when the model enables the option of the same name
+    OPTIONAL_HANDLERS = [
+        ('export', 'export{model_name}s'),
+    ]
+    # Ids of the items a write handler invalidates in the response cache (list pages always are)
+    INVALIDATED_IDS = {
+        'create': None,
+        'update': '[req.params.id]',
+        'delete': '[req.params.id]',
+        'bulk_create': None,
+        'bulk_update': "results.filter((result) => result.status === 'updated').map((result) => result.id)",
+        'bulk_delete': '[...found]',
+    }
+    # Handlers measured by scripts/query-count.js (the poll scenario reads with get)
+    QUERY_COUNT_HANDLERS = ['create', 'get', 'update', 'delete', 'list']
+    PAGINATION_EXPORTS = ['parseLimit', 'decodeCursor', 'parseFields', 'wantsCount', 'paginate']
+    BULK_IMPORTS = {
+        'mongodb': [
+            "const { isValidObjectId } = require('mongoose');",
+            "const { bulkItems, bulkIds, pick, validationErrors, failed, sendBulkResults } = require('../utils/bulk');",
+        ],
+        'postgresql': [
+            "const { Op } = require('sequelize');",
+            "const { bulkItems, bulkIds, isIntegerId, pick, validationErrors, failed, sendBulkResults } = require('../utils/bulk');",
+        ],
+    }
+    # Errors after which the PostgreSQL bulk writes retry item by item
+    SEQUELIZE_ERRORS_IMPORT = "const { UniqueConstraintError, ValidationError } = require('sequelize');"
+    CONDITIONAL_IMPORT = "const { isConditional, validatorsOf, pageValidators, notModified } = require('../utils/conditional');"
+    # Extra requires of the handler templates, per database
+    HANDLER_IMPORTS = {
+        'get': {
+            'mongodb': [CONDITIONAL_IMPORT],
+            'postgresql': [CONDITIONAL_IMPORT],
+        },
+        'get_many': BULK_IMPORTS,
+        'bulk_create': {
+            'mongodb': BULK_IMPORTS['mongodb'],
+            'postgresql': BULK_IMPORTS['postgresql'] + [SEQUELIZE_ERRORS_IMPORT],
+        },
+        'bulk_update': {
+            'mongodb': BULK_IMPORTS['mongodb'],
+            'postgresql': BULK_IMPORTS['postgresql'] + [SEQUELIZE_ERRORS_IMPORT],
+        },
+        'bulk_delete': BULK_IMPORTS,
+        'list': {
+            'mongodb': [
+                CONDITIONAL_IMPORT,
+                "const { parseLimit, decodeCursor, parseFields, wantsCount, paginate } = require('../utils/pagination');",
+            ],
+            'postgresql': [
+                CONDITIONAL_IMPORT,
+                "const { Op } = require('sequelize');",
+                "const { parseLimit, decodeCursor, parseFields, wantsCount, paginate, estimateCount } = require('../utils/pagination');",
+            ],
+        },
+        'export': {
+            'mongodb': [
+                "const { EXPORT_BATCH_SIZE, streamNdjson } = require('../utils/ndjson');",
+            ],
+            'postgresql': [
+                "const { Op } = require('sequelize');",
+                "const { EXPORT_BATCH_SIZE, streamNdjson } = require('../utils/ndjson');",
+            ],
+        },
+    }
+    # Database specific helpers appended to utils/pagination.js, with their exports
+    PAGINATION_HELPERS = {
+        'postgresql': ('utils/estimate_count_postgresql.js', ['estimateCount']),
+    }
+
+    def __init__(self, file_tree: FileTree):
+        self.file_tree = file_tree
+        # Write handlers invalidate middleware/cache.js entries when the cache middleware is selected
+        self.response_cache = False
+
+    def handlers(self, model_info: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Handler templates and exported names of a model's controller"""
+        optional = [(template, export_name) for template, export_name in self.OPTIONAL_HANDLERS if model_info.get(template)]
+        return [
+            (template, export_name.format(model_name=model_info['name']))
+            for template, export_name in self.HANDLERS + optional
+        ]
+
     def generate_controller(self, model_info: Dict[str, Any]) -> str:
         """Generate CRUD controller for MongoDB or PostgreSQL with custom errors"""
         # Ensure controllers directory exists
-        os.makedirs('controllers', exist_ok=True)
-        
+        self.file_tree.makedirs('controllers')
+
         model_name = model_info['name']
         model_var = model_name.lower()
         db_type = model_info.get('db_type', 'mongodb')
-        
+        if db_type not in ('mongodb', 'postgresql'):
+            raise ValueError(f"Unsupported db_type: {db_type}")
+
         # Generate attributes destructuring string
         attributes_list = model_info.get('attributes', [])
         attributes_destructure = ', '.join([attr['name'] for attr in attributes_list])
-        
-                # Generate required attribute validation
-        required_attrs = [
-            attr for attr in attributes_list 
-            if attr.get('required', False)
-        ]
-        
+
         # Create required attributes validation code
         required_validation = "\n    ".join([
             f"if (!{attr['name']}) {{\n        throw new BadRequestError('{attr['name']} is required');\n    }}"
-            for attr in required_attrs
+            for attr in attributes_list
+            if attr.get('required', False)
         ])
-        
-        if db_type == 'mongodb':
-            controller_content = f"""const {model_name} = require('../models/{model_var}.model');
-const {{ StatusCodes }} = require('http-status-codes');
-const {{ 
-    BadRequestError, 
-    NotFoundError, 
-    CustomAPIError 
-}} = require('../errors');
-
-// Create new {model_var}
-const create{model_name} = async (req, res) => {{
-    const {{ {attributes_destructure} }} = req.body;
-    
-    // Validate required attributes
-    {required_validation}
-    
-    const {model_var} = await {model_name}.create({{ {attributes_destructure} }});
-    res.status(StatusCodes.CREATED).json({{{model_var}}});
-}};
-
-// Get all {model_var}s
-const get{model_name}s = async (req, res) => {{
-    const {model_var}s = await {model_name}.find({{}});
-    res.status(StatusCodes.OK).json({{{model_var}s}});
-}};
-
-// Get single {model_var} by ID
-const get{model_name}ById = async (req, res) => {{
-    const {model_var} = await {model_name}.findById(req.params.id);
-    if (!{model_var}) {{
-        throw new NotFoundError('{model_name} not found');
-    }}
-    res.status(StatusCodes.OK).json({{{model_var}}});
-}};
-
-// Update {model_var}
-const update{model_name} = async (req, res) => {{
-    const {{ {attributes_destructure} }} = req.body;
-    const {model_var} = await {model_name}.findByIdAndUpdate(
-        req.params.id, 
-        {{ {attributes_destructure} }}, 
-        {{ new: true, runValidators: true }}
-    );
-    if (!{model_var}) {{
-        throw new NotFoundError('{model_name} not found');
-    }}
-    res.status(StatusCodes.OK).json({{{model_var}}});
-}};
-
-// Delete {model_var}
-const delete{model_name} = async (req, res) => {{
-    const {model_var} = await {model_name}.findByIdAndDelete(req.params.id);
-    if (!{model_var}) {{
-        throw new NotFoundError('{model_name} not found');
-    }}
-    res.status(StatusCodes.OK).json({{ message: '{model_name} deleted successfully' }});
-}};
-
-module.exports = {{
-    create{model_name},
-    get{model_name}s,
-    get{model_name}ById,
-    update{model_name},
-    delete{model_name}
-}};
-"""
-        elif db_type == 'postgresql':
-            controller_content = f"""const {model_name} = require('../models/{model_var}.model');
-const {{ StatusCodes }} = require('http-status-codes');
-const {{ 
-    BadRequestError, 
-    NotFoundError, 
-    CustomAPIError 
-}} = require('../errors');
-
-// Create new {model_var}
-const create{model_name} = async (req, res) => {{
-    const {{ {attributes_destructure} }} = req.body;
-    // Validate required attributes
-    {required_validation}
-    const {model_var} = await {model_name}.create({{ {attributes_destructure} }});
-    res.status(StatusCodes.CREATED).json({{{model_var}}});
-}};
-
-// Get all {model_var}s
-const get{model_name}s = async (req, res) => {{
-    const {model_var}s = await {model_name}.findAll();
-    res.status(StatusCodes.OK).json({{{model_var}s}});
-}};
-
-// Get single {model_var} by ID
-const get{model_name}ById = async (req, res) => {{
-    const {model_var} = await {model_name}.findByPk(req.params.id);
-    if (!{model_var}) {{
-        throw new NotFoundError('{model_name} not found');
-    }}
-    res.status(StatusCodes.OK).json({{{model_var}}});
-}};
-
-// Update {model_var}
-const update{model_name} = async (req, res) => {{
-    const {{ {attributes_destructure} }} = req.body;
-    const [updated] = await {model_name}.update(
-        {{ {attributes_destructure} }}, 
-        {{
-            where: {{ id: req.params.id }},
-            returning: true
-        }}
-    );
-    if (!updated) {{
-        throw new NotFoundError('{model_name} not found');
-    }}
-    const updated{model_name} = await {model_name}.findByPk(req.params.id);
-    res.status(StatusCodes.OK).json({{{model_var}: updated{model_name}}});
-}};
-
-// Delete {model_var}
-const delete{model_name} = async (req, res) => {{
-    const deleted = await {model_name}.destroy({{ where: {{ id: req.params.id }} }});
-    if (!deleted) {{
-        throw new NotFoundError('{model_name} not found');
-    }}
-    res.status(StatusCodes.OK).json({{ message: '{model_name} deleted successfully' }});
-}};
-
-module.exports = {{
-    create{model_name},
-    get{model_name}s,
-    get{model_name}ById,
-    update{model_name},
-    delete{model_name}
-}};
-"""
-
-        else:
-            raise ValueError(f"Unsupported db_type: {db_type}")
+
+        handlers = self.handlers(model_info)
+        imports = [
+            line
+            for template, _ in handlers
+            for line in self.HANDLER_IMPORTS.get(template, {}).get(db_type, [])
+        ]
+        if self.response_cache:
+            imports.append("const cache = require('../middleware/cache');")
+        context = {
+            'model_name': model_name,
+            'model_var': model_var,
+            'attributes_destructure': attributes_destructure,
+            'required_validation': required_validation,
+            # Attributes a request may set, or select with ?fields=
+            'field_list': ', '.join(f"'{attr['name']}'" for attr in attributes_list),
+            'imports': "\n".join(dict.fromkeys(imports)),
+        }
+        sections = [render('controller/header.js', **context)]
+        sections.extend(
+            render(f"controller/{db_type}/{template}.js", invalidate=self._invalidation(template, model_var), **context)
+            for template, _ in handlers
+        )
+        sections.append(render(
+            'controller/exports.js',
+            handlers=",\n    ".join(export_name for _, export_name in handlers)
+        ))
+        controller_content = "\n".join(sections)
 
         # Write controller file
         controller_filename = f"controllers/{model_var}.controller.js"
-        with open(controller_filename, 'w') as f:
-            f.write(controller_content)
-        
+        self.file_tree.write(controller_filename, controller_content)
+
         print(f"✅ Controller {model_name} created successfully")
-        return controller_filename
\ No newline at end of file
+        return controller_filename
+
+    def _invalidation(self, template: str, model_var: str) -> str:
+        """Cache invalidation statement appended to a write handler's last database call"""
+        if not self.response_cache or template not in self.INVALIDATED_IDS:
+            return ''
+        ids = self.INVALIDATED_IDS[template]
+        arguments = f"'{model_var}s'" + (f", {ids}" if ids else '')
+        return f"\n    await cache.invalidate({arguments});"
+
+    def generate_pagination_helper(self, db_type: str, page_size: int, max_page_size: int) -> str:
+        """Generate utils/pagination.js: page size, keyset cursor and projection helpers of the list handlers"""
+        if db_type not in ('mongodb', 'postgresql'):
+            raise ValueError(f"Unsupported db_type: {db_type}")
+        exports = list(self.PAGINATION_EXPORTS)
+        database_helpers = ''
+        if db_type in self.PAGINATION_HELPERS:
+            template, helper_exports = self.PAGINATION_HELPERS[db_type]
+            database_helpers = render(template)
+            exports.extend(helper_exports)
+
+        helper_filename = 'utils/pagination.js'
+        self.file_tree.write(helper_filename, render(
+            'utils/pagination.js',
+            page_size=page_size,
+            max_page_size=max_page_size,
+            database_helpers=database_helpers,
+            exports=",\n    ".join(exports)
+        ))
+        print("✅ Pagination helpers created successfully")
+        return helper_filename
+
+    def generate_ndjson_helper(self) -> str:
+        """Generate utils/ndjson.js: the backpressure-aware NDJSON writer of the export handlers"""
+        helper_filename = 'utils/ndjson.js'
+        self.file_tree.write(helper_filename, render('utils/ndjson.js'))
+        print("✅ NDJSON export helpers created successfully")
+        return helper_filename
+
+    def generate_conditional_helper(self) -> str:
+        """Generate utils/conditional.js: ETag / Last-Modified validators and 304 answers of the read handlers"""
+        helper_filename = 'utils/conditional.js'
+        self.file_tree.write(helper_filename, render('utils/conditional.js'))
+        print("✅ Conditional GET helpers created successfully")
+        return helper_filename
+
+    def generate_query_count_script(self, db_type: str, models: List[Dict[str, Any]]) -> str:
+        """Generate scripts/query-count.js: the database round trips per request of every controller (npm run bench:queries)"""
+        # The exported name of each measured handler, by model file name
+        handlers = {
+            model_info['name'].lower(): {
+                template: export_name
+                for template, export_name in self.handlers(model_info)
+                if template in self.QUERY_COUNT_HANDLERS
+            }
+            for model_info in models
+        }
+        script_filename = 'scripts/query-count.js'
+        self.file_tree.write(script_filename, render(
+            'scripts/query-count.js',
+            db_type=db_type,
+            handlers=json.dumps(handlers, indent=2)
+        ))
+        print("✅ Query count benchmark created successfully")
+        return script_filename
+
+    def generate_bulk_helper(self, max_items: int) -> str:
+        """Generate utils/bulk.js: request size limit and per-item results of the bulk handlers"""
+        helper_filename = 'utils/bulk.js'
+        self.file_tree.write(helper_filename, render('utils/bulk.js', max_items=max_items))
+        print("✅ Bulk helpers created successfully")
+        return helper_filename
@@ -1,5 +1,5 @@
-import os
 import logging
+from utils.file_tree import FileTree
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -7,16 +7,18 @@ logging.basicConfig(level=logging.INFO)
 
 class ErrorClassesGenerator:
     """Class to create custom error classes for API errors."""
+
+    def __init__(self, file_tree: FileTree):
+        self.file_tree = file_tree
     
     def create_errors_directory(self):
         """Create the errors directory if it doesn't exist."""
-        os.makedirs('errors', exist_ok=True)
+        self.file_tree.makedirs('errors')
         logger.info("✅ Errors directory created successfully")
 
     def create_custom_api_error(self):
         """Create the base CustomAPIError class file."""
-        with open('errors/custom-api.js', 'w') as file:
-            file.write("""class CustomAPIError extends Error {
+        self.file_tree.write('errors/custom-api.js', """class CustomAPIError extends Error {
   constructor(message) {
     super(message);
     this.name = 'CustomAPIError';
@@ -29,8 +31,7 @@ module.exports = CustomAPIError;
 
     def create_not_found_error(self):
         """Create the NotFoundError class file."""
-        with open('errors/not-found.js', 'w') as file:
-            file.write("""const { StatusCodes } = require('http-status-codes');
+        self.file_tree.write('errors/not-found.js', """const { StatusCodes } = require('http-status-codes');
 const CustomAPIError = require('./custom-api');
 
 class NotFoundError extends CustomAPIError {
@@ -47,8 +48,7 @@ module.exports = NotFoundError;
 
     def create_unauthenticated_error(self):
         """Create the UnauthenticatedError class file."""
-        with open('errors/unauthenticated.js', 'w') as file:
-            file.write("""const { StatusCodes } = require('http-status-codes');
+        self.file_tree.write('errors/unauthenticated.js', """const { StatusCodes } = require('http-status-codes');
 const CustomAPIError = require('./custom-api');
 
 class UnauthenticatedError extends CustomAPIError {
@@ -65,8 +65,7 @@ module.exports = UnauthenticatedError;
 
     def create_unauthorized_error(self):
         """Create the UnauthorizedError class file."""
-        with open('errors/unauthorized.js', 'w') as file:
-            file.write("""const { StatusCodes } = require('http-status-codes');
+        self.file_tree.write('errors/unauthorized.js', """const { StatusCodes } = require('http-status-codes');
 const CustomAPIError = require('./custom-api');
 
 class UnauthorizedError extends CustomAPIError {
@@ -83,8 +82,7 @@ module.exports = UnauthorizedError;
 
     def create_bad_request_error(self):
         """Create the BadRequestError class file."""
-        with open('errors/bad-request.js', 'w') as file:
-            file.write("""const { StatusCodes } = require('http-status-codes');
+        self.file_tree.write('errors/bad-request.js', """const { StatusCodes } = require('http-status-codes');
 const CustomAPIError = require('./custom-api');
 
 class BadRequestError extends CustomAPIError {
@@ -101,8 +99,7 @@ module.exports = BadRequestError;
 
     def create_errors_index(self):
         """Create the index file for exporting all error classes."""
-        with open('errors/index.js', 'w') as file:
-            file.write("""const CustomAPIError = require('./custom-api');
+        self.file_tree.write('errors/index.js', """const CustomAPIError = require('./custom-api');
 const UnauthenticatedError = require('./unauthenticated');
 const NotFoundError = require('./not-found');
 const BadRequestError = require('./bad-request');
@@ -1,5 +1,7 @@
-import os
 import logging
+from typing import Any, Dict
+from utils.file_tree import FileTree
+from templates.registry import render
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -8,15 +10,17 @@ logging.basicConfig(level=logging.INFO)
 class MiddlewareGenerator:
     """Class to create Not Found and Error Handler middleware files."""
 
+    def __init__(self, file_tree: FileTree):
+        self.file_tree = file_tree
+
     def create_middleware_directory(self):
         """Create the middleware directory if it doesn't exist."""
-        os.makedirs('middleware', exist_ok=True)
+        self.file_tree.makedirs('middleware')
         logger.info("✅ Middleware directory created successfully")
 
     def create_not_found_middleware(self):
         """Create the Not Found middleware file."""
-        with open('middleware/not-found.js', 'w') as file:
-            file.write("""const { StatusCodes } = require('http-status-codes');
+        self.file_tree.write('middleware/not-found.js', """const { StatusCodes } = require('http-status-codes');
 
 const notFound = (req, res) => {
   res.status(StatusCodes.NOT_FOUND).json({
@@ -31,8 +35,7 @@ module.exports = notFound;
 
     def create_error_handler_middleware(self):
         """Create the Error Handler middleware file."""
-        with open('middleware/error-handler.js', 'w') as file:
-            file.write("""const { StatusCodes } = require('http-status-codes');
+        self.file_tree.write('middleware/error-handler.js', """const { StatusCodes } = require('http-status-codes');
 
 const errorHandlerMiddleware = (err, req, res, next) => {
   console.error(err);  // Log the full error for server-side tracking
@@ -65,6 +68,21 @@ module.exports = errorHandlerMiddleware;
 """)
         logger.info("✅ Error Handler middleware file created successfully")
 
+    def create_cache_middleware(self, settings: Dict[str, Any]):
+        """Create the response cache middleware and its memory / Redis stores."""
+        self.create_middleware_directory()
+        self.file_tree.write('middleware/cache.js', render(
+            'middleware/cache.js',
+            ttl=settings['ttl'],
+            store=settings['store']
+        ))
+        self.file_tree.write('utils/cache-store.js', render(
+            'utils/cache-store.js',
+            max_entries=settings['max_entries'],
+            max_size_mb=settings['max_size_mb']
+        ))
+        logger.info("✅ Response cache middleware created successfully")
+
     def create_middleware_files(self):
         """Orchestrate the creation of middleware directory and files."""
         self.create_middleware_directory()
@@ -74,5 +92,7 @@ module.exports = errorHandlerMiddleware;
 
 # Example usage
 if __name__ == "__main__":
-    generator = MiddlewareGenerator()
+    file_tree = FileTree('.')
+    generator = MiddlewareGenerator(file_tree)
     generator.create_middleware_files()
+    file_tree.flush()
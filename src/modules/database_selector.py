@@ -1,16 +1,24 @@
-import os
-from InquirerPy import inquirer
-from utils.command_runner import CommandRunner
+from utils.prompts import inquirer
+from utils.dependency_plan import DependencyPlan
+from utils.file_tree import FileTree
+from templates.registry import render
 
 class DatabaseSelector:
-    def __init__(self, command_runner: CommandRunner):
-        self.command_runner = command_runner
+    # Connection pool of the generated db/connect.js, per process, in production.
+    # DB_POOL_* / DB_SOCKET_TIMEOUT_MS / DB_AUTO_INDEX override it at runtime.
+    POOL_DEFAULTS = {'max': 20, 'min': 2, 'idle_ms': 10000, 'acquire_ms': 30000, 'socket_timeout_ms': 45000}
+    # Outside production a laptop database does not need more than a few connections
+    DEVELOPMENT_POOL = {'max': 5, 'min': 0}
+
+    def __init__(self, dependency_plan: DependencyPlan, file_tree: FileTree):
+        self.dependency_plan = dependency_plan
+        self.file_tree = file_tree
         self.database_options = {
             'MongoDB': self._setup_mongodb,
             'PostgreSQL': self._setup_postgresql
         }
 
-    def select_and_setup_database(self):
+    def select_and_setup_database(self, pool: dict = None):
         """Interactive database selection and setup"""
         # First, ask if a database is needed
         use_database = inquirer.select(
@@ -30,39 +38,50 @@ class DatabaseSelector:
             default='MongoDB'
         ).execute()
 
-        # return the type and useage of database or not
-        if database_type in self.database_options:
-            self.database_options[database_type]()
-        return database_type
+        return self.setup_database(database_type, pool)
 
-    def _setup_mongodb(self):
-        """Setup MongoDB with Mongoose"""
-        # Install Mongoose
-        self.command_runner.run_command(
-            ['npm', 'install', 'mongoose'], 
-            "Failed to install Mongoose"
+    def setup_database(self, database_type: str, pool: dict = None):
+        """
+        Non-interactive database setup
+
+        Args:
+            database_type (str): 'MongoDB' or 'PostgreSQL' (case insensitive)
+            pool (dict): Connection pool settings (POOL_DEFAULTS keys and auto_index), defaults for missing keys
+
+        Returns:
+            The database name, or None if the type is unknown
+        """
+        for name, setup in self.database_options.items():
+            if name.lower() == database_type.lower():
+                setup(pool or {})
+                return name
+        return None
+
+    @classmethod
+    def pool_settings(cls, pool: dict) -> dict:
+        """
+        Template context of db/connect.js: production pool settings and the smaller development ones.
+        auto_index None builds indexes on boot outside production only.
+        """
+        settings = dict(cls.POOL_DEFAULTS, **{key: value for key, value in pool.items() if key in cls.POOL_DEFAULTS})
+        auto_index = pool.get('auto_index')
+        return dict(
+            settings,
+            development_max=min(settings['max'], cls.DEVELOPMENT_POOL['max']),
+            development_min=min(settings['min'], cls.DEVELOPMENT_POOL['min']),
+            auto_index='!production' if auto_index is None else str(bool(auto_index)).lower()
         )
+
+    def _setup_mongodb(self, pool: dict):
+        """Setup MongoDB with Mongoose"""
+        # Add Mongoose to the install plan
+        self.dependency_plan.add(['mongoose'])
         
         # Create db directory
-        os.makedirs('db', exist_ok=True)
+        self.file_tree.makedirs('db')
         
         # Create connection file
-        mongodb_connection_content = """const mongoose = require("mongoose");
-
-const connectDB = async (url) => {
-  try {
-    await mongoose.connect(url);
-    console.log("MongoDB connection successful");
-  } catch (error) {
-    console.error("MongoDB connection failed:", error);
-    process.exit(1);
-  }
-};
-
-module.exports = connectDB;
-"""
-        with open('db/connect.js', 'w') as file:
-            file.write(mongodb_connection_content)
+        self.file_tree.write('db/connect.js', render('db/mongodb.js', **self.pool_settings(pool)))
         
         return {
             'type': 'MongoDB',
@@ -70,42 +89,21 @@ module.exports = connectDB;
             'dependencies': ['mongoose']
         }
 
-    def _setup_postgresql(self):
+    def _setup_postgresql(self, pool: dict):
         """Setup PostgreSQL with Sequelize"""
-        # Install Sequelize and PostgreSQL driver
-        self.command_runner.run_command(
-            ['npm', 'install', 'sequelize', 'pg', 'pg-hstore'], 
-            "Failed to install Sequelize and PostgreSQL dependencies"
-        )
+        # Add Sequelize, PostgreSQL driver and the migration runner to the install plan
+        self.dependency_plan.add(['sequelize', 'pg', 'pg-hstore', 'umzug'])
         
         # Create db directory
-        os.makedirs('db', exist_ok=True)
+        self.file_tree.makedirs('db')
         
         # Create connection file
-        postgresql_connection_content = """const { Sequelize } = require('sequelize');
-require('dotenv').config();
-
-const sequelize = new Sequelize(
-  process.env.POSTGRES_URL, 
-{
-  dialect: 'postgres',
-  logging: false,
-  pool: {
-      max: 5,
-      min: 0,
-      acquire: 30000,
-      idle: 10000
-  }
-}
-);
-
-module.exports = sequelize
-"""
-        with open('db/connect.js', 'w') as file:
-            file.write(postgresql_connection_content)
+        self.file_tree.write('db/connect.js', render('db/postgresql.js', **self.pool_settings(pool)))
+        # Tables are created by migrations (npm run migrate), not at boot
+        self.file_tree.write('db/migrate.js', render('db/migrate.js'))
 
         return {
             'type': 'PostgreSQL',
             'connection_file': 'db/connect.js',
-            'dependencies': ['sequelize', 'pg', 'pg-hstore']
+            'dependencies': ['sequelize', 'pg', 'pg-hstore', 'umzug']
         }
@@ -1,10 +1,10 @@
 import os
-from utils.command_runner import CommandRunner
+from utils.dependency_plan import DependencyPlan
 import sys
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
-from InquirerPy import inquirer
+from utils.prompts import inquirer
 
 @dataclass
 class MiddlewareOption:
@@ -13,85 +13,102 @@ class MiddlewareOption:
     use_code: str = None
     description: str = ""
     dev_dependency: bool = False
+    # npm packages to install, when they are not just `package` (generated middleware has none)
+    dependencies: Optional[List[str]] = None
+
+    @property
+    def npm_packages(self) -> List[str]:
+        return [self.package] if self.dependencies is None else self.dependencies
 
 class MiddlewareSelector:
-    def __init__(self,logger):
-        # Initialize the optional middleware with detailed information
-        self.command_runner = CommandRunner(logger)
-        self.OPTIONAL_MIDDLEWARE = [
-            MiddlewareOption(
-                package='cors',
-                import_code="const cors = require('cors');",
-                use_code="app.use(cors());",
-                description="Enables Cross-Origin Resource Sharing (CORS)"
-            ),
-            MiddlewareOption(
-                package='helmet',
-                import_code="const helmet = require('helmet');",
-                use_code="app.use(helmet());",
-                description="Sets various HTTP headers to secure the app"
-            ),
-            MiddlewareOption(
-                package='morgan',
-                import_code="const morgan = require('morgan');",
-                use_code="app.use(morgan('dev'));",
-                description="HTTP request logger middleware for Node.js"
-            ),
-            MiddlewareOption(
-                package='express-rate-limit',
-                import_code="const rateLimit = require('express-rate-limit');",
-                use_code="app.use(rateLimit({ windowMs: 15 * 60 * 1000, max: 100 }));",
-                description="To limit repeated requests to public APIs"
-            ),
-            MiddlewareOption(
-                package='body-parser',
-                import_code="const bodyParser = require('body-parser');",
-                use_code="app.use(bodyParser.json());",
-                description="Parse incoming request bodies in a middleware"
-            ),
-            MiddlewareOption(
-                package='compression',
-                import_code="const compression = require('compression');",
-                use_code="app.use(compression());",
-                description="Middleware to compress response bodies"
-            ),
-            MiddlewareOption(
-                package='cookie-parser',
-                import_code="const cookieParser = require('cookie-parser');",
-                use_code="app.use(cookieParser());",
-                description="Parse Cookie header and populate req.cookies"
-            ),
-            MiddlewareOption(
-                package='express-session',
-                import_code="const session = require('express-session');",
-                use_code="app.use(session({ secret: 'secret', resave: false, saveUninitialized: true }));",
-                description="For handling sessions in Express apps"
-            ),
-            MiddlewareOption(
-                package='passport',
-                import_code="const passport = require('passport');",
-                use_code="app.use(passport.initialize());",
-                description="Authentication middleware"
-            ),
-            MiddlewareOption(
-                package='express-validator',
-                import_code="const { body, validationResult } = require('express-validator');",
-                use_code="// Use validator in routes, e.g., [body('email').isEmail()]",
-                description="For data validation in middleware"
-            ),
-            MiddlewareOption(
-                package='multer',
-                import_code="const multer = require('multer');",
-                use_code="const upload = multer({ dest: 'uploads/' });",
-                description="Middleware for handling `multipart/form-data`"
-            ),
-            MiddlewareOption(
-                package='swagger-ui-express',
-                import_code="const swaggerUi = require('swagger-ui-express');",
-                use_code="app.use('/api-docs', swaggerUi.serve, swaggerUi.setup(swaggerDocument));",
-                description="For serving Swagger API documentation"
-            ),
-        ]
+    # The optional middleware with detailed information
+    OPTIONAL_MIDDLEWARE = [
+        MiddlewareOption(
+            package='cors',
+            import_code="const cors = require('cors');",
+            use_code="app.use(cors());",
+            description="Enables Cross-Origin Resource Sharing (CORS)"
+        ),
+        MiddlewareOption(
+            package='helmet',
+            import_code="const helmet = require('helmet');",
+            use_code="app.use(helmet());",
+            description="Sets various HTTP headers to secure the app"
+        ),
+        MiddlewareOption(
+            package='morgan',
+            import_code="const morgan = require('morgan');",
+            use_code="app.use(morgan('dev'));",
+            description="HTTP request logger middleware for Node.js"
+        ),
+        MiddlewareOption(
+            package='express-rate-limit',
+            import_code="const rateLimit = require('express-rate-limit');",
+            use_code="app.use(rateLimit({ windowMs: 15 * 60 * 1000, max: 100 }));",
+            description="To limit repeated requests to public APIs"
+        ),
+        MiddlewareOption(
+            package='body-parser',
+            import_code="const bodyParser = require('body-parser');",
+            use_code="app.use(bodyParser.json());",
+            description="Parse incoming request bodies in a middleware"
+        ),
+        MiddlewareOption(
+            package='compression',
+            import_code="const compression = require('compression');",
+            use_code="app.use(compression());",
+            description="Middleware to compress response bodies"
+        ),
+        MiddlewareOption(
+            package='cookie-parser',
+            import_code="const cookieParser = require('cookie-parser');",
+            use_code="app.use(cookieParser());",
+            description="Parse Cookie header and populate req.cookies"
+        ),
+        MiddlewareOption(
+            package='express-session',
+            import_code="const session = require('express-session');",
+            use_code="app.use(session({ secret: 'secret', resave: false, saveUninitialized: true }));",
+            description="For handling sessions in Express apps"
+        ),
+        MiddlewareOption(
+            package='passport',
+            import_code="const passport = require('passport');",
+            use_code="app.use(passport.initialize());",
+            description="Authentication middleware"
+        ),
+        MiddlewareOption(
+            package='express-validator',
+            import_code="const { body, validationResult } = require('express-validator');",
+            use_code="// Use validator in routes, e.g., [body('email').isEmail()]",
+            description="For data validation in middleware"
+        ),
+        MiddlewareOption(
+            package='multer',
+            import_code="const multer = require('multer');",
+            use_code="const upload = multer({ dest: 'uploads/' });",
+            description="Middleware for handling `multipart/form-data`"
+        ),
+        MiddlewareOption(
+            package='swagger-ui-express',
+            import_code="const swaggerUi = require('swagger-ui-express');",
+            use_code="app.use('/api-docs', swaggerUi.serve, swaggerUi.setup(swaggerDocument));",
+            description="For serving Swagger API documentation"
+        ),
+        MiddlewareOption(
+            package='cache',
+            import_code="const cache = require('./middleware/cache');",
+            use_code="app.get('/cache/stats', cache.stats);",
+            description="Response cache for GET routes, invalidated by writes (in-process LRU or Redis)",
+            dependencies=[]
+        ),
+    ]
+
+    def __init__(self, logger, dependency_plan: DependencyPlan):
+        self.logger = logger
+        self.dependency_plan = dependency_plan
+        # Whether the interactive setup installs middleware as dev dependencies
+        self.dev = False
 
     def select_middleware(self) -> Tuple[List[str], List[str], List[str]]:
         """Interactive middleware setup"""
@@ -107,32 +124,66 @@ class MiddlewareSelector:
             if include == 'Yes':
                 selected_middleware.append(middleware)
         
+        return self._middleware_code(selected_middleware)
+
+    def select_cache_store(self, default: str = 'memory') -> str:
+        """Interactive store of the response cache, asked when the cache middleware is selected"""
+        return inquirer.select(
+            message="Where should the response cache be stored? (memory: in each process, redis: shared)",
+            choices=['memory', 'redis'],
+            default=default
+        ).execute()
+
+    def _middleware_code(self, selected_middleware: List[MiddlewareOption]) -> Tuple[List[str], List[str], List[str]]:
+        """Imports, uses and packages of the selected middleware"""
         return (
             [mw.import_code for mw in selected_middleware if mw.import_code],
             [mw.use_code for mw in selected_middleware if mw.use_code],
             [mw.package for mw in selected_middleware if mw.package]
         )
 
-    def install_packages(self, packages: List[str], dev: bool = False):
+    @classmethod
+    def available_packages(cls) -> List[str]:
+        return [mw.package for mw in cls.OPTIONAL_MIDDLEWARE]
+
+    @classmethod
+    def dependencies(cls, packages: List[str]) -> List[str]:
+        """npm packages to install for the selected middleware"""
+        return [
+            dependency
+            for mw in cls.OPTIONAL_MIDDLEWARE if mw.package in packages
+            for dependency in mw.npm_packages
+        ]
+
+    def setup_middleware(self, packages: List[str], dev: bool = False):
         """
-        Install selected packages using npm
+        Non-interactive middleware setup from a list of package names
+
+        Args:
+            packages (List[str]): Packages from OPTIONAL_MIDDLEWARE to include
+            dev (bool, optional): Install as dev dependencies. Defaults to False.
+        """
+        selected_middleware = [mw for mw in self.OPTIONAL_MIDDLEWARE if mw.package in packages]
+        imports, uses, selected_packages = self._middleware_code(selected_middleware)
+        self.dependency_plan.add(self.dependencies(selected_packages), dev=dev)
+        return imports, uses, selected_packages
+
+    def install_packages(self, packages: List[str], dev: bool = False) -> bool:
+        """
+        Add selected packages to the project's install plan.
+        Nothing is installed here: the whole plan is installed once at the end of the setup.
         
         Args:
             packages (List[str]): List of packages to install
             dev (bool, optional): Install as dev dependencies. Defaults to False.
+
+        Returns:
+            Whether the packages were added (True when there is nothing to install)
         """
         if not packages:
             print("No packages selected for installation.")
-            return
-
+            return True
 
-        # Prepare installation command
-        install_cmd = ['npm', 'install']
-        if dev:
-            install_cmd.append('-D')
-        
-        # Add packages to the command
-        install_cmd.extend(packages)
         # Confirm installation
         confirm = inquirer.select(
             message=f"Install {'dev ' if dev else ''}packages: {', '.join(packages)}?",
@@ -141,15 +192,16 @@ class MiddlewareSelector:
         ).execute()
 
         if confirm == 'Yes':
-            print(f"Installing {' '.join(packages)}...")
-            result = self.command_runner.run_command(install_cmd)
-            print("✅ Packages installed successfully!")
+            self.dependency_plan.add(packages, dev=dev)
+            print(f"✅ Added {' '.join(packages)} to the install plan")
+            return True
+        return False
 
     def full_middleware_setup(self):
         """
         Complete middleware setup process:
         1. Select middleware
-        2. Install packages
+        2. Add packages to the install plan
         3. Update index.js with imports and uses
         """
         # Select middleware
@@ -163,11 +215,16 @@ class MiddlewareSelector:
                 default='Production'
             ).execute()
 
+            self.dev = dep_type == 'Development'
+
             # Install packages
-            self.install_packages(
-                packages, 
-                dev=(dep_type == 'Development')
-            )
+            if not self.install_packages(self.dependencies(packages), dev=self.dev):
+                # index.js cannot require packages that are not installed
+                declined = [mw for mw in self.OPTIONAL_MIDDLEWARE if mw.package in packages and mw.npm_packages]
+                print(f"Skipping {', '.join(mw.package for mw in declined)}, not installed")
+                imports, uses, packages = self._middleware_code([
+                    mw for mw in self.OPTIONAL_MIDDLEWARE if mw.package in packages and mw not in declined
+                ])
 
         return imports, uses, packages
 
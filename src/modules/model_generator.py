@@ -1,20 +1,74 @@
-import os
-from typing import Dict, Any, List
-from InquirerPy import inquirer
+from typing import Dict, Any, Iterable, List
+from utils.prompts import inquirer
+import datetime
+import hashlib
+import json
+import math
 import re
+import time
+import uuid
+from utils.file_tree import FileTree
+from templates.registry import render
 
 
 class ModelGenerator:
-    def __init__(self):
-        # Types for both databases
-        self.MONGOOSE_TYPES = [
-            'String', 'Number', 'Date', 'Boolean', 'ObjectId',
-            'Mixed', 'Array', 'Buffer', 'Decimal128'
-        ]
-        
-        self.POSTGRES_TYPES = [
-            'String', 'Integer', 'Float', 'Boolean', 'Date', 'DateTime'
-        ]
+    # Types for both databases
+    MONGOOSE_TYPES = [
+        'String', 'Number', 'Date', 'Boolean', 'ObjectId',
+        'Mixed', 'Array', 'Buffer', 'Decimal128'
+    ]
+
+    POSTGRES_TYPES = [
+        'String', 'Integer', 'Float', 'Boolean', 'Date', 'DateTime'
+    ]
+
+    # Map type to Sequelize DataTypes (SQL names are accepted too)
+    SEQUELIZE_TYPES = {
+        'String': 'DataTypes.STRING',
+        'Integer': 'DataTypes.INTEGER',
+        'Float': 'DataTypes.FLOAT',
+        'Boolean': 'DataTypes.BOOLEAN',
+        'Date': 'DataTypes.DATEONLY',
+        'DateTime': 'DataTypes.DATE',
+        'VARCHAR': 'DataTypes.STRING',
+        'INTEGER': 'DataTypes.INTEGER',
+        'BOOLEAN': 'DataTypes.BOOLEAN',
+        'TIMESTAMP': 'DataTypes.DATE',
+        'UUID': 'DataTypes.UUID',
+        'TEXT': 'DataTypes.TEXT'
+    }
+    # Types whose default value is a number, a boolean or a date (Date is DATEONLY in Sequelize)
+    INTEGER_TYPES = ['Integer', 'INTEGER']
+    NUMBER_TYPES = ['Number', 'Float', 'Decimal128']
+    BOOLEAN_TYPES = ['Boolean', 'BOOLEAN']
+    DATE_TYPES = ['Date', 'DateTime', 'TIMESTAMP']
+    # A JavaScript number literal, as the default of a numeric attribute
+    NUMBER = re.compile(r'^-?\d+(\.\d+)?([eE][+-]?\d+)?$')
+    # Timestamp fields every model has, usable in compound indexes
+    TIMESTAMP_FIELDS = ['createdAt', 'updatedAt']
+    # Index serving the list endpoints' keyset pagination (newest first)
+    PAGINATION_INDEX = {'fields': [('createdAt', -1), ('id', -1)], 'unique': False, 'sparse': False}
+    # migrations/<version>-create-<table>.js, written once per table
+    CREATE_MIGRATION = re.compile(r'^migrations/\d{14}-create-(\w+)\.js$')
+
+    def __init__(self, file_tree: FileTree):
+        self.file_tree = file_tree
+        # PostgreSQL models of the last run and the tables that already have a create migration
+        self.previous_models: Dict[str, Dict[str, Any]] = {}
+        self.migrated_tables = set()
+        # Version of the migrations written by this run
+        self.migration_version = time.strftime('%Y%m%d%H%M%S', time.gmtime())
+
+    def track_migrations(self, previous_models: Iterable[Dict[str, Any]], previous_files: Iterable[str]):
+        """
+        Load what the last run generated, so that a changed model gets a new
+        migration instead of a rewritten one
+        """
+        self.previous_models = {model_info['name'].lower(): model_info for model_info in previous_models}
+        for path in previous_files:
+            match = self.CREATE_MIGRATION.match(path)
+            if match:
+                self.migrated_tables.add(match.group(1))
 
     def create_schema(self, db_type: str = 'mongodb') -> Dict[str, Any]:
         """Interactive schema creation with database-specific type selection"""
@@ -59,6 +113,14 @@ class ModelGenerator:
                 message=f"Should {attr_name} be unique?",
                 default=False
             ).execute()
+
+            # A unique attribute already has an index
+            indexed = False
+            if not unique:
+                indexed = inquirer.confirm(
+                    message=f"Should {attr_name} be indexed (filtered or sorted on)?",
+                    default=False
+                ).execute()
             
             # Default value (optional)
             default_choice = inquirer.select(
@@ -69,7 +131,9 @@ class ModelGenerator:
             default_value = None
             if default_choice == 'Specify Default':
                 default_value = inquirer.text(
-                    message="Enter default value:"
+                    message="Enter default value:",
+                    validate=lambda value: self._valid_default(attr_type, value, db_type),
+                    invalid_message=f"Not a valid {attr_type} value"
                 ).execute()
             
             attributes.append({
@@ -77,19 +141,90 @@ class ModelGenerator:
                 'type': attr_type,
                 'required': required,
                 'unique': unique,
+                'indexed': indexed,
                 'default': default_value
             })
         
+        export = inquirer.confirm(
+            message=f"Add a streaming NDJSON export endpoint (GET /{model_name.lower()}s/export)?",
+            default=False
+        ).execute()
+
         return {
             'name': model_name,
             'attributes': attributes,
+            'indexes': [],
+            'export': export,
             'db_type': db_type
         }
 
+    @classmethod
+    def default_literal(cls, attr_type: str, value: Any, db_type: str = 'mongodb') -> str:
+        """
+        JavaScript literal of an attribute's default value, which specs and the
+        prompt give as text. Raises ValueError when the value does not fit the type.
+        """
+        text = str(value).lower() if isinstance(value, bool) else str(value)
+        if attr_type in cls.INTEGER_TYPES:
+            if not re.fullmatch(r'-?\d+', text):
+                raise ValueError(f"'{text}' is not an integer")
+            return str(int(text))
+        if attr_type in cls.NUMBER_TYPES:
+            if not cls.NUMBER.match(text) or not math.isfinite(float(text)):
+                raise ValueError(f"'{text}' is not a number")
+            return text
+        if attr_type in cls.BOOLEAN_TYPES:
+            if text.lower() not in ('true', 'false'):
+                raise ValueError(f"'{text}' is not true or false")
+            return text.lower()
+        if attr_type in cls.DATE_TYPES:
+            return json.dumps(cls._iso_date(text, date_only=db_type == 'postgresql' and attr_type == 'Date'))
+        if attr_type == 'UUID':
+            try:
+                return json.dumps(str(uuid.UUID(text)))
+            except ValueError:
+                raise ValueError(f"'{text}' is not a UUID")
+        if attr_type == 'ObjectId':
+            if not re.fullmatch(r'[0-9a-fA-F]{24}', text):
+                raise ValueError(f"'{text}' is not an ObjectId (24 hexadecimal digits)")
+            return json.dumps(text.lower())
+        if attr_type in ('Mixed', 'Array'):
+            try:
+                parsed = json.loads(text)
+            except ValueError:
+                raise ValueError(f"'{text}' is not JSON")
+            if attr_type == 'Array' and not isinstance(parsed, list):
+                raise ValueError(f"'{text}' is not a JSON array")
+            return json.dumps(parsed)
+        # String, VARCHAR, TEXT, Buffer: a string literal
+        return json.dumps(text)
+
+    @classmethod
+    def _valid_default(cls, attr_type: str, value: str, db_type: str) -> bool:
+        try:
+            cls.default_literal(attr_type, value, db_type)
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _iso_date(text: str, date_only: bool) -> str:
+        """ISO 8601 form of a date or date-time, which Mongoose and Sequelize both cast"""
+        try:
+            if re.fullmatch(r'\d{4}-\d{2}-\d{2}', text):
+                parsed = datetime.date.fromisoformat(text)
+            else:
+                parsed = datetime.datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            raise ValueError(f"'{text}' is not an ISO 8601 date")
+        if date_only and isinstance(parsed, datetime.datetime):
+            parsed = parsed.date()
+        return parsed.isoformat()
+
     def generate_model(self, model_info: Dict[str, Any]) -> str:
         """Generate model based on database type"""
         # Ensure models directory exists
-        os.makedirs('models', exist_ok=True)
+        self.file_tree.makedirs('models')
         
         # Dispatch to appropriate model generator
         if model_info['db_type'] == 'mongodb':
@@ -99,123 +234,248 @@ class ModelGenerator:
         else:
             raise ValueError(f"Unsupported database type: {model_info['db_type']}")
 
+    def _mongoose_field(self, attr: Dict[str, Any]) -> str:
+        """Schema definition of one attribute"""
+        options = [f"    type: mongoose.Schema.Types.{attr['type']},"]
+        if attr['required']:
+            options.append("    required: true,")
+        # A sparse unique index is declared with the schema's other indexes
+        if attr['unique'] and not attr.get('sparse'):
+            options.append("    unique: true,")
+        if attr['default'] is not None:
+            options.append(f"    default: {self.default_literal(attr['type'], attr['default'], 'mongodb')},")
+        return f"  {attr['name']}: {{\n" + "\n".join(options) + "\n  },"
+
+    def model_indexes(self, model_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Secondary indexes of a model: the list endpoints' pagination index, one
+        per indexed attribute and the model's compound indexes.
+
+        Each index is {'fields': [(name, 1 | -1), ...], 'unique', 'sparse'} and
+        optionally 'expires' (TTL in seconds). `id` stands for the primary key.
+        """
+        indexes = [self.PAGINATION_INDEX]
+        for attr in model_info['attributes']:
+            sparse = bool(attr.get('sparse'))
+            if attr.get('unique') and sparse:
+                indexes.append({'fields': [(attr['name'], 1)], 'unique': True, 'sparse': True})
+            elif not attr.get('unique') and (attr.get('indexed') or attr.get('expires') is not None):
+                index = {'fields': [(attr['name'], 1)], 'unique': False, 'sparse': sparse}
+                if attr.get('expires') is not None:
+                    index['expires'] = attr['expires']
+                indexes.append(index)
+        indexes.extend(model_info.get('indexes') or [])
+        return indexes
+
+    def _mongoose_index(self, model_name: str, index: Dict[str, Any]) -> str:
+        """Schema.index(...) call of one index"""
+        keys = ", ".join(f"{'_id' if name == 'id' else name}: {order}" for name, order in index['fields'])
+        options = []
+        if index['unique']:
+            options.append("unique: true")
+        if index['sparse']:
+            options.append("sparse: true")
+        if index.get('expires') is not None:
+            options.append(f"expireAfterSeconds: {index['expires']}")
+        arguments = f"{{ {keys} }}" + (f", {{ {', '.join(options)} }}" if options else "")
+        return f"{model_name}Schema.index({arguments});"
+
     def _generate_mongoose_model(self, model_info: Dict[str, Any]) -> str:
         """Generate Mongoose model"""
         model_name = model_info['name']
         model_var = model_name.lower()
-        
-        # Construct schema
-        schema_content = f"""const mongoose = require('mongoose');
-const {model_name}Schema = new mongoose.Schema({{
-"""
-        for attr in model_info['attributes']:
-            # Construct type definition
-            type_def = f" {attr['name']}: {{\n"
-            type_def += f" type: mongoose.Schema.Types.{attr['type']},\n"
-            
-            if attr['required']:
-                type_def += " required: true,\n"
-            
-            if attr['unique']:
-                type_def += " unique: true,\n"
-            
-            if attr['default'] is not None:
-                # Handle different types of defaults
-                if attr['type'] == 'String':
-                    type_def += f" default: '{attr['default']}',\n"
-                elif attr['type'] in ['Number', 'Boolean']:
-                    type_def += f" default: {attr['default']},\n"
-                else:
-                    type_def += f" default: {attr['default']},\n"
-            
-            type_def += " },\n"
-            schema_content += type_def
-        
-        schema_content += f""" }}, {{
- timestamps: true
-}});
-module.exports = mongoose.model('{model_name}', {model_name}Schema);
-"""
-        
+
+        schema_content = render(
+            'model/mongoose.js',
+            model_name=model_name,
+            fields="\n".join(self._mongoose_field(attr) for attr in model_info['attributes']),
+            indexes="\n".join(self._mongoose_index(model_name, index) for index in self.model_indexes(model_info))
+        )
+
         # Write model file
         model_filename = f"models/{model_var}.model.js"
-        with open(model_filename, 'w') as f:
-            f.write(schema_content)
-        
+        self.file_tree.write(model_filename, schema_content)
+
         print(f"✅ Mongoose Model {model_name} created successfully")
         return model_filename
-    def _generate_postgres_model(self, model_info: Dict[str, Any]) -> str:
-        """Generate Sequelize PostgreSQL model in modern JavaScript format"""
-        model_name = model_info['name']
-        model_var = model_name.lower()
 
-        # Begin model content
-        model_content = f"""const {{ DataTypes }} = require('sequelize');
-    const sequelize = require("../db/connect");
-    const {model_name} = sequelize.define('{model_name}', {{
-    """
+    def _sequelize_constraints(self, attr: Dict[str, Any]) -> List[str]:
+        """Column definition of one attribute, shared by the model and its migrations"""
+        attr_type = self.SEQUELIZE_TYPES.get(attr['type'], 'DataTypes.STRING')
 
-        # Add model attributes
-        for attr in model_info['attributes']:
-            # Map type to Sequelize DataTypes
-            type_mapping = {
-                'VARCHAR': 'DataTypes.STRING',
-                'INTEGER': 'DataTypes.INTEGER',
-                'BOOLEAN': 'DataTypes.BOOLEAN',
-                'TIMESTAMP': 'DataTypes.DATE',
-                'UUID': 'DataTypes.UUID',
-                'TEXT': 'DataTypes.TEXT'
-            }
-            attr_type = type_mapping.get(attr['type'], 'DataTypes.STRING')
-
-            # Begin attribute definition
-            attr_def = f"    {attr['name']}: {{\n"
-            attr_def += f"        type: {attr_type},\n"
-
-            # Add constraints and validations
-            constraints = []
-            
-            # Required/Nullable
-            if attr['required']:
-                constraints.append("allowNull: false")
-            else:
-                constraints.append("allowNull: true")
-            
-            # Unique
-            if attr['unique']:
-                constraints.append("unique: true")
-            
-            # Default value
-            if attr.get('default') is not None:
-                default_value = f"'{attr['default']}'" if attr['type'] in ['VARCHAR', 'TEXT'] else attr['default']
-                constraints.append(f"defaultValue: {default_value}")
-            
-            # Length validation for string types
-            if attr['type'] in ['VARCHAR', 'TEXT']:
-                constraints.append("validate: {\n            len: [3, 255]\n        }")
+        # Add constraints and validations
+        constraints = [f"type: {attr_type}"]
 
-            # Add constraints to attribute definition
-            if constraints:
-                attr_def += "        " + ",\n        ".join(constraints) + "\n"
-            
-            attr_def += "    },\n"
-            model_content += attr_def
+        # Required/Nullable
+        if attr['required']:
+            constraints.append("allowNull: false")
+        else:
+            constraints.append("allowNull: true")
+
+        # Unique
+        if attr['unique']:
+            constraints.append("unique: true")
+
+        # Default value
+        if attr.get('default') is not None:
+            constraints.append(f"defaultValue: {self.default_literal(attr['type'], attr['default'], 'postgresql')}")
+        return constraints
+
+    def _sequelize_field(self, attr: Dict[str, Any]) -> str:
+        """Model definition of one attribute"""
+        constraints = self._sequelize_constraints(attr)
+
+        # Length validation for string types
+        if attr['type'] in ['VARCHAR', 'TEXT']:
+            constraints.append("validate: {\n            len: [3, 255]\n        }")
+
+        return f"    {attr['name']}: {{\n        " + ",\n        ".join(constraints) + "\n    },"
 
-        # Close model definition with additional options
-        model_content += f"""}}, {{
-        timestamps: true,
-        paranoid: true, // Soft delete
-        tableName: '{model_var}s'
-    }});
+    def _sequelize_index_options(self, index: Dict[str, Any]) -> List[str]:
+        """Options of one index, shared by the model's indexes block and its migrations"""
+        fields = ", ".join(
+            f"'{name}'" if order == 1 else f"{{ name: '{name}', order: 'DESC' }}"
+            for name, order in index['fields']
+        )
+        options = [f"fields: [{fields}]"]
+        if index['unique']:
+            options.append("unique: true")
+        # Soft deleted rows are never read: partial indexes leave them out.
+        # A unique index covers them too, so a deleted row keeps its value.
+        where = [] if index['unique'] else ["deletedAt: null"]
+        if index['sparse']:
+            where.extend(f"{name}: {{ [Op.ne]: null }}" for name, _ in index['fields'])
+        if where:
+            options.append(f"where: {{ {', '.join(where)} }}")
+        return options
 
-    module.exports = {model_name};
-    """
+    def _sequelize_index(self, index: Dict[str, Any]) -> str:
+        """Entry of the model's indexes block of one index"""
+        return f"        {{ {', '.join(self._sequelize_index_options(index))} }}"
+
+    def _generate_postgres_model(self, model_info: Dict[str, Any]) -> str:
+        """Generate Sequelize PostgreSQL model in modern JavaScript format"""
+        model_name = model_info['name']
+        model_var = model_name.lower()
+
+        model_content = render(
+            'model/sequelize.js',
+            model_name=model_name,
+            table_name=f"{model_var}s",
+            fields="\n".join(self._sequelize_field(attr) for attr in model_info['attributes']),
+            indexes=",\n".join(self._sequelize_index(index) for index in self.model_indexes(model_info))
+        )
 
         # Write model file
         model_filename = f"models/{model_var}.model.js"
-        with open(model_filename, 'w') as f:
-            f.write(model_content)
+        self.file_tree.write(model_filename, model_content)
+        self._generate_migration(model_info, f"{model_var}s")
         
         print(f"✅ PostgreSQL Model {model_name} created successfully")
         return model_filename
-    
+
+    def _migration_columns(self, model_info: Dict[str, Any]) -> Dict[str, str]:
+        """Column definition of each attribute, as in a createTable/addColumn call"""
+        return {
+            attr['name']: f"{{ {', '.join(self._sequelize_constraints(attr))} }}"
+            for attr in model_info['attributes']
+        }
+
+    @staticmethod
+    def _migration_index_name(table_name: str, index: Dict[str, Any]) -> str:
+        """
+        Name of an index in the migrations: the table and columns, as Sequelize
+        would name it, then the descending columns and the unique/sparse flags, so
+        that two different indexes on the same columns never share a name
+        """
+        columns = "_".join(
+            re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name).lower() + ('_desc' if order == -1 else '')
+            for name, order in index['fields']
+        )
+        flags = "".join(f"_{flag}" for flag in ('unique', 'sparse') if index[flag])
+        name = f"{table_name}_{columns}{flags}"
+        if len(name) > 63:
+            # PostgreSQL truncates identifiers to 63 bytes, which could make two names equal
+            name = f"{name[:54]}_{hashlib.sha256(name.encode('utf-8')).hexdigest()[:8]}"
+        return name
+
+    def _migration_indexes(self, model_info: Dict[str, Any], table_name: str) -> Dict[str, str]:
+        """addIndex options of each index by its name, which is the same only for the same definition"""
+        indexes = {}
+        for index in self.model_indexes(model_info):
+            index = dict(index, fields=[tuple(field) for field in index['fields']])
+            name = self._migration_index_name(table_name, index)
+            indexes[name] = f"{{ name: '{name}', {', '.join(self._sequelize_index_options(index))} }}"
+        return indexes
+
+    def _generate_migration(self, model_info: Dict[str, Any], table_name: str):
+        """
+        Write the migration of a model: the table's creation the first time,
+        then the columns and indexes that changed since the last run. Written
+        migrations are never rewritten, they may already have run somewhere.
+        """
+        name = model_info['name']
+        if table_name not in self.migrated_tables:
+            columns = self._migration_columns(model_info)
+            content = render(
+                'migration/create_table.js',
+                model_name=name,
+                table_name=table_name,
+                columns="\n".join(f"      {column}: {definition}," for column, definition in columns.items()),
+                indexes="\n".join(
+                    f"    await queryInterface.addIndex('{table_name}', {options});"
+                    for options in self._migration_indexes(model_info, table_name).values()
+                )
+            )
+            self.file_tree.write(f"migrations/{self.migration_version}-create-{table_name}.js", content)
+            self.migrated_tables.add(table_name)
+            return
+
+        previous = self.previous_models.get(name.lower())
+        if previous is None:
+            return
+        up, down = self._migration_changes(previous, model_info, table_name)
+        if up:
+            self.file_tree.write(f"migrations/{self.migration_version}-alter-{table_name}.js", render(
+                'migration/alter_table.js',
+                model_name=name,
+                up="\n".join(up),
+                down="\n".join(reversed(down))
+            ))
+
+    def _migration_changes(self, previous: Dict[str, Any], model_info: Dict[str, Any], table_name: str):
+        """
+        The statements turning the previous model's table into the current one,
+        and the statements undoing them (in the order they were applied)
+        """
+        call = "    await queryInterface.{}('" + table_name + "', {});"
+        old_columns, new_columns = self._migration_columns(previous), self._migration_columns(model_info)
+        old_indexes = self._migration_indexes(previous, table_name)
+        new_indexes = self._migration_indexes(model_info, table_name)
+        up, down = [], []
+
+        # Indexes go first, they may cover a column that is removed
+        for index, options in old_indexes.items():
+            if new_indexes.get(index) != options:
+                up.append(call.format('removeIndex', f"'{index}'"))
+                down.append(call.format('addIndex', options))
+        for column, definition in new_columns.items():
+            if column not in old_columns:
+                up.append(call.format('addColumn', f"'{column}', {definition}"))
+                down.append(call.format('removeColumn', f"'{column}'"))
+            elif old_columns[column] != definition:
+                # PostgreSQL adds a unique constraint again when changeColumn is given one
+                old_definition = old_columns[column]
+                if ('unique: true' in definition) == ('unique: true' in old_definition):
+                    definition, old_definition = (text.replace(', unique: true', '') for text in (definition, old_definition))
+                up.append(call.format('changeColumn', f"'{column}', {definition}"))
+                down.append(call.format('changeColumn', f"'{column}', {old_definition}"))
+        for column, definition in old_columns.items():
+            if column not in new_columns:
+                up.append(call.format('removeColumn', f"'{column}'"))
+                down.append(call.format('addColumn', f"'{column}', {definition}"))
+        for index, options in new_indexes.items():
+            if old_indexes.get(index) != options:
+                up.append(call.format('addIndex', options))
+                down.append(call.format('removeIndex', f"'{index}'"))
+        return up, down
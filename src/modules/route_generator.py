@@ -1,117 +1,108 @@
-import os
-import re
+from typing import List, Tuple
+from utils.file_tree import FileTree
+from templates.registry import render
 
 class RouteGenerator:
+    # (path, [(http method, handler name)]) in the order they are mounted
+    ROUTES = [
+        ('/', [('post', 'create{model_name}'), ('get', 'get{model_name}s')]),
+        ('/bulk', [('post', 'bulkCreate{model_name}s'), ('patch', 'bulkUpdate{model_name}s'), ('delete', 'bulkDelete{model_name}s')]),
+        ('/:id', [('get', 'get{model_name}ById'), ('patch', 'update{model_name}'), ('delete', 'delete{model_name}')]),
+    ]
+    # (model option, path, methods) of optional routes, mounted before '/:id' would capture them
+    OPTIONAL_ROUTES = [
+        ('export', '/export', [('get', 'export{model_name}s')]),
+    ]
+
+    # Response cache middleware of the GET handlers (cache.list / cache.item)
+    CACHED_HANDLERS = {
+        'get{model_name}s': 'list',
+        'get{model_name}ById': 'item',
+    }
+
+    def __init__(self, file_tree: FileTree):
+        self.file_tree = file_tree
+        # GET routes read through middleware/cache.js when the cache middleware is selected
+        self.response_cache = False
+        # model_var -> route registration, rendered once into routes/index.js
+        self.registered_routes = {}
+
+    def routes_for(self, model_info: dict) -> List[Tuple[str, List[Tuple[str, str]]]]:
+        """Paths, methods and handler names of a model's router"""
+        model_name = model_info['name']
+        optional = [(path, methods) for option, path, methods in self.OPTIONAL_ROUTES if model_info.get(option)]
+        routes = self.ROUTES[:1] + optional + self.ROUTES[1:]
+        return [
+            (path, [(method, handler.format(model_name=model_name)) for method, handler in methods])
+            for path, methods in routes
+        ]
+
     def generate_routes(self, model_info: dict) -> str:
         """Generate routes for the model"""
         # Ensure routes directory exists
-        os.makedirs('routes', exist_ok=True)
+        self.file_tree.makedirs('routes')
         
         model_name = model_info['name']
         model_var = model_name.lower()
-        
-        routes_content = f"""const express = require('express');
-const router = express.Router();
-const {{
-    create{model_name},
-    get{model_name}s,
-    get{model_name}ById,
-    update{model_name},
-    delete{model_name}
-}} = require('../controllers/{model_var}.controller');
-
-// Routes for {model_name}
-router.route('/')
-    .post(create{model_name})
-    .get(get{model_name}s);
+        routes = self.routes_for(model_info)
 
-router.route('/:id')
-    .get(get{model_name}ById)
-    .patch(update{model_name})
-    .delete(delete{model_name});
-
-module.exports = router;
-"""
+        handlers = list(dict.fromkeys(
+            handler for _, methods in routes for _, handler in methods
+        ))
+        cached = {}
+        if self.response_cache:
+            cached = {
+                handler.format(model_name=model_name): f"cache.{kind}('{model_var}s'), "
+                for handler, kind in self.CACHED_HANDLERS.items()
+            }
+        route_blocks = "\n\n".join(
+            f"router.route('{path}')\n" + "\n".join(
+                f"    .{method}({cached.get(handler, '') if method == 'get' else ''}{handler})" for method, handler in methods
+            ) + ";"
+            for path, methods in routes
+        )
+        routes_content = render(
+            'routes/resource.js',
+            model_name=model_name,
+            model_var=model_var,
+            imports="const cache = require('../middleware/cache');\n" if self.response_cache else '',
+            handlers=",\n    ".join(handlers),
+            routes=route_blocks
+        )
         
         # Write routes file
         routes_filename = f"routes/{model_var}.routes.js"
-        with open(routes_filename, 'w') as f:
-            f.write(routes_content)
+        self.file_tree.write(routes_filename, routes_content)
         
         print(f"✅ Routes {model_name} created successfully")
         
         return routes_filename
-    def update_index_routes(self, model_name: str, model_var: str):
-        """
-        Update index.js to include new route with improved parsing and insertion
-        
-        This method handles multiple scenarios:
-        1. Adding imports when no route imports exist
-        2. Preventing duplicate imports
-        3. Inserting routes in the correct section
-        4. Handling different file structures
-        """
-        try:
-            # Read current index.js
-            with open('index.js', 'r') as f:
-                content = f.readlines()
-            
-            # Prepare route import and use statements
-            route_import = f"const {model_var}Routes = require('./routes/{model_var}.routes');"
-            route_use = f"app.use('/api/v1/{model_var}s', {model_var}Routes);"
-            
-            # Find indices for route imports and route uses
-            route_import_indices = [
-                i for i, line in enumerate(content) 
-                if '// start route import' in line or '// end route import' in line
-            ]
-            route_use_indices = [
-                i for i, line in enumerate(content) 
-                if '// routes' in line
-            ]
-            
-            # Handle route imports
-            if route_import_indices:
-                # Check if import already exists
-                if not any(route_import in line for line in content):
-                    content.insert(route_import_indices[0] + 1, route_import + '\n')
-            else:
-                # If no route import section exists, add it near the top of imports
-                import_section = [
-                    i for i, line in enumerate(content) 
-                    if re.match(r'^(const|require)\s', line.strip())
-                ]
-                if import_section:
-                    content.insert(import_section[-1] + 1, '\n// start route import\n')
-                    content.insert(import_section[-1] + 2, route_import + '\n')
-                    content.insert(import_section[-1] + 3, '// end route import\n')
-            
-            # Handle route uses
-            if route_use_indices:
-                # Check if route use already exists
-                if not any(route_use in line for line in content):
-                    content.insert(route_use_indices[0] + 1, f"// {model_name} Routes\n")
-                    content.insert(route_use_indices[0] + 2, route_use + '\n')
-            else:
-                # If no routes section, add near the end before server start
-                server_start_indices = [
-                    i for i, line in enumerate(content) 
-                    if 'app.listen(' in line or 'server.listen(' in line
-                ]
-                if server_start_indices:
-                    content.insert(server_start_indices[0], '\n// routes\n')
-                    content.insert(server_start_indices[0] + 1, route_use + '\n')
-                else:
-                    # Fallback: add at the end
-                    content.append('\n// routes\n')
-                    content.append(route_use + '\n')
-            
-            # Write updated content
-            with open('index.js', 'w') as f:
-                f.writelines(content)
-            
-            print(f"✅ Updated index.js to include {model_name} routes")
-        
-        except Exception as e:
-            print(f"Failed to update index.js: {e}")
-            raise
\ No newline at end of file
+
+    def register_routes(self, model_info: dict):
+        """Record the model's router for routes/index.js (re-registering a model replaces it)"""
+        model_var = model_info['name'].lower()
+        self.registered_routes[model_var] = {
+            'name': model_info['name'],
+            'var': model_var,
+            'path': f"/{model_var}s",
+        }
+
+    def routes(self) -> list:
+        """Registered routes, in registration order"""
+        return list(self.registered_routes.values())
+
+    def generate_routes_index(self) -> str:
+        """Generate routes/index.js mounting every registered model router"""
+        routes = self.routes()
+        imports = "\n".join(
+            f"const {route['var']}Routes = require('./{route['var']}.routes');"
+            for route in routes
+        )
+        uses = "\n".join(
+            f"router.use('{route['path']}', {route['var']}Routes);"
+            for route in routes
+        )
+        routes_index_content = render('routes/index.js', imports=imports, uses=uses)
+        self.file_tree.write('routes/index.js', routes_index_content)
+        print(f"✅ Routes index with {len(routes)} routers created successfully")
+        return 'routes/index.js'
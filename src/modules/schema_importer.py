@@ -0,0 +1,538 @@
+import json
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+from modules.model_generator import ModelGenerator
+
+IDENTIFIER = re.compile(r'^[A-Za-z_$][A-Za-z0-9_$]*$')
+
+# Columns every generated model already has (id, and timestamps: true / paranoid)
+IMPLICIT_ATTRIBUTES = {
+    'id', '_id', 'createdAt', 'updatedAt', 'deletedAt', 'created_at', 'updated_at', 'deleted_at'
+}
+
+# Database-neutral kind of an imported column -> attribute type of each database
+KIND_TYPES = {
+    'mongodb': {
+        'string': 'String', 'integer': 'Number', 'float': 'Number', 'decimal': 'Decimal128',
+        'boolean': 'Boolean', 'date': 'Date', 'datetime': 'Date', 'json': 'Mixed',
+        'binary': 'Buffer', 'array': 'Array', 'reference': 'ObjectId',
+    },
+    'postgresql': {
+        'string': 'String', 'integer': 'Integer', 'float': 'Float', 'decimal': 'Float',
+        'boolean': 'Boolean', 'date': 'Date', 'datetime': 'DateTime', 'json': 'String',
+        'binary': 'String', 'array': 'String', 'reference': 'Integer',
+    },
+}
+
+SQL_KINDS = {
+    'smallint': 'integer', 'integer': 'integer', 'int': 'integer', 'int2': 'integer', 'int4': 'integer',
+    'int8': 'integer', 'bigint': 'integer', 'serial': 'integer', 'bigserial': 'integer', 'smallserial': 'integer',
+    'real': 'float', 'float': 'float', 'float4': 'float', 'float8': 'float', 'double precision': 'float',
+    'numeric': 'decimal', 'decimal': 'decimal', 'money': 'decimal',
+    'boolean': 'boolean', 'bool': 'boolean',
+    'date': 'date',
+    'timestamp': 'datetime', 'timestamptz': 'datetime', 'time': 'datetime', 'timetz': 'datetime',
+    'json': 'json', 'jsonb': 'json',
+    'bytea': 'binary',
+}
+
+JSON_SCHEMA_FORMATS = {'date': 'date', 'date-time': 'datetime', 'binary': 'binary', 'byte': 'binary'}
+JSON_SCHEMA_KINDS = {
+    'string': 'string', 'integer': 'integer', 'number': 'float', 'boolean': 'boolean',
+    'array': 'array', 'object': 'json',
+}
+
+# Words that end a column's type in a CREATE TABLE column definition
+SQL_COLUMN_KEYWORDS = re.compile(
+    r'\s+(?:NOT\s+NULL|NULL|DEFAULT|PRIMARY\s+KEY|UNIQUE|REFERENCES|CHECK|CONSTRAINT|GENERATED|COLLATE)\b',
+    re.IGNORECASE
+)
+SQL_CREATE_TABLE = re.compile(
+    r'^CREATE\s+(?:(?:GLOBAL|LOCAL)\s+)?(?:(?:TEMP|TEMPORARY|UNLOGGED)\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?'
+    r'(?P<name>(?:"[^"]+"|[\w$]+)(?:\.(?:"[^"]+"|[\w$]+))?)\s*\(',
+    re.IGNORECASE
+)
+SQL_CREATE_TABLE_START = re.compile(r'\s*CREATE\s+(?:(?:GLOBAL|LOCAL|TEMP|TEMPORARY|UNLOGGED)\s+)*TABLE\b', re.IGNORECASE)
+SQL_DEFAULT = re.compile(r"\bDEFAULT\s+('(?:[^']|'')*'|[^\s,]+)", re.IGNORECASE)
+SQL_TABLE_CONSTRAINT = re.compile(r'^(?:CONSTRAINT\s+\S+\s+)?(PRIMARY\s+KEY|UNIQUE|FOREIGN\s+KEY|CHECK|EXCLUDE)\b', re.IGNORECASE)
+
+
+class SchemaImportError(ValueError):
+    """Raised when a schema file cannot be read or parsed"""
+
+
+class _JsonStream:
+    """
+    Minimal pull parser over a JSON text file: walks object keys and returns
+    one value at a time, so only the value being read is held in memory.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    # A complete string literal, a bracket, or the opening quote of a string cut by the chunk end
+    TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]|"')
+    SCALAR_END = re.compile(r'[\s,}\]]')
+
+    def __init__(self, file: TextIO):
+        self.file = file
+        self.buffer = ''
+        self.pos = 0
+        # Start of the value being captured, kept in the buffer across refills
+        self.mark: Optional[int] = None
+
+    def _fill(self) -> bool:
+        chunk = self.file.read(self.CHUNK_SIZE)
+        if not chunk:
+            return False
+        keep = self.pos if self.mark is None else self.mark
+        self.buffer = self.buffer[keep:] + chunk
+        self.pos -= keep
+        if self.mark is not None:
+            self.mark -= keep
+        return True
+
+    def _more(self):
+        if not self._fill():
+            raise SchemaImportError("unexpected end of JSON document")
+
+    def peek(self) -> str:
+        """Next non-blank character ('' at the end of the file)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise SchemaImportError(f"expected '{char}' in JSON document, found '{found or 'end of file'}'")
+        self.pos += 1
+
+    def read_value(self, capture: bool = False) -> Optional[str]:
+        """Consume the next value, returning its JSON text when capture is set"""
+        first = self.peek()
+        if not first:
+            raise SchemaImportError("unexpected end of JSON document")
+        # Only a captured value is kept in the buffer across refills
+        self.mark = self.pos if capture else None
+        try:
+            if first in '{["':
+                self._skip_nested()
+            else:
+                self._skip_scalar()
+            return self.buffer[self.mark:self.pos] if capture else None
+        finally:
+            self.mark = None
+
+    def _skip_scalar(self):
+        while True:
+            match = self.SCALAR_END.search(self.buffer, self.pos)
+            if match:
+                self.pos = match.start()
+                return
+            self.pos = len(self.buffer)
+            if not self._fill():
+                return
+
+    def _skip_nested(self):
+        depth = 0
+        while True:
+            match = self.TOKEN.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                self._more()
+                continue
+            token = match.group()
+            if token == '"':
+                # A string that continues in the next chunk
+                self.pos = match.start()
+                self._more()
+                continue
+            self.pos = match.end()
+            if token in '{[':
+                depth += 1
+            elif token in '}]':
+                depth -= 1
+            if depth == 0:
+                return
+
+    def keys(self) -> Iterator[str]:
+        """Walk the object at the current position; the caller consumes each key's value"""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = json.loads(self.read_value(capture=True))
+            self.expect(':')
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise SchemaImportError(f"expected ',' or '}}' in JSON document, found '{separator or 'end of file'}'")
+
+
+class SchemaImporter:
+    """
+    Turn existing schemas into model_info records (the structure create_schema
+    returns) for model, controller and route generation.
+
+    Supported inputs, all read as a stream with memory bounded by the largest entity:
+        - JSON Schema (`definitions` / `$defs`) and OpenAPI (`components.schemas`,
+          Swagger `definitions`) in JSON, or in YAML when PyYAML is installed
+        - PostgreSQL DDL (`CREATE TABLE` statements, e.g. a pg_dump --schema-only)
+
+    Constraints added later with ALTER TABLE are not applied: only what a
+    CREATE TABLE statement says about its own columns is imported.
+    """
+
+    def __init__(self, db_type: str = 'mongodb'):
+        if db_type not in KIND_TYPES:
+            raise SchemaImportError(f"Unsupported db_type: {db_type}")
+        self.db_type = db_type
+        self.types = KIND_TYPES[db_type]
+
+    def import_file(self, path: str) -> Iterator[Dict[str, Any]]:
+        """Yield one model_info per entity of a .json/.yaml/.yml/.sql schema file"""
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.sql':
+            reader = self.from_sql
+        elif extension in ('.yaml', '.yml'):
+            reader = self.from_yaml_schema
+        elif extension == '.json':
+            reader = self.from_json_schema
+        else:
+            raise SchemaImportError(f"Unknown schema format '{extension}', expected .json, .yaml, .yml or .sql")
+        try:
+            file = open(path, 'r', encoding='utf-8')
+        except OSError as e:
+            raise SchemaImportError(f"cannot read {path}: {e}")
+
+        seen: Set[str] = set()
+        with file:
+            for model_info in reader(file):
+                if model_info['name'].lower() in seen:
+                    raise SchemaImportError(f"{path} defines the model '{model_info['name']}' more than once")
+                seen.add(model_info['name'].lower())
+                yield model_info
+
+    # JSON Schema / OpenAPI
+
+    def from_json_schema(self, file: TextIO) -> Iterator[Dict[str, Any]]:
+        stream = _JsonStream(file)
+        for key in stream.keys():
+            if key in ('definitions', '$defs'):
+                yield from self._json_entities(stream)
+            elif key == 'components':
+                for component in stream.keys():
+                    if component == 'schemas':
+                        yield from self._json_entities(stream)
+                    else:
+                        stream.read_value()
+            else:
+                stream.read_value()
+
+    def _json_entities(self, stream: _JsonStream) -> Iterator[Dict[str, Any]]:
+        for name in stream.keys():
+            schema = json.loads(stream.read_value(capture=True))
+            model_info = self.model_from_json_schema(name, schema)
+            if model_info is not None:
+                yield model_info
+
+    def from_yaml_schema(self, file: TextIO) -> Iterator[Dict[str, Any]]:
+        try:
+            import yaml
+            from yaml import events
+        except ImportError:
+            raise SchemaImportError("PyYAML is required for YAML schemas (pip install pyyaml)")
+
+        loader = yaml.SafeLoader(file)
+
+        def keys():
+            if not isinstance(loader.get_event(), events.MappingStartEvent):
+                raise SchemaImportError("expected a mapping in YAML document")
+            while not loader.check_event(events.MappingEndEvent):
+                key = loader.get_event()
+                if not isinstance(key, events.ScalarEvent):
+                    raise SchemaImportError("only scalar keys are supported in YAML schemas")
+                yield key.value
+            loader.get_event()
+
+        def skip():
+            depth = 0
+            while True:
+                event = loader.get_event()
+                if isinstance(event, (events.MappingStartEvent, events.SequenceStartEvent)):
+                    depth += 1
+                elif isinstance(event, (events.MappingEndEvent, events.SequenceEndEvent)):
+                    depth -= 1
+                if depth == 0:
+                    return
+
+        def entities():
+            for name in keys():
+                # One entity at a time: compose and construct only this subtree
+                schema = loader.construct_document(loader.compose_node(None, None))
+                model_info = self.model_from_json_schema(name, schema)
+                if model_info is not None:
+                    yield model_info
+
+        try:
+            loader.get_event()  # stream start
+            loader.get_event()  # document start
+            for key in keys():
+                if key in ('definitions', '$defs'):
+                    yield from entities()
+                elif key == 'components':
+                    for component in keys():
+                        if component == 'schemas':
+                            yield from entities()
+                        else:
+                            skip()
+                else:
+                    skip()
+        except yaml.YAMLError as e:
+            raise SchemaImportError(f"invalid YAML schema: {e}")
+        finally:
+            loader.dispose()
+
+    def model_from_json_schema(self, name: str, schema: Any) -> Optional[Dict[str, Any]]:
+        """model_info of one JSON Schema object (None for non-object schemas such as enums)"""
+        if not isinstance(schema, dict) or not isinstance(schema.get('properties'), dict):
+            return None
+        required = set(schema.get('required') or [])
+        attributes = []
+        for attr_name, prop in schema['properties'].items():
+            if attr_name in IMPLICIT_ATTRIBUTES or not isinstance(prop, dict):
+                continue
+            kind = self._json_schema_kind(prop)
+            default = prop.get('default')
+            attributes.append(self._attribute(
+                attr_name,
+                kind,
+                required=attr_name in required,
+                unique=bool(prop.get('x-unique', False)),
+                default=self._default(kind, default) if isinstance(default, (str, int, float, bool)) else None
+            ))
+        return self._model_info(name, attributes)
+
+    @staticmethod
+    def _json_schema_kind(prop: Dict[str, Any]) -> str:
+        if '$ref' in prop:
+            return 'reference'
+        schema_type = prop.get('type')
+        if isinstance(schema_type, list):
+            # e.g. ["string", "null"]
+            schema_type = next((item for item in schema_type if item != 'null'), None)
+        if schema_type == 'string':
+            return JSON_SCHEMA_FORMATS.get(prop.get('format'), 'string')
+        if schema_type is None and any(key in prop for key in ('allOf', 'oneOf', 'anyOf')):
+            return 'json'
+        return JSON_SCHEMA_KINDS.get(schema_type, 'string')
+
+    # PostgreSQL DDL
+
+    def from_sql(self, file: TextIO) -> Iterator[Dict[str, Any]]:
+        for statement in self._create_table_statements(file):
+            model_info = self.model_from_create_table(statement)
+            if model_info is not None:
+                yield model_info
+
+    @staticmethod
+    def _create_table_statements(file: TextIO) -> Iterator[str]:
+        """
+        Yield CREATE TABLE statements one at a time; every other statement is
+        dropped line by line, and COPY ... FROM stdin data blocks are skipped
+        """
+        statement: List[str] = []
+        keep = None
+        in_copy_data = False
+        for line in file:
+            if in_copy_data:
+                in_copy_data = line.rstrip('\r\n') != '\\.'
+                continue
+            # Line comments outside of string literals
+            code = re.sub(r"('(?:[^']|'')*')|--.*", lambda match: match.group(1) or '', line)
+            while code:
+                end = _statement_end(code)
+                part = code if end < 0 else code[:end]
+                if keep is None and part.strip():
+                    keep = bool(SQL_CREATE_TABLE_START.match(part))
+                    head = part.strip().upper()
+                if keep:
+                    statement.append(part)
+                if end < 0:
+                    break
+                if keep:
+                    yield ''.join(statement).strip()
+                elif keep is False and head.startswith('COPY') and re.search(r'FROM\s+stdin\s*$', part, re.IGNORECASE):
+                    in_copy_data = True
+                statement = []
+                keep = None
+                code = code[end + 1:]
+        if keep and statement:
+            yield ''.join(statement).strip()
+
+    def model_from_create_table(self, statement: str) -> Optional[Dict[str, Any]]:
+        """model_info of one CREATE TABLE statement"""
+        statement = re.sub(r'/\*.*?\*/', ' ', statement, flags=re.DOTALL)
+        match = SQL_CREATE_TABLE.match(statement)
+        if not match:
+            return None
+        table = match.group('name').split('.')[-1].strip('"')
+        body = statement[match.end():statement.rfind(')')]
+
+        columns: List[Tuple[str, str, str]] = []
+        unique_columns: Set[str] = set()
+        primary_keys: Set[str] = set()
+        for item in _split_top_level(body):
+            constraint = SQL_TABLE_CONSTRAINT.match(item)
+            if constraint:
+                kind = constraint.group(1).upper()
+                listed = re.search(r'\(([^)]*)\)', item)
+                names = [name.strip().strip('"') for name in listed.group(1).split(',')] if listed else []
+                if kind == 'UNIQUE' and len(names) == 1:
+                    unique_columns.add(names[0])
+                elif kind.startswith('PRIMARY') and len(names) == 1:
+                    primary_keys.add(names[0])
+                continue
+            column = re.match(r'\s*("[^"]+"|[\w$]+)\s+(.*)$', item, re.DOTALL)
+            if column:
+                columns.append((column.group(1).strip('"'), column.group(2).strip(), item))
+
+        attributes = []
+        for column_name, definition, item in columns:
+            keyword = SQL_COLUMN_KEYWORDS.search(' ' + definition)
+            sql_type = (definition if keyword is None else (' ' + definition)[:keyword.start()]).strip()
+            upper = definition.upper()
+            if re.search(r'\bPRIMARY\s+KEY\b', upper):
+                primary_keys.add(column_name)
+            if column_name in IMPLICIT_ATTRIBUTES or (column_name in primary_keys and column_name.lower() == 'id'):
+                continue
+            kind = _sql_kind(sql_type)
+            default = _sql_default(definition)
+            if default is not None:
+                default = self._default(kind, default)
+            not_null = bool(re.search(r'\bNOT\s+NULL\b', upper))
+            attributes.append(self._attribute(
+                column_name,
+                kind,
+                required=not_null and default is None and column_name not in primary_keys,
+                unique=bool(re.search(r'\bUNIQUE\b', upper)) or column_name in unique_columns,
+                default=default
+            ))
+        return self._model_info(_singular(table), attributes)
+
+    # model_info construction
+
+    def _default(self, kind: str, default: Any) -> Optional[str]:
+        """The default as text, or None when it does not fit the attribute's type"""
+        default = str(default).lower() if isinstance(default, bool) else str(default)
+        try:
+            ModelGenerator.default_literal(self.types[kind], default, self.db_type)
+        except ValueError:
+            return None
+        return default
+
+    def _attribute(self, name: str, kind: str, required: bool, unique: bool, default: Optional[str]) -> Dict[str, Any]:
+        return {
+            'name': _identifier(name),
+            'type': self.types[kind],
+            'required': required,
+            'unique': unique,
+            'indexed': False,
+            'default': default
+        }
+
+    def _model_info(self, name: str, attributes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            'name': _pascal_case(name),
+            'attributes': attributes,
+            'indexes': [],
+            'export': False,
+            'db_type': self.db_type
+        }
+
+
+def _statement_end(code: str) -> int:
+    """Index of the first ';' outside a string literal, or -1"""
+    for match in re.finditer(r"'(?:[^']|'')*'|;", code):
+        if match.group() == ';':
+            return match.start()
+    return -1
+
+
+def _split_top_level(body: str) -> List[str]:
+    """Split a CREATE TABLE body on the commas between its items"""
+    items, depth, start = [], 0, 0
+    for match in re.finditer(r"'(?:[^']|'')*'|\"[^\"]*\"|[(),]", body):
+        token = match.group()
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        elif token == ',' and depth == 0:
+            items.append(body[start:match.start()].strip())
+            start = match.end()
+    items.append(body[start:].strip())
+    return [item for item in items if item]
+
+
+def _sql_kind(sql_type: str) -> str:
+    sql_type = sql_type.lower()
+    if sql_type.endswith('[]') or sql_type.startswith('array'):
+        return 'array'
+    base = re.sub(r'\s*\(.*?\)', '', sql_type).strip()
+    base = re.sub(r'\s+with(out)?\s+time\s+zone$', '', base)
+    return SQL_KINDS.get(base, SQL_KINDS.get(base.split(' ')[0], 'string'))
+
+
+def _sql_default(definition: str) -> Optional[str]:
+    """Literal DEFAULT of a column; expressions such as now() or nextval(...) are dropped"""
+    match = SQL_DEFAULT.search(definition)
+    if not match:
+        return None
+    value = match.group(1)
+    if value.startswith("'"):
+        # A literal that is part of an expression ('a' || 'b') is not the default
+        if re.match(r"\s*(\|\||[-+*/%(])", definition[match.end():]):
+            return None
+        literal = re.match(r"'((?:[^']|'')*)'", value).group(1)
+        return literal.replace("''", "'")
+    value = value.split('::')[0]
+    if re.fullmatch(r'-?\d+(\.\d+)?', value) or value.lower() in ('true', 'false'):
+        return value.lower()
+    return None
+
+
+def _identifier(name: str) -> str:
+    if IDENTIFIER.match(name):
+        return name
+    name = re.sub(r'[^A-Za-z0-9_$]', '_', name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _pascal_case(name: str) -> str:
+    parts = [part for part in re.split(r'[^A-Za-z0-9]+', name) if part]
+    name = ''.join(part[0].upper() + part[1:] for part in parts) or 'Model'
+    return f"M{name}" if name[0].isdigit() else name
+
+
+def _singular(table: str) -> str:
+    """users -> user, categories -> category, addresses -> address (table names are mostly plural)"""
+    words = table.split('_')
+    last = words[-1]
+    lower = last.lower()
+    if lower.endswith('ies') and len(last) > 3:
+        last = last[:-3] + 'y'
+    elif re.search(r'(ss|x|ch|sh)es$', lower):
+        last = last[:-2]
+    elif lower.endswith('s') and not lower.endswith('ss'):
+        last = last[:-1]
+    return '_'.join(words[:-1] + [last])
@@ -1,5 +1,6 @@
 from .index_js import generate_index_js
 from .env_template import generate_env_template
 from .readme_template import generate_readme_template
+from .registry import TemplateRegistry, TemplateError, registry, render
 
-__all__ = ["generate_index_js", "generate_env_template", "generate_readme_template"]
+__all__ = ["generate_index_js", "generate_env_template", "generate_readme_template", "TemplateRegistry", "TemplateError", "registry", "render"]
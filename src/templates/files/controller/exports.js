@@ -0,0 +1,3 @@
+module.exports = {
+    {{ handlers }}
+};
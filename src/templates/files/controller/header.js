@@ -0,0 +1,11 @@
+const {{ model_name }} = require('../models/{{ model_var }}.model');
+const { StatusCodes } = require('http-status-codes');
+{{ imports }}
+const { 
+    BadRequestError, 
+    NotFoundError, 
+    CustomAPIError 
+} = require('../errors');
+
+// Attributes a request may set or select
+const FIELDS = [{{ field_list }}];
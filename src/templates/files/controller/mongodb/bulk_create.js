@@ -0,0 +1,32 @@
+// Create many {{ model_var }}s with one insertMany, reporting the outcome of every item
+const bulkCreate{{ model_name }}s = async (req, res) => {
+    const items = bulkItems(req.body);
+    const documents = items.map((item) => new {{ model_name }}(pick(item, FIELDS)));
+    const validations = await Promise.allSettled(documents.map((document) => document.validate()));
+    const results = validations.map((validation, index) => (
+        validation.status === 'fulfilled'
+            ? { index, status: 'created' }
+            : failed({ index }, validationErrors(validation.reason))
+    ));
+
+    const pending = results.filter((result) => result.status === 'created');
+    if (pending.length) {
+        try {
+            // Unordered: a duplicate key only fails its own item
+            await {{ model_name }}.insertMany(pending.map((result) => documents[result.index]), { ordered: false });
+        } catch (error) {
+            if (!error.writeErrors) {
+                throw error;
+            }
+            for (const writeError of error.writeErrors) {
+                failed(pending[writeError.index], [writeError.errmsg || writeError.message]);
+            }
+        }
+    }{{ invalidate }}
+    for (const result of pending) {
+        if (result.status === 'created') {
+            result.{{ model_var }} = documents[result.index].toObject();
+        }
+    }
+    sendBulkResults(res, results, StatusCodes.CREATED);
+};
@@ -0,0 +1,15 @@
+// Delete many {{ model_var }}s ({ ids: [...] }) with one deleteMany
+const bulkDelete{{ model_name }}s = async (req, res) => {
+    const ids = bulkIds(req.body && req.body.ids);
+    const found = new Set(
+        (await {{ model_name }}.find({ _id: { $in: ids.filter((id) => isValidObjectId(id)) } }).select('_id').lean())
+            .map((document) => String(document._id))
+    );
+    if (found.size) {
+        await {{ model_name }}.deleteMany({ _id: { $in: [...found] } });
+    }{{ invalidate }}
+    const results = ids.map((id, index) => (
+        found.has(id) ? { index, id, status: 'deleted' } : failed({ index, id }, ['{{ model_name }} not found'])
+    ));
+    sendBulkResults(res, results, StatusCodes.OK);
+};
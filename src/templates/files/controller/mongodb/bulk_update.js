@@ -0,0 +1,45 @@
+// Update many {{ model_var }}s ([{ id, ...changes }]) with one bulkWrite
+const bulkUpdate{{ model_name }}s = async (req, res) => {
+    const items = bulkItems(req.body);
+    const ids = items.map((item) => item.id).filter((id) => isValidObjectId(id));
+    const existing = new Map(
+        (await {{ model_name }}.find({ _id: { $in: ids } }).lean()).map((document) => [String(document._id), document])
+    );
+    const seen = new Set();
+    const results = await Promise.all(items.map(async (item, index) => {
+        const result = { index, id: item.id, status: 'updated' };
+        const current = existing.get(String(item.id));
+        if (!current) {
+            return failed(result, ['{{ model_name }} not found']);
+        }
+        if (seen.has(String(item.id))) {
+            return failed(result, ['{{ model_name }} is updated more than once in this request']);
+        }
+        seen.add(String(item.id));
+        result.changes = pick(item, FIELDS);
+        try {
+            await new {{ model_name }}({ ...current, ...result.changes }).validate();
+        } catch (error) {
+            return failed(result, validationErrors(error));
+        }
+        return result;
+    }));
+
+    const pending = results.filter((result) => result.status === 'updated');
+    if (pending.length) {
+        try {
+            await {{ model_name }}.bulkWrite(pending.map((result) => ({
+                updateOne: { filter: { _id: result.id }, update: { $set: result.changes } }
+            })), { ordered: false });
+        } catch (error) {
+            if (!error.writeErrors) {
+                throw error;
+            }
+            for (const writeError of error.writeErrors) {
+                failed(pending[writeError.index], [writeError.errmsg || writeError.message]);
+            }
+        }
+    }
+    results.forEach((result) => delete result.changes);{{ invalidate }}
+    sendBulkResults(res, results, StatusCodes.OK);
+};
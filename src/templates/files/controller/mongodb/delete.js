@@ -0,0 +1,11 @@
+// Delete {{ model_var }}: one findOneAndDelete, reading back only the id
+const delete{{ model_name }} = async (req, res) => {
+    const {{ model_var }} = await {{ model_name }}.findOneAndDelete(
+        { _id: req.params.id },
+        { projection: { _id: 1 }, lean: true }
+    );
+    if (!{{ model_var }}) {
+        throw new NotFoundError('{{ model_name }} not found');
+    }{{ invalidate }}
+    res.status(StatusCodes.OK).json({ message: '{{ model_name }} deleted successfully' });
+};
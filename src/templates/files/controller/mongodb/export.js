@@ -0,0 +1,8 @@
+// Stream every {{ model_var }} as NDJSON through a query cursor
+const export{{ model_name }}s = async (req, res) => {
+    const cursor = {{ model_name }}.find({})
+        .sort({ _id: 1 })
+        .lean()
+        .cursor({ batchSize: EXPORT_BATCH_SIZE });
+    await streamNdjson(res, cursor, '{{ model_var }}s.ndjson');
+};
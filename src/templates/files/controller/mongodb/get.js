@@ -0,0 +1,17 @@
+// Get single {{ model_var }} by ID; a conditional GET reads only the validators first
+const get{{ model_name }}ById = async (req, res) => {
+    if (isConditional(req)) {
+        const version = await {{ model_name }}.findById(req.params.id).select('updatedAt __v').lean();
+        if (version && notModified(req, res, validatorsOf(version))) {
+            return;
+        }
+    }
+    const {{ model_var }} = await {{ model_name }}.findById(req.params.id).lean();
+    if (!{{ model_var }}) {
+        throw new NotFoundError('{{ model_name }} not found');
+    }
+    if (notModified(req, res, validatorsOf({{ model_var }}))) {
+        return;
+    }
+    res.status(StatusCodes.OK).json({ {{ model_var }} });
+};
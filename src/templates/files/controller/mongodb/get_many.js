@@ -0,0 +1,10 @@
+// Get the {{ model_var }}s of ?ids=a,b,c with one query, in the requested order
+const get{{ model_name }}sByIds = async (req, res) => {
+    const ids = bulkIds(req.query.ids);
+    const documents = await {{ model_name }}.find({ _id: { $in: ids.filter((id) => isValidObjectId(id)) } }).lean();
+    const byId = new Map(documents.map((document) => [String(document._id), document]));
+    res.status(StatusCodes.OK).json({
+        {{ model_var }}s: ids.filter((id) => byId.has(id)).map((id) => byId.get(id)),
+        missing: ids.filter((id) => !byId.has(id))
+    });
+};
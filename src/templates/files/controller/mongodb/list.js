@@ -0,0 +1,34 @@
+// Get a page of {{ model_var }}s, newest first (keyset pagination on createdAt and _id)
+const get{{ model_name }}s = async (req, res) => {
+    if (req.query.ids !== undefined) {
+        return get{{ model_name }}sByIds(req, res);
+    }
+    const limit = parseLimit(req.query.limit);
+    const cursor = decodeCursor(req.query.cursor);
+    const fields = parseFields(req.query.fields, FIELDS);
+    const filter = cursor
+        ? {
+            $or: [
+                { createdAt: { $lt: cursor.createdAt } },
+                { createdAt: cursor.createdAt, _id: { $lt: cursor.id } }
+            ]
+        }
+        : {};
+    let query = {{ model_name }}.find(filter)
+        .sort({ createdAt: -1, _id: -1 })
+        .limit(limit + 1)
+        .lean();
+    if (fields) {
+        // createdAt is needed for the next cursor and updatedAt for the ETag, _id is always selected
+        query = query.select([...fields, 'createdAt', 'updatedAt'].join(' '));
+    }
+    const { items, nextCursor } = paginate(await query, limit, '_id');
+    const response = { {{ model_var }}s: items, nextCursor };
+    if (wantsCount(req.query.count)) {
+        response.total = await {{ model_name }}.estimatedDocumentCount();
+    }
+    if (notModified(req, res, pageValidators(items, '_id', nextCursor, response.total))) {
+        return;
+    }
+    res.status(StatusCodes.OK).json(response);
+};
@@ -0,0 +1,13 @@
+// Update {{ model_var }}: one findOneAndUpdate, returning the updated document as a plain object
+const update{{ model_name }} = async (req, res) => {
+    const { {{ attributes_destructure }} } = req.body;
+    const {{ model_var }} = await {{ model_name }}.findOneAndUpdate(
+        { _id: req.params.id }, 
+        { {{ attributes_destructure }} }, 
+        { new: true, runValidators: true, lean: true }
+    );
+    if (!{{ model_var }}) {
+        throw new NotFoundError('{{ model_name }} not found');
+    }{{ invalidate }}
+    res.status(StatusCodes.OK).json({ {{ model_var }} });
+};
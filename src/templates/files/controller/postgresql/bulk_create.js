@@ -0,0 +1,42 @@
+// Create many {{ model_var }}s with one bulkCreate, reporting the outcome of every item
+const bulkCreate{{ model_name }}s = async (req, res) => {
+    const items = bulkItems(req.body);
+    const values = items.map((item) => pick(item, FIELDS));
+    const validations = await Promise.allSettled(values.map((value) => {{ model_name }}.build(value).validate()));
+    const results = validations.map((validation, index) => (
+        validation.status === 'fulfilled'
+            ? { index, status: 'created' }
+            : failed({ index }, validationErrors(validation.reason))
+    ));
+
+    const pending = results.filter((result) => result.status === 'created');
+    if (pending.length) {
+        try {
+            // One INSERT for every valid item
+            const created = await {{ model_name }}.bulkCreate(
+                pending.map((result) => values[result.index]),
+                { validate: false, returning: true }
+            );
+            created.forEach((row, position) => {
+                pending[position].{{ model_var }} = row.get({ plain: true });
+            });
+        } catch (error) {
+            if (!(error instanceof UniqueConstraintError || error instanceof ValidationError)) {
+                throw error;
+            }
+            // The INSERT failed as a whole: insert item by item so only the offending ones fail
+            for (const result of pending) {
+                try {
+                    const row = await {{ model_name }}.create(values[result.index], { validate: false });
+                    result.{{ model_var }} = row.get({ plain: true });
+                } catch (itemError) {
+                    if (!(itemError instanceof UniqueConstraintError || itemError instanceof ValidationError)) {
+                        throw itemError;
+                    }
+                    failed(result, validationErrors(itemError));
+                }
+            }
+        }
+    }{{ invalidate }}
+    sendBulkResults(res, results, StatusCodes.CREATED);
+};
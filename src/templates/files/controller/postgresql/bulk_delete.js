@@ -0,0 +1,18 @@
+// Delete many {{ model_var }}s ({ ids: [...] }) with one DELETE ... WHERE id IN (...)
+const bulkDelete{{ model_name }}s = async (req, res) => {
+    const ids = bulkIds(req.body && req.body.ids);
+    const found = new Set(
+        (await {{ model_name }}.findAll({
+            where: { id: { [Op.in]: ids.filter(isIntegerId) } },
+            attributes: ['id'],
+            raw: true
+        })).map((row) => String(row.id))
+    );
+    if (found.size) {
+        await {{ model_name }}.destroy({ where: { id: { [Op.in]: [...found] } } });
+    }{{ invalidate }}
+    const results = ids.map((id, index) => (
+        found.has(id) ? { index, id, status: 'deleted' } : failed({ index, id }, ['{{ model_name }} not found'])
+    ));
+    sendBulkResults(res, results, StatusCodes.OK);
+};
@@ -0,0 +1,56 @@
+// Update many {{ model_var }}s ([{ id, ...changes }]) with one INSERT ... ON CONFLICT (id) DO UPDATE
+const bulkUpdate{{ model_name }}s = async (req, res) => {
+    const items = bulkItems(req.body);
+    const ids = items.map((item) => item.id).filter(isIntegerId);
+    const existing = new Map(
+        (await {{ model_name }}.findAll({ where: { id: { [Op.in]: ids } }, raw: true })).map((row) => [String(row.id), row])
+    );
+    const seen = new Set();
+    const results = await Promise.all(items.map(async (item, index) => {
+        const result = { index, id: item.id, status: 'updated' };
+        const current = existing.get(String(item.id));
+        if (!current) {
+            return failed(result, ['{{ model_name }} not found']);
+        }
+        if (seen.has(String(item.id))) {
+            return failed(result, ['{{ model_name }} is updated more than once in this request']);
+        }
+        seen.add(String(item.id));
+        result.values = { ...current, ...pick(item, FIELDS) };
+        try {
+            await {{ model_name }}.build(result.values).validate();
+        } catch (error) {
+            return failed(result, validationErrors(error));
+        }
+        return result;
+    }));
+
+    const pending = results.filter((result) => result.status === 'updated');
+    if (pending.length) {
+        // Rows are complete (merged with the stored ones), so NOT NULL columns are satisfied
+        const upsert = (rows) => {{ model_name }}.bulkCreate(rows, {
+            validate: false,
+            updateOnDuplicate: [...FIELDS, 'updatedAt']
+        });
+        try {
+            await upsert(pending.map((result) => result.values));
+        } catch (error) {
+            if (!(error instanceof UniqueConstraintError || error instanceof ValidationError)) {
+                throw error;
+            }
+            // The statement failed as a whole: upsert item by item so only the offending ones fail
+            for (const result of pending) {
+                try {
+                    await upsert([result.values]);
+                } catch (itemError) {
+                    if (!(itemError instanceof UniqueConstraintError || itemError instanceof ValidationError)) {
+                        throw itemError;
+                    }
+                    failed(result, validationErrors(itemError));
+                }
+            }
+        }
+    }
+    results.forEach((result) => delete result.values);{{ invalidate }}
+    sendBulkResults(res, results, StatusCodes.OK);
+};
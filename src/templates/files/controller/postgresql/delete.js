@@ -0,0 +1,8 @@
+// Delete {{ model_var }}
+const delete{{ model_name }} = async (req, res) => {
+    const deleted = await {{ model_name }}.destroy({ where: { id: req.params.id } });
+    if (!deleted) {
+        throw new NotFoundError('{{ model_name }} not found');
+    }{{ invalidate }}
+    res.status(StatusCodes.OK).json({ message: '{{ model_name }} deleted successfully' });
+};
@@ -0,0 +1,20 @@
+// Stream every {{ model_var }} as NDJSON, read in keyset batches on id
+const export{{ model_name }}s = async (req, res) => {
+    async function* rows() {
+        let lastId = null;
+        while (true) {
+            const batch = await {{ model_name }}.findAll({
+                where: lastId === null ? {} : { id: { [Op.gt]: lastId } },
+                order: [['id', 'ASC']],
+                limit: EXPORT_BATCH_SIZE,
+                raw: true
+            });
+            yield* batch;
+            if (batch.length < EXPORT_BATCH_SIZE) {
+                return;
+            }
+            lastId = batch[batch.length - 1].id;
+        }
+    }
+    await streamNdjson(res, rows(), '{{ model_var }}s.ndjson');
+};
@@ -0,0 +1,10 @@
+// Get the {{ model_var }}s of ?ids=a,b,c with one query, in the requested order
+const get{{ model_name }}sByIds = async (req, res) => {
+    const ids = bulkIds(req.query.ids);
+    const rows = await {{ model_name }}.findAll({ where: { id: { [Op.in]: ids.filter(isIntegerId) } }, raw: true });
+    const byId = new Map(rows.map((row) => [String(row.id), row]));
+    res.status(StatusCodes.OK).json({
+        {{ model_var }}s: ids.filter((id) => byId.has(id)).map((id) => byId.get(id)),
+        missing: ids.filter((id) => !byId.has(id))
+    });
+};
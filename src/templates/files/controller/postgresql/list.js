@@ -0,0 +1,34 @@
+// Get a page of {{ model_var }}s, newest first (keyset pagination on createdAt and id)
+const get{{ model_name }}s = async (req, res) => {
+    if (req.query.ids !== undefined) {
+        return get{{ model_name }}sByIds(req, res);
+    }
+    const limit = parseLimit(req.query.limit);
+    const cursor = decodeCursor(req.query.cursor);
+    const fields = parseFields(req.query.fields, FIELDS);
+    const where = cursor
+        ? {
+            [Op.or]: [
+                { createdAt: { [Op.lt]: cursor.createdAt } },
+                { createdAt: cursor.createdAt, id: { [Op.lt]: cursor.id } }
+            ]
+        }
+        : {};
+    const rows = await {{ model_name }}.findAll({
+        where,
+        // id and createdAt are needed for the next cursor, updatedAt for the ETag
+        attributes: fields ? [...fields, 'id', 'createdAt', 'updatedAt'] : undefined,
+        order: [['createdAt', 'DESC'], ['id', 'DESC']],
+        limit: limit + 1,
+        raw: true
+    });
+    const { items, nextCursor } = paginate(rows, limit, 'id');
+    const response = { {{ model_var }}s: items, nextCursor };
+    if (wantsCount(req.query.count)) {
+        response.total = await estimateCount({{ model_name }});
+    }
+    if (notModified(req, res, pageValidators(items, 'id', nextCursor, response.total))) {
+        return;
+    }
+    res.status(StatusCodes.OK).json(response);
+};
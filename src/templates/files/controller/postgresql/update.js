@@ -0,0 +1,15 @@
+// Update {{ model_var }}: one UPDATE ... RETURNING *, its row is the response
+const update{{ model_name }} = async (req, res) => {
+    const { {{ attributes_destructure }} } = req.body;
+    const [, [updated]] = await {{ model_name }}.update(
+        { {{ attributes_destructure }} }, 
+        {
+            where: { id: req.params.id, deletedAt: null },
+            returning: true
+        }
+    );
+    if (!updated) {
+        throw new NotFoundError('{{ model_name }} not found');
+    }{{ invalidate }}
+    res.status(StatusCodes.OK).json({ {{ model_var }}: updated.get({ plain: true }) });
+};
@@ -0,0 +1,44 @@
+const fs = require('fs');
+const path = require('path');
+const { Umzug, SequelizeStorage } = require('umzug');
+const sequelize = require('./connect');
+
+// Versioned migrations, applied in file name order and recorded in the SequelizeMeta table
+const directory = path.join(__dirname, '..', 'migrations');
+const migrations = fs.existsSync(directory)
+  ? fs.readdirSync(directory).filter((file) => file.endsWith('.js')).sort().map((file) => {
+      const migration = require(path.join(directory, file));
+      return { name: file, up: migration.up, down: migration.down };
+    })
+  : [];
+
+const umzug = new Umzug({
+  migrations,
+  context: sequelize.getQueryInterface(),
+  storage: new SequelizeStorage({ sequelize }),
+  logger: console
+});
+
+const commands = {
+  up: () => umzug.up(),
+  down: () => umzug.down(),
+  pending: async () => (await umzug.pending()).forEach(({ name }) => console.log(name)),
+  executed: async () => (await umzug.executed()).forEach(({ name }) => console.log(name))
+};
+
+module.exports = umzug;
+
+if (require.main === module) {
+  // npm run migrate, npm run migrate:undo, node db/migrate.js pending
+  const command = commands[process.argv[2] || 'up'];
+  if (!command) {
+    console.error(`Usage: node db/migrate.js [${Object.keys(commands).join('|')}]`);
+    process.exit(1);
+  }
+  command()
+    .catch((error) => {
+      console.error("Migration failed:", error);
+      process.exitCode = 1;
+    })
+    .finally(() => sequelize.close());
+}
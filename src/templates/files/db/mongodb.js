@@ -0,0 +1,57 @@
+const mongoose = require("mongoose");
+
+// Connection pool settings, per process: DB_* environment variables, else per-environment defaults
+const production = process.env.NODE_ENV === 'production';
+const setting = (name, fallback) => (process.env[name] ? Number(process.env[name]) : fallback);
+
+const options = {
+  maxPoolSize: setting('DB_POOL_MAX', production ? {{ max }} : {{ development_max }}),
+  minPoolSize: setting('DB_POOL_MIN', production ? {{ min }} : {{ development_min }}),
+  maxIdleTimeMS: setting('DB_POOL_IDLE_MS', {{ idle_ms }}),
+  waitQueueTimeoutMS: setting('DB_POOL_ACQUIRE_MS', {{ acquire_ms }}),
+  socketTimeoutMS: setting('DB_SOCKET_TIMEOUT_MS', {{ socket_timeout_ms }}),
+  serverSelectionTimeoutMS: setting('DB_SERVER_SELECTION_TIMEOUT_MS', 5000)
+};
+// Building indexes on every boot is for development: production creates them once, on purpose
+mongoose.set('autoIndex', process.env.DB_AUTO_INDEX ? process.env.DB_AUTO_INDEX === 'true' : {{ auto_index }});
+
+// Connection pool counters, from the driver's connection monitoring events
+const pool = { created: 0, closed: 0, checkedOut: 0, checkedIn: 0, checkOutStarted: 0, checkOutFailed: 0 };
+
+const monitorPool = (client) => {
+  client.on('connectionCreated', () => { pool.created += 1; });
+  client.on('connectionClosed', () => { pool.closed += 1; });
+  client.on('connectionCheckOutStarted', () => { pool.checkOutStarted += 1; });
+  client.on('connectionCheckOutFailed', () => { pool.checkOutFailed += 1; });
+  client.on('connectionCheckedOut', () => { pool.checkedOut += 1; });
+  client.on('connectionCheckedIn', () => { pool.checkedIn += 1; });
+};
+
+// Connections in use, idle and requests waiting for one, in this process
+const poolStats = () => {
+  const open = pool.created - pool.closed;
+  const inUse = pool.checkedOut - pool.checkedIn;
+  return {
+    inUse,
+    idle: open - inUse,
+    waiting: pool.checkOutStarted - pool.checkedOut - pool.checkOutFailed,
+    max: options.maxPoolSize
+  };
+};
+
+const connectDB = async (url) => {
+  try {
+    // The pool is monitored before connecting, so the connections opened for minPoolSize are counted too
+    const client = new mongoose.mongo.MongoClient(url, options);
+    monitorPool(client);
+    await client.connect();
+    mongoose.connection.setClient(client);
+    console.log("MongoDB connection successful");
+  } catch (error) {
+    console.error("MongoDB connection failed:", error);
+    process.exit(1);
+  }
+};
+
+module.exports = connectDB;
+module.exports.poolStats = poolStats;
@@ -0,0 +1,34 @@
+const { Sequelize } = require('sequelize');
+require('dotenv').config();
+
+// Connection pool settings, per process: DB_* environment variables, else per-environment defaults
+const production = process.env.NODE_ENV === 'production';
+const setting = (name, fallback) => (process.env[name] ? Number(process.env[name]) : fallback);
+
+const sequelize = new Sequelize(
+  process.env.POSTGRES_URL, 
+{
+  dialect: 'postgres',
+  logging: false,
+  pool: {
+      max: setting('DB_POOL_MAX', production ? {{ max }} : {{ development_max }}),
+      min: setting('DB_POOL_MIN', production ? {{ min }} : {{ development_min }}),
+      acquire: setting('DB_POOL_ACQUIRE_MS', {{ acquire_ms }}),
+      idle: setting('DB_POOL_IDLE_MS', {{ idle_ms }})
+  }
+}
+);
+
+// Connections in use, idle and requests waiting for one, in this process
+const poolStats = () => {
+  const pool = sequelize.connectionManager.pool;
+  return {
+    inUse: pool.using,
+    idle: pool.available,
+    waiting: pool.waiting,
+    max: pool.maxSize
+  };
+};
+
+module.exports = sequelize
+module.exports.poolStats = poolStats;
@@ -0,0 +1,63 @@
+require('dotenv').config();
+require("express-async-errors");
+
+// middleware 
+{{ middleware_imports }}
+
+const express = require("express");
+const app = express();
+
+{{ db_import }}
+
+// routes import
+{{ routes_import }}
+
+// Middleware uses
+{{ middleware_uses }}
+
+// Bulk requests carry many items: raise the 100kb default
+app.use(express.json({ limit: process.env.JSON_BODY_LIMIT || '1mb' }));
+
+// routes 
+{{ routes_use }}
+
+// Basic route
+app.get("/", (req, res) => {
+  res.json({
+    "message": "Welcome to the Express API",
+    "timestamp": new Date().toISOString()
+  });
+});
+
+
+
+// Not Found Middleware
+const notFound = require("./middleware/not-found");
+app.use(notFound);
+
+// Error Handler Middleware
+const errorHandler = require("./middleware/error-handler");
+app.use(errorHandler);
+
+const port = process.env.PORT || 5000;
+
+const start = async () => {
+  try {
+    console.log("Connecting to the database...")
+    {{ db_connection }}
+    console.log("{{ db_name }} connection established.");
+    const server = app.listen(port, () => {
+      console.log(`Server is listening on port ${port}...`);
+      console.log(`Environment: ${process.env.NODE_ENV || 'development'}`);
+    });
+    // Finish in-flight requests before exiting: on SIGTERM, or when the cluster primary retires this worker
+    const shutdown = () => server.close(() => process.exit(0));
+    process.on('SIGTERM', shutdown);
+    process.on('disconnect', shutdown);
+  } catch (error) {
+    console.error("Failed to start server:", error);
+    process.exit(1);
+  }
+};
+
+start();
@@ -0,0 +1,110 @@
+const { createStore } = require('../utils/cache-store');
+
+// Seconds a cached response is served before the database is read again
+const TTL = Number(process.env.CACHE_TTL) || {{ ttl }};
+const store = createStore(process.env.CACHE_STORE || '{{ store }}');
+const counters = {};
+
+const countersOf = (namespace) => {
+    if (!counters[namespace]) {
+        counters[namespace] = { hits: 0, misses: 0, invalidations: 0, errors: 0 };
+    }
+    return counters[namespace];
+};
+
+const reportError = (namespace, action) => (error) => {
+    countersOf(namespace).errors += 1;
+    console.error(`Cache ${action} failed for ${namespace}: ${error.message}`);
+};
+
+// Entries hold the handler's validators with the body, so a hit answers conditional GETs too
+const entryOf = (res, payload) => `${res.get('ETag') || ''}\n${res.get('Last-Modified') || ''}\n${payload}`;
+
+const sendEntry = (res, entry) => {
+    const etagEnd = entry.indexOf('\n');
+    const lastModifiedEnd = entry.indexOf('\n', etagEnd + 1);
+    const etag = entry.slice(0, etagEnd);
+    const lastModified = entry.slice(etagEnd + 1, lastModifiedEnd);
+    if (etag) {
+        res.set('ETag', etag);
+    }
+    if (lastModified) {
+        res.set('Last-Modified', lastModified);
+    }
+    // Express answers 304 itself when these validators match the request's
+    res.type('application/json').send(entry.slice(lastModifiedEnd + 1));
+};
+
+// Serve the cached body of a GET, or cache the handler's 200 JSON response
+const readThrough = (namespace, keyOf) => async (req, res, next) => {
+    const stats = countersOf(namespace);
+    let key;
+    try {
+        key = await keyOf(req);
+        const cached = await store.get(key);
+        if (cached !== null) {
+            stats.hits += 1;
+            sendEntry(res.set('X-Cache', 'HIT'), cached);
+            return;
+        }
+    } catch (error) {
+        // The cache is an optimization: read from the database when it is down
+        reportError(namespace, 'read')(error);
+        next();
+        return;
+    }
+    stats.misses += 1;
+    res.set('X-Cache', 'MISS');
+    const json = res.json.bind(res);
+    res.json = (body) => {
+        if (res.statusCode !== 200) {
+            return json(body);
+        }
+        const payload = JSON.stringify(body);
+        store.set(key, entryOf(res, payload), TTL).catch(reportError(namespace, 'write'));
+        return res.type('application/json').send(payload);
+    };
+    next();
+};
+
+// Pages of a collection, invalidated together by any write to it
+const list = (namespace) => readThrough(namespace, async (req) => {
+    const generation = await store.generation(`${namespace}:list`);
+    return `${namespace}:list:${generation}:${req.originalUrl}`;
+});
+
+// One item, invalidated by writes to that item
+const item = (namespace) => readThrough(namespace, async (req) => {
+    const generation = await store.generation(`${namespace}:item:${req.params.id}`);
+    return `${namespace}:item:${req.params.id}:${generation}`;
+});
+
+// Called by the controllers after a write: drops the list pages and the given items
+const invalidate = async (namespace, ids = []) => {
+    countersOf(namespace).invalidations += 1;
+    const keys = [`${namespace}:list`, ...ids.map((id) => `${namespace}:item:${id}`)];
+    await store.bump(keys, TTL).catch(reportError(namespace, 'invalidation'));
+};
+
+// GET /cache/stats: hit/miss counters of this process, per resource
+const stats = async (req, res) => {
+    const namespaces = {};
+    for (const [namespace, counter] of Object.entries(counters)) {
+        const reads = counter.hits + counter.misses;
+        namespaces[namespace] = { ...counter, hitRate: reads ? counter.hits / reads : null };
+    }
+    let storeInfo;
+    try {
+        storeInfo = await store.info();
+    } catch (error) {
+        storeInfo = { error: error.message };
+    }
+    res.json({ ttl: TTL, store: storeInfo, namespaces });
+};
+
+module.exports = {
+    list,
+    item,
+    invalidate,
+    stats
+};
@@ -0,0 +1,12 @@
+const { DataTypes, Op } = require('sequelize');
+
+// Changes of the {{ model_name }} model since its previous migration (run with `npm run migrate`)
+module.exports = {
+  async up({ context: queryInterface }) {
+{{ up }}
+  },
+
+  async down({ context: queryInterface }) {
+{{ down }}
+  }
+};
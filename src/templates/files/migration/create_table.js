@@ -0,0 +1,19 @@
+const { DataTypes, Op } = require('sequelize');
+
+// Creates the table of the {{ model_name }} model (run with `npm run migrate`)
+module.exports = {
+  async up({ context: queryInterface }) {
+    await queryInterface.createTable('{{ table_name }}', {
+      id: { type: DataTypes.INTEGER, autoIncrement: true, primaryKey: true, allowNull: false },
+{{ columns }}
+      createdAt: { type: DataTypes.DATE, allowNull: false },
+      updatedAt: { type: DataTypes.DATE, allowNull: false },
+      deletedAt: { type: DataTypes.DATE, allowNull: true }
+    });
+{{ indexes }}
+  },
+
+  async down({ context: queryInterface }) {
+    await queryInterface.dropTable('{{ table_name }}');
+  }
+};
@@ -0,0 +1,11 @@
+const mongoose = require('mongoose');
+
+const {{ model_name }}Schema = new mongoose.Schema({
+{{ fields }}
+}, {
+  timestamps: true
+});
+
+{{ indexes }}
+
+module.exports = mongoose.model('{{ model_name }}', {{ model_name }}Schema);
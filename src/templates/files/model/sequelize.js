@@ -0,0 +1,15 @@
+const { DataTypes, Op } = require('sequelize');
+const sequelize = require("../db/connect");
+
+const {{ model_name }} = sequelize.define('{{ model_name }}', {
+{{ fields }}
+}, {
+    timestamps: true,
+    paranoid: true, // Soft delete
+    tableName: '{{ table_name }}',
+    indexes: [
+{{ indexes }}
+    ]
+});
+
+module.exports = {{ model_name }};
@@ -0,0 +1,8 @@
+const express = require('express');
+const router = express.Router();
+
+{{ imports }}
+
+{{ uses }}
+
+module.exports = router;
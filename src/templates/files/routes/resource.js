@@ -0,0 +1,10 @@
+const express = require('express');
+const router = express.Router();
+{{ imports }}const {
+    {{ handlers }}
+} = require('../controllers/{{ model_var }}.controller');
+
+// Routes for {{ model_name }}
+{{ routes }}
+
+module.exports = router;
@@ -0,0 +1,137 @@
+// Database round trips per request of every generated controller, without a database.
+// Each handler runs against a model stub that counts the queries it is sent.
+// Usage: npm run bench:queries -- [model] [iterations]
+const fs = require('fs');
+const Module = require('module');
+const path = require('path');
+
+const DB_TYPE = '{{ db_type }}';
+// Exported name of each measured handler, by model (controllers/<model>.controller.js)
+const HANDLERS = {{ handlers }};
+const root = path.join(__dirname, '..');
+const [only, iterations = '10000'] = process.argv.slice(2);
+let queries = [];
+// Cache invalidations of the write handlers stay in process: no redis server needed
+process.env.CACHE_STORE = 'memory';
+
+const row = () => ({ id: 1, _id: '65f0c0ffee0000000000abcd', createdAt: new Date(), updatedAt: new Date() });
+const instance = () => ({ ...row(), get: () => row(), toJSON: () => row() });
+// A mongoose Query: chainable, thenable, one round trip when awaited
+const query = (value) => {
+  const chain = { then: (resolve, reject) => Promise.resolve(value).then(resolve, reject) };
+  for (const method of ['lean', 'select', 'sort', 'limit', 'skip', 'cursor']) chain[method] = () => chain;
+  return chain;
+};
+const results = {
+  create: () => (DB_TYPE === 'mongodb' ? row() : instance()),
+  update: (values, options) => (options && options.returning ? [1, [instance()]] : [1]),
+  destroy: () => 1,
+  findAll: () => [row()],
+  find: () => [row()],
+  count: () => 1,
+  estimatedDocumentCount: () => 1,
+};
+const counting = (modelVar) => new Proxy({ name: modelVar, tableName: `${modelVar}s`, getTableName: () => `${modelVar}s` }, {
+  get: (target, name) => (name in target ? target[name] : (...args) => {
+    queries.push(name);
+    const result = results[name] ? results[name](...args) : row();
+    return DB_TYPE === 'mongodb' ? query(result) : Promise.resolve(result);
+  })
+});
+
+// The handlers only need these constants from their packages
+const stubs = {
+  'http-status-codes': { StatusCodes: { OK: 200, CREATED: 201, BAD_REQUEST: 400, NOT_FOUND: 404, MULTI_STATUS: 207 } },
+  mongoose: { isValidObjectId: () => true },
+  sequelize: {
+    Op: new Proxy({}, { get: (target, name) => Symbol(String(name)) }),
+    ValidationError: class ValidationError extends Error {},
+    UniqueConstraintError: class UniqueConstraintError extends Error {},
+  },
+};
+const load = Module._load;
+Module._load = function (request, parent, isMain) {
+  const resolved = request.startsWith('.') ? path.resolve(path.dirname(parent.filename), request) : request;
+  for (const key of [request, resolved, `${resolved}.js`]) {
+    if (key in stubs) return stubs[key];
+  }
+  return load.apply(this, arguments);
+};
+
+const response = () => {
+  const res = { statusCode: 200, headers: {}, status(code) { res.statusCode = code; return res; }, json: () => res, end: () => res };
+  res.set = (header, value) => { res.headers[header] = value; return res; };
+  res.get = (header) => res.headers[header];
+  return res;
+};
+// Every attribute a handler reads from the body is set
+const body = new Proxy({}, { get: (target, name) => (typeof name === 'string' ? 'a' : undefined) });
+const request = ({ params = {}, headers = {} } = {}) => ({ params, body, query: {}, get: (header) => headers[header] });
+
+const measure = async (controller, modelVar) => {
+  const handlers = HANDLERS[modelVar];
+  // A client polling an item it already has: the ETag is the one of a first, unconditional read
+  const unchanged = async () => {
+    const res = response();
+    await controller[handlers.get](request({ params: { id: '1' } }), res);
+    return request({ params: { id: '1' }, headers: { 'If-None-Match': res.headers.ETag } });
+  };
+  const scenarios = {
+    create: [handlers.create, () => request()],
+    get: [handlers.get, () => request({ params: { id: '1' } })],
+    poll: [handlers.get, unchanged],
+    update: [handlers.update, () => request({ params: { id: '1' } })],
+    delete: [handlers.delete, () => request({ params: { id: '1' } })],
+    list: [handlers.list, () => request()],
+  };
+  const missing = Object.values(scenarios).map(([handler]) => handler).filter((handler) => typeof controller[handler] !== 'function');
+  if (missing.length) {
+    throw new Error(`controllers/${modelVar}.controller.js does not export ${[...new Set(missing)].join(', ')}`);
+  }
+  const report = {};
+  for (const [scenario, [handler, build]] of Object.entries(scenarios)) {
+    const req = await build();
+    queries = [];
+    const res = response();
+    await controller[handler](req, res);
+    const perRequest = queries.slice();
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < Number(iterations); i += 1) {
+      await controller[handler](req, response());
+    }
+    const elapsed = Number(process.hrtime.bigint() - start) / 1e3 / Number(iterations);
+    report[scenario] = { handler, status: res.statusCode, queries: perRequest, microseconds: Math.round(elapsed * 100) / 100 };
+  }
+  return report;
+};
+
+(async () => {
+  const directory = path.join(root, 'controllers');
+  const modelVars = Object.keys(HANDLERS).filter((modelVar) => !only || modelVar === only);
+  if (!modelVars.length) {
+    throw new Error(only ? `No model '${only}' (choose from ${Object.keys(HANDLERS).join(', ')})` : 'No controllers to measure');
+  }
+  const report = {};
+  for (const modelVar of modelVars) {
+    const file = path.join(directory, `${modelVar}.controller.js`);
+    if (!fs.existsSync(file)) throw new Error(`No controllers/${modelVar}.controller.js`);
+    stubs[path.join(root, 'models', `${modelVar}.model.js`)] = counting(modelVar);
+    report[modelVar] = await measure(require(file), modelVar);
+  }
+  if (process.env.QUERY_COUNT_JSON) {
+    console.log(JSON.stringify(report));
+    return;
+  }
+  for (const [modelVar, scenarios] of Object.entries(report)) {
+    for (const [scenario, measured] of Object.entries(scenarios)) {
+      console.log(
+        `${modelVar.padEnd(16)} ${scenario.padEnd(7)} ${String(measured.status).padStart(3)}`
+        + ` ${String(measured.queries.length).padStart(2)} queries ${String(measured.microseconds).padStart(8)} us/req`
+        + `  ${measured.queries.join(', ')}`
+      );
+    }
+  }
+})().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,96 @@
+require('dotenv').config();
+const cluster = require('cluster');
+const os = require('os');
+
+// Cluster primary: runs index.js in WEB_CONCURRENCY workers (default: one per available CPU).
+//   SIGHUP            rolling reload, one worker at a time, without dropping requests
+//   SIGTERM / SIGINT  graceful shutdown
+const WORKERS = Number(process.env.WEB_CONCURRENCY) || (os.availableParallelism ? os.availableParallelism() : os.cpus().length);
+// Time a worker gets to finish its requests before it is killed
+const SHUTDOWN_TIMEOUT = Number(process.env.SHUTDOWN_TIMEOUT_MS) || 10000;
+// Crash restarts back off from 1s up to 30s, and reset once a worker stayed up a minute
+const RESTART_DELAY = 1000;
+const MAX_RESTART_DELAY = 30000;
+const STABLE_AFTER = 60000;
+
+if (!cluster.isPrimary) {
+    require('./index');
+} else {
+    let crashes = 0;
+    let stopping = false;
+    let reloading = false;
+
+    const fork = () => {
+        const worker = cluster.fork();
+        worker.startedAt = Date.now();
+        return worker;
+    };
+
+    // Disconnect a worker so it finishes in-flight requests, kill it if it takes too long
+    const retire = (worker) => new Promise((resolve) => {
+        const timer = setTimeout(() => worker.process.kill('SIGKILL'), SHUTDOWN_TIMEOUT);
+        worker.once('exit', () => {
+            clearTimeout(timer);
+            resolve();
+        });
+        worker.disconnect();
+    });
+
+    cluster.on('exit', (worker, code, signal) => {
+        // A worker the primary disconnected (reload, shutdown) did not crash
+        if (stopping || worker.exitedAfterDisconnect) {
+            return;
+        }
+        crashes = Date.now() - worker.startedAt > STABLE_AFTER ? 1 : crashes + 1;
+        const delay = Math.min(RESTART_DELAY * 2 ** (crashes - 1), MAX_RESTART_DELAY);
+        console.error(`Worker ${worker.process.pid} died (${signal || code}), restarting in ${delay}ms`);
+        setTimeout(() => {
+            if (!stopping) {
+                fork();
+            }
+        }, delay);
+    });
+
+    // Replace workers one by one: the new one listens before the old one stops accepting
+    const reload = async () => {
+        if (reloading || stopping) {
+            return;
+        }
+        reloading = true;
+        console.log(`Reloading ${Object.keys(cluster.workers).length} workers...`);
+        for (const worker of Object.values(cluster.workers)) {
+            const replacement = fork();
+            const started = await new Promise((resolve) => {
+                replacement.once('listening', () => resolve(true));
+                replacement.once('exit', () => resolve(false));
+            });
+            if (!started) {
+                // Keep the old workers serving, the crashed one is restarted as usual
+                console.error('A new worker failed to start, reload aborted');
+                break;
+            }
+            await retire(worker);
+        }
+        reloading = false;
+        console.log('Reload finished');
+    };
+
+    const shutdown = async () => {
+        if (stopping) {
+            return;
+        }
+        stopping = true;
+        console.log('Shutting down workers...');
+        await Promise.all(Object.values(cluster.workers).map(retire));
+        process.exit(0);
+    };
+
+    process.on('SIGHUP', reload);
+    process.on('SIGTERM', shutdown);
+    process.on('SIGINT', shutdown);
+
+    console.log(`Primary ${process.pid} starting ${WORKERS} workers`);
+    for (let i = 0; i < WORKERS; i++) {
+        fork();
+    }
+}
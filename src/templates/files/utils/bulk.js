@@ -0,0 +1,72 @@
+const { StatusCodes } = require('http-status-codes');
+const { BadRequestError } = require('../errors');
+
+// Items or ids accepted by one bulk request
+const MAX_BULK_ITEMS = Number(process.env.BULK_MAX_ITEMS) || {{ max_items }};
+
+const checkSize = (count) => {
+    if (count > MAX_BULK_ITEMS) {
+        throw new BadRequestError(`At most ${MAX_BULK_ITEMS} items per request, got ${count}`);
+    }
+};
+
+// Body of a bulk create or update: a non-empty array of objects
+const bulkItems = (body) => {
+    if (!Array.isArray(body) || !body.length) {
+        throw new BadRequestError('Expected a non-empty array of items');
+    }
+    checkSize(body.length);
+    if (body.some((item) => typeof item !== 'object' || item === null || Array.isArray(item))) {
+        throw new BadRequestError('Every item must be an object');
+    }
+    return body;
+};
+
+// Ids of a multi-get or bulk delete: an array, or a comma separated string (?ids=a,b)
+const bulkIds = (value) => {
+    const ids = Array.isArray(value) ? value : String(value ?? '').split(',');
+    const unique = [...new Set(ids.map((id) => String(id).trim()).filter(Boolean))];
+    if (!unique.length) {
+        throw new BadRequestError('Expected a non-empty list of ids');
+    }
+    checkSize(unique.length);
+    return unique;
+};
+
+const isIntegerId = (id) => /^\d+$/.test(String(id));
+
+// The model attributes set in an item
+const pick = (item, fields) => Object.fromEntries(
+    fields.filter((field) => item[field] !== undefined).map((field) => [field, item[field]])
+);
+
+// Messages of a Mongoose or Sequelize validation error
+const validationErrors = (error) => {
+    if (error && error.errors) {
+        return Object.values(error.errors).map((item) => item.message);
+    }
+    return [error ? error.message : 'Invalid item'];
+};
+
+const failed = (result, errors) => Object.assign(result, { status: 'failed', errors });
+
+// 207 Multi-Status as soon as one item failed
+const sendBulkResults = (res, results, successStatus) => {
+    const failures = results.filter((result) => result.status === 'failed').length;
+    res.status(failures ? StatusCodes.MULTI_STATUS : successStatus).json({
+        succeeded: results.length - failures,
+        failed: failures,
+        results
+    });
+};
+
+module.exports = {
+    MAX_BULK_ITEMS,
+    bulkItems,
+    bulkIds,
+    isIntegerId,
+    pick,
+    validationErrors,
+    failed,
+    sendBulkResults
+};
@@ -0,0 +1,142 @@
+// Response cache stores. Both keep:
+//   - values: serialized responses, expiring after their TTL
+//   - generations: a token per namespace or item, mixed into the value keys.
+//     Replacing a token invalidates every value cached under the old one.
+//     A token lives for a TTL: once it is gone, the values it guarded have expired too.
+
+const newToken = () => `${Date.now().toString(36)}${Math.random().toString(36).slice(2, 8)}`;
+
+// In-process LRU, bounded by entry count and by size
+class MemoryStore {
+    constructor({ maxEntries, maxBytes }) {
+        this.maxEntries = maxEntries;
+        this.maxBytes = maxBytes;
+        this.bytes = 0;
+        // Map iteration order is insertion order: the first entry is the least recently used
+        this.values = new Map();
+        this.generations = new Map();
+    }
+
+    async get(key) {
+        const entry = this.values.get(key);
+        if (!entry) {
+            return null;
+        }
+        this.values.delete(key);
+        if (entry.expiresAt <= Date.now()) {
+            this.bytes -= entry.bytes;
+            return null;
+        }
+        this.values.set(key, entry);
+        return entry.value;
+    }
+
+    async set(key, value, ttl) {
+        const bytes = Buffer.byteLength(key) + Buffer.byteLength(value);
+        if (bytes > this.maxBytes) {
+            return;
+        }
+        const previous = this.values.get(key);
+        if (previous) {
+            this.values.delete(key);
+            this.bytes -= previous.bytes;
+        }
+        this.values.set(key, { value, bytes, expiresAt: Date.now() + ttl * 1000 });
+        this.bytes += bytes;
+        for (const [oldKey, entry] of this.values) {
+            if (this.values.size <= this.maxEntries && this.bytes <= this.maxBytes) {
+                break;
+            }
+            this.values.delete(oldKey);
+            this.bytes -= entry.bytes;
+        }
+    }
+
+    async generation(key) {
+        const entry = this.generations.get(key);
+        if (!entry) {
+            return '0';
+        }
+        if (entry.expiresAt <= Date.now()) {
+            this.generations.delete(key);
+            return '0';
+        }
+        return entry.token;
+    }
+
+    async bump(keys, ttl) {
+        const now = Date.now();
+        // Tokens all live for the same TTL and are moved to the end when replaced,
+        // so the expired ones are at the front: drop them, whether they are read again or not
+        for (const [key, entry] of this.generations) {
+            if (entry.expiresAt > now) {
+                break;
+            }
+            this.generations.delete(key);
+        }
+        const expiresAt = now + ttl * 1000;
+        for (const key of keys) {
+            this.generations.delete(key);
+            this.generations.set(key, { token: newToken(), expiresAt });
+        }
+    }
+
+    async info() {
+        return { store: 'memory', entries: this.values.size, bytes: this.bytes, generations: this.generations.size };
+    }
+}
+
+// Redis, shared by every process and instance of the API (needs the redis package)
+class RedisStore {
+    constructor({ url }) {
+        const { createClient } = require('redis');
+        this.client = createClient({ url });
+        this.client.on('error', (error) => console.error(`Redis cache error: ${error.message}`));
+        this.ready = this.client.connect();
+    }
+
+    async get(key) {
+        await this.ready;
+        return this.client.get(key);
+    }
+
+    async set(key, value, ttl) {
+        await this.ready;
+        await this.client.set(key, value, { EX: ttl });
+    }
+
+    async generation(key) {
+        await this.ready;
+        return (await this.client.get(`gen:${key}`)) || '0';
+    }
+
+    async bump(keys, ttl) {
+        await this.ready;
+        const multi = this.client.multi();
+        for (const key of keys) {
+            multi.set(`gen:${key}`, newToken(), { EX: ttl });
+        }
+        await multi.exec();
+    }
+
+    async info() {
+        await this.ready;
+        return { store: 'redis', entries: await this.client.dbSize() };
+    }
+}
+
+const createStore = (type) => {
+    if (type === 'redis') {
+        return new RedisStore({ url: process.env.REDIS_URL || 'redis://localhost:6379' });
+    }
+    return new MemoryStore({
+        maxEntries: Number(process.env.CACHE_MAX_ENTRIES) || {{ max_entries }},
+        maxBytes: (Number(process.env.CACHE_MAX_SIZE_MB) || {{ max_size_mb }}) * 1024 * 1024
+    });
+};
+
+module.exports = {
+    MemoryStore,
+    RedisStore,
+    createStore
+};
@@ -0,0 +1,54 @@
+const crypto = require('crypto');
+
+// Conditional GETs: validators from updatedAt (and the version key), checked before a body is serialized
+
+// The request carries a validator of a representation the client already has
+const isConditional = (req) => req.get('If-None-Match') !== undefined || req.get('If-Modified-Since') !== undefined;
+
+// Weak validators of one row: they change with every write to it
+const validatorsOf = (row) => {
+    const updatedAt = new Date(row.updatedAt);
+    const version = row.__v === undefined ? '' : `-${row.__v}`;
+    return { etag: `W/"${updatedAt.getTime()}${version}"`, lastModified: updatedAt };
+};
+
+// Weak validator of a list page: which rows it holds, in order, and their versions
+const pageValidators = (rows, idField, ...extra) => {
+    const hash = crypto.createHash('sha1');
+    for (const row of rows) {
+        hash.update(`${row[idField]}:${new Date(row.updatedAt).getTime()}:${row.__v === undefined ? '' : row.__v},`);
+    }
+    hash.update(JSON.stringify(extra));
+    return { etag: `W/"${rows.length}-${hash.digest('base64url').slice(0, 16)}"`, lastModified: null };
+};
+
+const opaque = (etag) => etag.trim().replace(/^W\//, '');
+
+// Set the validators and answer 304 Not Modified when the client's copy is current
+const notModified = (req, res, { etag, lastModified }) => {
+    res.set('ETag', etag);
+    if (lastModified) {
+        res.set('Last-Modified', lastModified.toUTCString());
+    }
+    const ifNoneMatch = req.get('If-None-Match');
+    let fresh;
+    if (ifNoneMatch !== undefined) {
+        // Weak comparison, If-Modified-Since is ignored when If-None-Match is sent
+        fresh = ifNoneMatch.trim() === '*' || ifNoneMatch.split(',').some((tag) => opaque(tag) === opaque(etag));
+    } else {
+        const since = Date.parse(req.get('If-Modified-Since') || '');
+        // HTTP dates have a one second resolution
+        fresh = Boolean(lastModified) && !Number.isNaN(since) && Math.floor(lastModified.getTime() / 1000) * 1000 <= since;
+    }
+    if (fresh) {
+        res.status(304).end();
+    }
+    return fresh;
+};
+
+module.exports = {
+    isConditional,
+    validatorsOf,
+    pageValidators,
+    notModified
+};
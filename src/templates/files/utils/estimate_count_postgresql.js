@@ -0,0 +1,10 @@
+// Planner estimate of the row count (no table scan), exact count for tables never analyzed
+const estimateCount = async (Model) => {
+    const table = Model.sequelize.getQueryInterface().queryGenerator.quoteTable(Model.getTableName());
+    const [rows] = await Model.sequelize.query(
+        'SELECT reltuples::bigint AS estimate FROM pg_class WHERE oid = to_regclass(:table)',
+        { replacements: { table } }
+    );
+    const estimate = rows.length ? Number(rows[0].estimate) : -1;
+    return estimate >= 0 ? estimate : Model.count();
+};
@@ -0,0 +1,46 @@
+const { StatusCodes } = require('http-status-codes');
+
+// Rows read from the database per round trip of an export
+const EXPORT_BATCH_SIZE = Number(process.env.EXPORT_BATCH_SIZE) || 1000;
+
+// Resolves once the socket buffer has room again, or the client is gone
+const drained = (res) => new Promise((resolve) => {
+    const done = () => {
+        res.off('drain', done);
+        res.off('close', done);
+        resolve();
+    };
+    res.on('drain', done);
+    res.on('close', done);
+});
+
+// Stream rows (any async iterable) as newline-delimited JSON, one row in memory at a time
+const streamNdjson = async (res, rows, filename) => {
+    res.status(StatusCodes.OK);
+    res.setHeader('Content-Type', 'application/x-ndjson');
+    res.setHeader('Content-Disposition', `attachment; filename="${filename}"`);
+    try {
+        for await (const row of rows) {
+            if (res.destroyed) {
+                // Leaving the loop closes the database cursor
+                break;
+            }
+            if (!res.write(`${JSON.stringify(row)}\n`)) {
+                await drained(res);
+            }
+        }
+    } catch (error) {
+        if (!res.headersSent) {
+            throw error;
+        }
+        // Too late for an error response: cut the stream so the client sees it incomplete
+        res.destroy(error);
+        return;
+    }
+    res.end();
+};
+
+module.exports = {
+    EXPORT_BATCH_SIZE,
+    streamNdjson
+};
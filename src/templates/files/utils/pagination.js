@@ -0,0 +1,68 @@
+const { BadRequestError } = require('../errors');
+
+// Page size of the list endpoints (?limit=), overridable per deployment
+const DEFAULT_PAGE_SIZE = Number(process.env.PAGE_SIZE) || {{ page_size }};
+const MAX_PAGE_SIZE = Number(process.env.MAX_PAGE_SIZE) || {{ max_page_size }};
+
+const parseLimit = (value) => {
+    if (value === undefined) {
+        return DEFAULT_PAGE_SIZE;
+    }
+    const limit = Number(value);
+    if (!Number.isInteger(limit) || limit < 1) {
+        throw new BadRequestError('limit must be a positive integer');
+    }
+    return Math.min(limit, MAX_PAGE_SIZE);
+};
+
+// Opaque cursor: createdAt and id of the last item of the previous page
+const encodeCursor = (item, idField) => {
+    return Buffer.from(JSON.stringify([item.createdAt, item[idField]])).toString('base64url');
+};
+
+const decodeCursor = (value) => {
+    if (value === undefined) {
+        return null;
+    }
+    try {
+        const [createdAt, id] = JSON.parse(Buffer.from(String(value), 'base64url').toString('utf8'));
+        const date = new Date(createdAt);
+        if (Number.isNaN(date.getTime()) || id === undefined || id === null) {
+            throw new Error('incomplete cursor');
+        }
+        return { createdAt: date, id };
+    } catch (error) {
+        throw new BadRequestError('Invalid cursor');
+    }
+};
+
+// ?fields=a,b projection, limited to the model's own attributes
+const parseFields = (value, allowed) => {
+    if (value === undefined) {
+        return null;
+    }
+    const fields = String(value).split(',').map((field) => field.trim()).filter(Boolean);
+    const unknown = fields.filter((field) => !allowed.includes(field));
+    if (unknown.length) {
+        throw new BadRequestError(`Unknown fields: ${unknown.join(', ')}`);
+    }
+    return fields;
+};
+
+// Totals are only computed when asked for (?count=true)
+const wantsCount = (value) => value === 'true' || value === '1';
+
+// Rows are fetched with limit + 1 to know whether there is a next page
+const paginate = (rows, limit, idField) => {
+    const hasMore = rows.length > limit;
+    const items = hasMore ? rows.slice(0, limit) : rows;
+    return {
+        items,
+        nextCursor: hasMore ? encodeCursor(items[items.length - 1], idField) : null
+    };
+};
+
+{{ database_helpers }}
+module.exports = {
+    {{ exports }}
+};
@@ -1,10 +1,18 @@
+from templates.registry import render
+
 def generate_index_js(
     middleware_imports: list = [],
     middleware_uses: list = [],
     use_db: bool = True,
-    db_type: str = "mongodb"
+    db_type: str = "mongodb",
+    routes: list = None
 ) -> str:
-    """Generate index.js content with database support (MongoDB or PostgreSQL)."""
+    """
+    Generate index.js content with database support (MongoDB or PostgreSQL).
+
+    routes is the route registry of RouteGenerator; when it is not empty, the
+    generated routes/index.js router is mounted under /api/v1.
+    """
     
     # Default DB connection variables
     db_import = ""
@@ -17,72 +25,26 @@ def generate_index_js(
             db_connection = "await connectDB(process.env.MONGO_URL);"
         elif db_type.lower() == "postgresql":
             db_import = 'const sequelize = require("./db/connect");'
-            db_connection = """\
-await sequelize.authenticate();
-await sequelize.sync();
-"""
+            # Tables come from `npm run migrate`: startup does not grow with the number of models
+            db_connection = "await sequelize.authenticate();"
         else:
             raise ValueError("Invalid db_type. Choose 'mongodb' or 'postgres'.")
 
-    # Generate the final index.js content
-    return f"""require('dotenv').config();
-require("express-async-errors");
-
-// middleware 
-{chr(10).join(middleware_imports)}
-
-const express = require("express");
-const app = express();
-
-{db_import}
-
-// start route import
-
-
-
-// Middleware uses
-{chr(10).join(middleware_uses)}
-
-app.use(express.json());
+    # Model routers are registered in routes/index.js
+    routes_import = ""
+    routes_use = ""
+    if routes:
+        routes_import = 'const apiRoutes = require("./routes");'
+        routes_use = 'app.use("/api/v1", apiRoutes);'
 
-// routes 
-
-
-
-// Basic route
-app.get("/", (req, res) => {{
-  res.json({{
-    "message": "Welcome to the Express API",
-    "timestamp": new Date().toISOString()
-  }});
-}});
-
-
-
-// Not Found Middleware
-const notFound = require("./middleware/not-found");
-app.use(notFound);
-
-// Error Handler Middleware
-const errorHandler = require("./middleware/error-handler");
-app.use(errorHandler);
-
-const port = process.env.PORT || 5000;
-
-const start = async () => {{
-  try {{
-    console.log("Connecting to the database...")
-    {db_connection}
-    console.log("{db_type.capitalize()} connection established.");
-    app.listen(port, () => {{
-      console.log(`Server is listening on port ${{port}}...`);
-      console.log(`Environment: ${{process.env.NODE_ENV || 'development'}}`);
-    }});
-  }} catch (error) {{
-    console.error("Failed to start server:", error);
-    process.exit(1);
-  }}
-}};
-
-start();
-"""
+    # Generate the final index.js content
+    return render(
+        'index.js',
+        middleware_imports="\n".join(middleware_imports),
+        middleware_uses="\n".join(middleware_uses),
+        db_import=db_import,
+        db_connection=db_connection,
+        db_name=(db_type or "").capitalize(),
+        routes_import=routes_import,
+        routes_use=routes_use
+    )
@@ -0,0 +1,103 @@
+import hashlib
+import os
+import re
+import threading
+from typing import Dict, List, Optional
+
+BUILTIN_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'files')
+
+# {{ name }} placeholders; JavaScript braces and ${...} template literals are left alone
+PLACEHOLDER = re.compile(r'\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}')
+
+
+class TemplateError(Exception):
+    """Raised when a template is missing or rendered without one of its variables"""
+
+
+class Template:
+    """A template parsed once into alternating literal text and placeholder names"""
+
+    def __init__(self, name: str, source: str):
+        self.name = name
+        parts = PLACEHOLDER.split(source)
+        self.literals: List[str] = parts[0::2]
+        self.fields: List[str] = parts[1::2]
+
+    def render(self, context: Dict) -> str:
+        try:
+            values = [context[field] for field in self.fields]
+        except KeyError as e:
+            raise TemplateError(f"Template '{self.name}' needs the variable {e}")
+        output = [None] * (len(self.literals) + len(values))
+        output[0::2] = self.literals
+        output[1::2] = [value if isinstance(value, str) else str(value) for value in values]
+        return ''.join(output)
+
+
+class TemplateRegistry:
+    """
+    Compiled templates, looked up by their path relative to a template directory.
+
+    A user template directory, when set, is searched before the built-in one, so
+    any single template can be overridden by a file with the same relative path.
+    Each template is read and compiled once per process.
+    """
+
+    def __init__(self, template_dir: Optional[str] = None):
+        self._template_dir = template_dir
+        self._compiled: Dict[str, Template] = {}
+        self._fingerprint: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def search_path(self) -> List[str]:
+        if self._template_dir:
+            return [self._template_dir, BUILTIN_TEMPLATE_DIR]
+        return [BUILTIN_TEMPLATE_DIR]
+
+    def set_template_dir(self, template_dir: Optional[str]):
+        """Use a user template directory (None to go back to the built-in templates)"""
+        with self._lock:
+            self._template_dir = os.path.abspath(template_dir) if template_dir else None
+            self._compiled.clear()
+            self._fingerprint = None
+
+    def get(self, name: str) -> Template:
+        template = self._compiled.get(name)
+        if template is not None:
+            return template
+        for directory in self.search_path:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                with open(path, 'r', encoding='utf-8') as file:
+                    template = Template(name, file.read())
+                break
+        else:
+            raise TemplateError(f"Template '{name}' not found in {', '.join(self.search_path)}")
+        with self._lock:
+            return self._compiled.setdefault(name, template)
+
+    def render(self, name: str, **context) -> str:
+        return self.get(name).render(context)
+
+    def fingerprint(self) -> str:
+        """Hash of every template in the search path, to detect template changes between runs"""
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for directory in self.search_path:
+                for root, _, files in sorted(os.walk(directory)):
+                    for name in sorted(files):
+                        path = os.path.join(root, name)
+                        digest.update(os.path.relpath(path, directory).encode('utf-8') + b'\0')
+                        with open(path, 'rb') as file:
+                            digest.update(file.read())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+
+registry = TemplateRegistry(os.environ.get('XPRESSGEN_TEMPLATE_DIR') or None)
+
+
+def render(name: str, **context) -> str:
+    """Render a template of the process-wide registry"""
+    return registry.render(name, **context)
@@ -1,4 +1,18 @@
-from .logger import setup_logger
-from .command_runner import CommandRunner
+import importlib
 
-__all__ = ["setup_logger", "CommandRunner"]
\ No newline at end of file
+# Submodules are loaded on first access to keep the CLI startup fast
+_EXPORTS = {
+    "setup_logger": ".logger",
+    "CommandRunner": ".command_runner",
+    "DependencyPlan": ".dependency_plan",
+    "DependencyCache": ".dependency_cache",
+    "FileTree": ".file_tree",
+    "GenerationLock": ".generation_lock",
+}
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = list(_EXPORTS)
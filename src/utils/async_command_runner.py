@@ -0,0 +1,166 @@
+import asyncio
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Coroutine, List
+
+from utils.command_runner import CommandRunner, CommandRecord, OUTPUT_TAIL_LINES, LINE_LIMIT, READER_JOIN_TIMEOUT
+
+# Seconds between two checks of whether a command has exited
+EXIT_POLL_INTERVAL = 0.05
+
+class AsyncCommandRunner(CommandRunner):
+    """
+    asyncio variant of CommandRunner.
+
+    Commands run on an event loop owned by a background thread, so they keep
+    going while the main thread shows (blocking) prompts and renders files.
+    start() returns a concurrent.futures.Future to wait on later.
+    """
+
+    def __init__(self, logger, run_log=None, default_timeout: float = None):
+        super().__init__(logger, run_log=run_log, default_timeout=default_timeout)
+        self._loop = None
+        self._thread = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever,
+                name="xpressgen-async-runner",
+                daemon=True
+            )
+            self._thread.start()
+        return self._loop
+
+    @staticmethod
+    async def _exited(process: asyncio.subprocess.Process) -> int:
+        """
+        Wait for the process itself to exit. Before Python 3.12, Process.wait()
+        also waits for its pipes to close, which a grandchild may hold open.
+        """
+        while process.returncode is None:
+            await asyncio.sleep(EXIT_POLL_INTERVAL)
+        return process.returncode
+
+    @staticmethod
+    def _close_pipes(process: asyncio.subprocess.Process):
+        """
+        Let go of the pipes a grandchild still holds open. asyncio.subprocess.Process
+        has no public close: its StreamReaders cannot close their pipe, and wait()
+        waits for the pipes before Python 3.12. Otherwise the transport stays open
+        until the grandchild exits and warns once the event loop is closed. The
+        transport is private, so an event loop without one leaves the pipes to it.
+        """
+        transport = getattr(process, '_transport', None)
+        if transport is not None:
+            transport.close()
+
+    async def _pump(self, stream: asyncio.StreamReader, tail: deque, counter: list, label: str, command_name: str):
+        """Stream a child pipe line by line to the logger, keeping only its tail"""
+        while True:
+            try:
+                raw_line = await stream.readline()
+            except ValueError:
+                # A line longer than the stream limit was dropped by asyncio
+                tail.append("<line too long>")
+                continue
+            if not raw_line:
+                break
+            counter[0] += len(raw_line)
+            line = raw_line.decode(errors="replace").rstrip()
+            tail.append(line)
+            self.logger.debug(f"[{command_name} {label}] {line}")
+
+    async def run_command_async(
+        self,
+        command: List[str],
+        error_message: str = "Command failed",
+        cwd: str = None,
+        timeout: float = None
+    ):
+        """Run a command without blocking the event loop (same contract as run_command)"""
+        timeout = timeout if timeout is not None else self.default_timeout
+        record = CommandRecord(command=list(command), started_at=time.time())
+        start = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            *self._full_command(command),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            limit=LINE_LIMIT,
+            **self._popen_options()
+        )
+        stdout_tail, stderr_tail = deque(maxlen=OUTPUT_TAIL_LINES), deque(maxlen=OUTPUT_TAIL_LINES)
+        counter = [0]
+        readers = asyncio.gather(
+            self._pump(process.stdout, stdout_tail, counter, "out", command[0]),
+            self._pump(process.stderr, stderr_tail, counter, "err", command[0]),
+        )
+        try:
+            await asyncio.wait_for(self._exited(process), timeout)
+        except asyncio.TimeoutError:
+            record.timed_out = True
+            self._kill(process)
+            await self._exited(process)
+        except asyncio.CancelledError:
+            # Don't leave npm running after the setup was abandoned
+            record.cancelled = True
+            self._kill(process)
+            await self._exited(process)
+            raise
+        finally:
+            try:
+                # wait_for cancels the readers when the deadline passes
+                await asyncio.wait_for(readers, READER_JOIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.logger.debug(f"[{command[0]}] output still open after exit, no longer read")
+                self._close_pipes(process)
+            record.duration = time.perf_counter() - start
+            record.exit_code = process.returncode
+            record.output_bytes = counter[0]
+            self.run_log.add(record)
+
+        stdout, stderr = "\n".join(stdout_tail), "\n".join(stderr_tail)
+        if record.timed_out:
+            self.logger.error(f"{error_message}. Timed out after {timeout}s")
+            raise subprocess.TimeoutExpired(command, timeout, stdout, stderr)
+        if process.returncode != 0:
+            self.logger.error(f"{error_message}. Error: {stderr}")
+            raise subprocess.CalledProcessError(process.returncode, command, stdout, stderr)
+        self.logger.info(f"Executed: {' '.join(command)} ({record.duration:.2f}s)")
+        return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+    def submit(self, coroutine: Coroutine) -> Future:
+        """Schedule a coroutine on the background loop"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop())
+
+    def start(self, command: List[str], error_message: str = "Command failed", cwd: str = None, timeout: float = None) -> Future:
+        """Start a command in the background"""
+        return self.submit(self.run_command_async(command, error_message, cwd, timeout))
+
+    def cancel(self):
+        """Cancel every command running on the background loop (and the synchronous ones)"""
+        super().cancel()
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._cancel_all(), self._loop).result()
+
+    async def _cancel_all(self):
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self):
+        """Cancel whatever is still running and stop the background loop"""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._cancel_all(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
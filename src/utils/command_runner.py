@@ -1,38 +1,246 @@
 import subprocess
 import logging
-from typing import List
+from typing import List, Optional
 import os
 import platform
+import signal
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Lines of output kept per stream for error messages; everything else is streamed
+OUTPUT_TAIL_LINES = 200
+LINE_LIMIT = 64 * 1024
+# Seconds to wait for the output of a finished or killed command: a grandchild
+# that escaped the kill may hold its pipes open
+READER_JOIN_TIMEOUT = 5
+
+@lru_cache(maxsize=None)
+def detect_os() -> str:
+    """Platform of this process, detected once"""
+    os_name = (platform.system()).lower()
+    if "windows" in os_name :
+        return "Windows"
+    elif  "darwin" in os_name:
+        return "macOS"
+    elif  "linux" in os_name:
+        return "Linux"
+    else:
+        raise Exception(f"Unsupported operating system: {os_name}")
+
+class CommandCancelled(Exception):
+    """Raised when a running command was stopped through cancel()"""
+
+@dataclass
+class CommandRecord:
+    """One executed command in the run log"""
+    command: List[str]
+    started_at: float
+    duration: float = 0.0
+    exit_code: Optional[int] = None
+    output_bytes: int = 0
+    timed_out: bool = False
+    cancelled: bool = False
+
+    @property
+    def finished_at(self) -> float:
+        return self.started_at + self.duration
+
+    @property
+    def succeeded(self) -> bool:
+        return self.exit_code == 0 and not self.timed_out and not self.cancelled
+
+class RunLog:
+    """Thread-safe log of every command a runner executed"""
+
+    def __init__(self):
+        self._records: List[CommandRecord] = []
+        self._lock = threading.Lock()
+
+    def add(self, record: CommandRecord):
+        with self._lock:
+            self._records.append(record)
+
+    def records(self, program: str = None, failed: bool = None) -> List[CommandRecord]:
+        """
+        Query the log
+
+        Args:
+            program (str, optional): Only commands starting with this program, e.g. 'npm'
+            failed (bool, optional): Only failed (True) or succeeded (False) commands
+        """
+        with self._lock:
+            records = list(self._records)
+        if program is not None:
+            records = [record for record in records if record.command[:1] == [program]]
+        if failed is not None:
+            records = [record for record in records if record.succeeded != failed]
+        return records
+
+    def total_duration(self, program: str = None) -> float:
+        return sum(record.duration for record in self.records(program))
+
+    def summary(self) -> List[dict]:
+        return [
+            {
+                'command': ' '.join(record.command),
+                'duration': round(record.duration, 3),
+                'exit_code': record.exit_code,
+                'output_bytes': record.output_bytes,
+                'timed_out': record.timed_out,
+                'cancelled': record.cancelled,
+            }
+            for record in self.records()
+        ]
 
 class CommandRunner:
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, run_log: RunLog = None, default_timeout: float = None):
         self.logger = logger
+        self.run_log = run_log or RunLog()
+        self.default_timeout = default_timeout
+        self._processes = set()
+        self._cancelled_processes = set()
+        self._processes_lock = threading.Lock()
+
     def detect_os(self) -> str:
-        os_name = (platform.system()).lower()
-        if "windows" in os_name :
-            return "Windows"
-        elif  "darwin" in os_name:
-            return "macOS"
-        elif  "linux" in os_name:
-            return "Linux"
-        else:
-            raise Exception(f"Unsupported operating system: {os_name}")
-    def run_command(self, command: List[str], error_message: str = "Command failed"):
-        """Run shell command with error handling"""
-        self.os_type = self.detect_os()
-        if self.os_type == "Windows":
-            full_command = ["powershell"] + command
-        else:
-            full_command = command
+        return detect_os()
+
+    def _full_command(self, command: List[str]) -> List[str]:
+        if self.detect_os() == "Windows":
+            return ["powershell"] + command
+        return command
+
+    def _popen_options(self) -> dict:
+        # Own process group, so a kill also reaches the children npm spawns
+        if self.detect_os() == "Windows":
+            return {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+        return {'start_new_session': True}
+
+    def _kill(self, process):
+        if self.detect_os() == "Windows":
+            # process is the powershell wrapper: kill the whole tree under it (npm, node, ...)
+            try:
+                subprocess.run(
+                    ["taskkill", "/T", "/F", "/PID", str(process.pid)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=READER_JOIN_TIMEOUT
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+            # returncode, unlike poll(), exists on both Popen and asyncio processes
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except OSError:
+                    # It exited since returncode was last updated
+                    pass
+            return
         try:
-            result = subprocess.run(
-                full_command, 
-                check=True, 
-                capture_output=True, 
-                text=True
-            )
-            self.logger.info(f"Executed: {' '.join(command)}")
-            return result
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"{error_message}. Error: {e.stderr}")
-            raise
\ No newline at end of file
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    def _pump(self, stream, tail: deque, counter: list, label: str, command_name: str):
+        """Stream a child pipe line by line to the logger, keeping only its tail"""
+        for raw_line in iter(lambda: stream.readline(LINE_LIMIT), b''):
+            counter[0] += len(raw_line)
+            line = raw_line.decode(errors="replace").rstrip()
+            tail.append(line)
+            self.logger.debug(f"[{command_name} {label}] {line}")
+        stream.close()
+
+    def run_command(
+        self,
+        command: List[str],
+        error_message: str = "Command failed",
+        timeout: float = None,
+        cwd: str = None
+    ):
+        """
+        Run a command, streaming its output to the logger
+
+        Args:
+            command (List[str]): The command and its arguments
+            error_message (str, optional): Logged when the command fails
+            timeout (float, optional): Seconds before the command is killed. Defaults to default_timeout.
+            cwd (str, optional): Working directory of the command
+
+        Raises:
+            subprocess.CalledProcessError: The command exited with a non-zero code
+            subprocess.TimeoutExpired: The command ran longer than the timeout
+            CommandCancelled: cancel() was called while the command ran
+        """
+        timeout = timeout if timeout is not None else self.default_timeout
+        record = CommandRecord(command=list(command), started_at=time.time())
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            self._full_command(command),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+            **self._popen_options()
+        )
+        with self._processes_lock:
+            self._processes.add(process)
+
+        stdout_tail, stderr_tail = deque(maxlen=OUTPUT_TAIL_LINES), deque(maxlen=OUTPUT_TAIL_LINES)
+        counter = [0]
+        readers = [
+            threading.Thread(target=self._pump, args=(process.stdout, stdout_tail, counter, "out", command[0]), daemon=True),
+            threading.Thread(target=self._pump, args=(process.stderr, stderr_tail, counter, "err", command[0]), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            record.timed_out = True
+            self._kill(process)
+            process.wait()
+        except BaseException:
+            # KeyboardInterrupt and friends: never leave the child behind
+            record.cancelled = True
+            self._kill(process)
+            process.wait()
+            raise
+        finally:
+            deadline = time.monotonic() + READER_JOIN_TIMEOUT
+            for reader in readers:
+                reader.join(max(0, deadline - time.monotonic()))
+                if reader.is_alive():
+                    self.logger.debug(f"[{command[0]}] output still open after exit, no longer read")
+            with self._processes_lock:
+                self._processes.discard(process)
+                if process in self._cancelled_processes:
+                    self._cancelled_processes.discard(process)
+                    record.cancelled = True
+            record.duration = time.perf_counter() - start
+            record.exit_code = process.returncode
+            record.output_bytes = counter[0]
+            self.run_log.add(record)
+
+        stdout, stderr = "\n".join(stdout_tail), "\n".join(stderr_tail)
+        if record.timed_out:
+            self.logger.error(f"{error_message}. Timed out after {timeout}s")
+            raise subprocess.TimeoutExpired(command, timeout, stdout, stderr)
+        if record.cancelled:
+            self.logger.error(f"{error_message}. Cancelled")
+            raise CommandCancelled(f"{' '.join(command)} was cancelled")
+        if process.returncode != 0:
+            self.logger.error(f"{error_message}. Error: {stderr}")
+            raise subprocess.CalledProcessError(process.returncode, command, stdout, stderr)
+
+        self.logger.info(f"Executed: {' '.join(command)} ({record.duration:.2f}s)")
+        return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+    def cancel(self):
+        """Kill every command currently running through this runner"""
+        with self._processes_lock:
+            processes = list(self._processes)
+            self._cancelled_processes.update(processes)
+        for process in processes:
+            self._kill(process)
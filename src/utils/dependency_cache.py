@@ -0,0 +1,221 @@
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import time
+from typing import Optional
+
+from utils.dependency_plan import DependencyPlan
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')),
+    'xpressgen',
+    'deps'
+)
+METADATA_FILE = '.xpressgen-cache.json'
+CACHED_FILES = ['package.json', 'package-lock.json']
+
+
+def _link_or_copy(src: str, dst: str):
+    """Hardlink a file, falling back to a copy across filesystems"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _tree_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+class CacheLock:
+    """
+    Lock on one cache key, shared between processes.
+
+    Runs that resolve the same dependency set (e.g. the services of a fleet)
+    take it exclusively around restore-or-install, so the set is installed
+    once and every other run restores it. Restores hold it shared and
+    eviction exclusively, so an entry is never removed while it is copied.
+    Without fcntl (Windows) locking is a no-op: concurrent misses simply
+    install twice, and a restore broken by an eviction falls back to npm.
+    """
+
+    def __init__(self, path: str, shared: bool = False):
+        self.path = path
+        self.shared = shared
+        self._file = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Take the lock. Returns False when blocking is False and another process holds it."""
+        try:
+            import fcntl
+        except ImportError:
+            return True
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, 'a')
+        flags = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+        try:
+            fcntl.flock(self._file, flags if blocking else flags | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self._file.close()
+            self._file = None
+            return False
+        return True
+
+    def release(self):
+        if self._file is None:
+            return
+        import fcntl
+        fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+class DependencyCache:
+    """
+    Content-addressed cache of installed node_modules trees.
+
+    Each entry is keyed by the resolved dependency set and holds the
+    package.json / package-lock.json pair plus a node_modules snapshot.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        cache_dir: Optional[str] = None,
+        max_size_mb: int = 2048,
+        max_age_days: int = 30,
+    ):
+        self.logger = logger
+        self.cache_dir = os.path.abspath(cache_dir or os.environ.get('XPRESSGEN_CACHE_DIR') or DEFAULT_CACHE_DIR)
+        self.max_size = max_size_mb * 1024 * 1024
+        self.max_age = max_age_days * 24 * 60 * 60
+
+    def key(self, plan: DependencyPlan) -> str:
+        """Hash of the dependency set and the platform it was installed on"""
+        payload = json.dumps({
+            'dependencies': sorted(plan.dependencies.items()),
+            'devDependencies': sorted(plan.dev_dependencies.items()),
+            'platform': [platform.system(), platform.machine()],
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def restore(self, key: str, project_dir: str = '.') -> bool:
+        """Link a cached node_modules into the project. Returns False on a cache miss."""
+        entry = self.entry_path(key)
+        if not os.path.isfile(os.path.join(entry, METADATA_FILE)):
+            return False
+
+        target_modules = os.path.join(project_dir, 'node_modules')
+        if os.path.exists(target_modules):
+            shutil.rmtree(target_modules)
+        try:
+            shutil.copytree(
+                os.path.join(entry, 'node_modules'),
+                target_modules,
+                symlinks=True,
+                copy_function=_link_or_copy
+            )
+            lockfile = os.path.join(entry, 'package-lock.json')
+            if os.path.exists(lockfile):
+                shutil.copy2(lockfile, os.path.join(project_dir, 'package-lock.json'))
+        except (OSError, shutil.Error) as e:
+            # The entry went away mid-copy (evicted without locking): leave no partial tree behind
+            self.logger.warning(f"Failed to restore dependencies from cache: {e}")
+            shutil.rmtree(target_modules, ignore_errors=True)
+            return False
+
+        # The entry's mtime is its last-use time for eviction
+        os.utime(entry)
+        self.logger.info(f"⚡ Restored node_modules from cache ({key})")
+        return True
+
+    def store(self, key: str, project_dir: str = '.'):
+        """Snapshot the project's installed dependencies into the cache"""
+        source_modules = os.path.join(project_dir, 'node_modules')
+        if not os.path.isdir(source_modules):
+            return
+        entry = self.entry_path(key)
+        if os.path.exists(entry):
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        staging = os.path.join(self.cache_dir, f".tmp-{key}-{os.getpid()}")
+        try:
+            shutil.copytree(source_modules, os.path.join(staging, 'node_modules'), symlinks=True, copy_function=_link_or_copy)
+            for name in CACHED_FILES:
+                path = os.path.join(project_dir, name)
+                if os.path.exists(path):
+                    shutil.copy2(path, os.path.join(staging, name))
+            with open(os.path.join(staging, METADATA_FILE), 'w') as file:
+                json.dump({
+                    'key': key,
+                    'size': _tree_size(staging),
+                    'created': time.time(),
+                }, file)
+            # Publish the entry in one step so readers never see a partial snapshot
+            os.rename(staging, entry)
+            self.logger.info(f"✅ Stored node_modules in cache ({key})")
+        except OSError as e:
+            self.logger.warning(f"Failed to store dependencies in cache: {e}")
+        finally:
+            if os.path.exists(staging):
+                shutil.rmtree(staging, ignore_errors=True)
+
+    def lock(self, key: str, shared: bool = False) -> CacheLock:
+        """Inter-process lock of one entry (see CacheLock)"""
+        return CacheLock(os.path.join(self.cache_dir, f".lock-{key}"), shared=shared)
+
+    def evict(self):
+        """Remove entries unused for longer than max_age, then least recently used ones until under max_size"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        now = time.time()
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, name)
+            try:
+                with open(os.path.join(entry, METADATA_FILE)) as file:
+                    size = json.load(file).get('size', 0)
+                last_used = os.stat(entry).st_mtime
+            except (OSError, ValueError):
+                # Leftover staging directories or foreign files
+                if name.startswith('.tmp-') and now - os.stat(entry).st_mtime > 24 * 60 * 60:
+                    shutil.rmtree(entry, ignore_errors=True)
+                continue
+            entries.append((last_used, size, entry))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for last_used, size, entry in entries:
+            if now - last_used <= self.max_age and total <= self.max_size:
+                continue
+            # Entries being restored or installed by another run are left for a later eviction
+            lock = self.lock(os.path.basename(entry))
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                shutil.rmtree(entry, ignore_errors=True)
+            finally:
+                lock.release()
+            total -= size
+            self.logger.info(f"🧹 Evicted cached dependencies {os.path.basename(entry)}")
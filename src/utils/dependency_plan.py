@@ -0,0 +1,141 @@
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List
+
+# Exact versions used for every package the generator knows how to add.
+# Unknown packages fall back to "latest" so npm still resolves them.
+PINNED_VERSIONS = {
+    # core
+    'express': '4.21.2',
+    'dotenv': '16.4.7',
+    'express-async-errors': '3.1.1',
+    'http-status-codes': '2.3.0',
+    'nodemon': '3.1.9',
+    # databases
+    'mongoose': '8.9.5',
+    'sequelize': '6.37.5',
+    'pg': '8.13.1',
+    'pg-hstore': '2.3.4',
+    'umzug': '3.8.2',
+    # middleware
+    'cors': '2.8.5',
+    'helmet': '8.0.0',
+    'morgan': '1.10.0',
+    'express-rate-limit': '7.5.0',
+    'body-parser': '1.20.3',
+    'compression': '1.7.5',
+    'cookie-parser': '1.4.7',
+    'express-session': '1.18.1',
+    'passport': '0.7.0',
+    'express-validator': '7.2.1',
+    'multer': '1.4.5-lts.1',
+    'swagger-ui-express': '5.0.1',
+    # response cache store
+    'redis': '4.7.0',
+}
+
+DEFAULT_SCRIPTS = {
+    'start': 'node index.js',
+    'dev': 'nodemon index.js',
+}
+# Projects with a database: round trips per request of the generated handlers, no database needed
+QUERY_COUNT_SCRIPTS = {
+    'bench:queries': 'node scripts/query-count.js',
+}
+# PostgreSQL projects: versioned migrations, also applied before `npm run dev`
+MIGRATION_SCRIPTS = {
+    'migrate': 'node db/migrate.js up',
+    'migrate:undo': 'node db/migrate.js down',
+    'predev': 'node db/migrate.js up',
+}
+
+
+@dataclass
+class DependencyPlan:
+    """Every npm package the generated project needs, collected before a single install"""
+    dependencies: Dict[str, str] = field(default_factory=dict)
+    dev_dependencies: Dict[str, str] = field(default_factory=dict)
+
+    @staticmethod
+    def _split(spec: str):
+        """Split 'name@version' (scoped names included) into name and version"""
+        at = spec.rfind('@')
+        if at > 0:
+            return spec[:at], spec[at + 1:]
+        return spec, PINNED_VERSIONS.get(spec, 'latest')
+
+    def add(self, packages: Iterable[str], dev: bool = False):
+        """
+        Add packages to the plan
+
+        Args:
+            packages (Iterable[str]): Package names, optionally as 'name@version'
+            dev (bool, optional): Add as dev dependencies. Defaults to False.
+        """
+        for spec in packages:
+            name, version = self._split(spec)
+            if dev:
+                # A production dependency always wins over a dev one
+                if name not in self.dependencies:
+                    self.dev_dependencies[name] = version
+            else:
+                self.dev_dependencies.pop(name, None)
+                self.dependencies[name] = version
+
+    def packages(self) -> List[str]:
+        """All planned package names, production first"""
+        return list(self.dependencies) + list(self.dev_dependencies)
+
+    def is_empty(self) -> bool:
+        return not self.dependencies and not self.dev_dependencies
+
+    def package_json(self, name: str, scripts: Dict[str, str] = None) -> Dict:
+        """Build the package.json document for this plan"""
+        return {
+            'name': package_name(name),
+            'version': '1.0.0',
+            'description': '',
+            'main': 'index.js',
+            'scripts': dict(scripts or DEFAULT_SCRIPTS),
+            'keywords': [],
+            'author': '',
+            'license': 'ISC',
+            'dependencies': dict(sorted(self.dependencies.items())),
+            'devDependencies': dict(sorted(self.dev_dependencies.items())),
+        }
+
+    def render_package_json(self, name: str, scripts: Dict[str, str] = None) -> str:
+        return json.dumps(self.package_json(name, scripts), indent=2) + '\n'
+
+    def missing(self, project_dir: str = '.') -> 'DependencyPlan':
+        """The part of this plan that is not installed in the project's node_modules"""
+        def installed(name: str) -> bool:
+            return os.path.exists(os.path.join(project_dir, 'node_modules', name, 'package.json'))
+        return DependencyPlan(
+            dependencies={name: version for name, version in self.dependencies.items() if not installed(name)},
+            dev_dependencies={name: version for name, version in self.dev_dependencies.items() if not installed(name)},
+        )
+
+    def add_commands(self) -> List[List[str]]:
+        """`npm install` commands adding exactly the packages of this plan to an installed project"""
+        commands = []
+        if self.dependencies:
+            commands.append(['npm', 'install', '--save-exact'] + [f"{name}@{version}" for name, version in self.dependencies.items()])
+        if self.dev_dependencies:
+            commands.append(['npm', 'install', '--save-exact', '--save-dev'] + [f"{name}@{version}" for name, version in self.dev_dependencies.items()])
+        return commands
+
+    @staticmethod
+    def install_command(project_dir: str = '.') -> List[str]:
+        """`npm ci` when a lockfile is present, `npm install` otherwise"""
+        if os.path.exists(os.path.join(project_dir, 'package-lock.json')):
+            return ['npm', 'ci']
+        return ['npm', 'install']
+
+
+def package_name(directory_name: str) -> str:
+    """Turn a directory name into a valid npm package name, like `npm init -y` does"""
+    name = re.sub(r'[^a-z0-9._~-]+', '-', directory_name.strip().lower()).strip('-.')
+    return name or 'express-app'
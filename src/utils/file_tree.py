@@ -0,0 +1,162 @@
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set
+
+# Written in the root while flush() moves files into an existing directory
+FLUSH_MARKER = '.xpressgen-flush'
+
+
+class FileTree:
+    """
+    In-memory tree of generated files.
+
+    Generators render into the tree; nothing touches the disk until flush(),
+    which writes every file concurrently into a staging directory and then
+    moves the result into place. A new project appears in one rename. In an
+    existing directory (such as '.') each file is replaced atomically, but a
+    crash between two files leaves FLUSH_MARKER behind, see interrupted_flush().
+    """
+
+    def __init__(self, root: str = '.'):
+        self.root = root
+        self.files: Dict[str, str] = {}
+        self.directories: Set[str] = set()
+        # Running totals for profiling
+        self.bytes_rendered = 0
+        self.bytes_flushed = 0
+        # Path sets collecting writes, see recording()
+        self._recorders: List[Set[str]] = []
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        path = os.path.normpath(path).replace(os.sep, '/')
+        if path.startswith('../') or os.path.isabs(path):
+            raise ValueError(f"Generated path escapes the project root: {path}")
+        return path
+
+    def makedirs(self, path: str):
+        """Register a directory, created on flush even if it stays empty"""
+        self.directories.add(self._normalize(path))
+
+    def write(self, path: str, content: str):
+        """Add or replace a file"""
+        path = self._normalize(path)
+        self.files[path] = content
+        self.bytes_rendered += len(content.encode('utf-8'))
+        for recorder in self._recorders:
+            recorder.add(path)
+        parent = os.path.dirname(path)
+        if parent:
+            self.directories.add(parent)
+
+    def discard(self, path: str):
+        """Remove a file from the tree so flush() leaves it alone on disk"""
+        self.files.pop(self._normalize(path), None)
+
+    @contextmanager
+    def recording(self):
+        """Collect the paths written inside the block"""
+        paths: Set[str] = set()
+        self._recorders.append(paths)
+        try:
+            yield paths
+        finally:
+            self._recorders.remove(paths)
+
+    def read(self, path: str) -> Optional[str]:
+        """Content of a file rendered so far, or None"""
+        return self.files.get(self._normalize(path))
+
+    def exists(self, path: str) -> bool:
+        path = self._normalize(path)
+        return path in self.files or path in self.directories
+
+    def size(self) -> int:
+        """Total bytes currently held in the tree"""
+        return sum(len(content.encode('utf-8')) for content in self.files.values())
+
+    def _write_file(self, staging: str, path: str) -> int:
+        target = os.path.join(staging, path)
+        data = self.files[path].encode('utf-8')
+        with open(target, 'wb') as file:
+            file.write(data)
+        return len(data)
+
+    @staticmethod
+    def interrupted_flush(root: str) -> List[str]:
+        """The files an interrupted flush into root was moving into place (some may be the old ones)"""
+        try:
+            with open(os.path.join(root, FLUSH_MARKER)) as file:
+                marker = json.load(file)
+        except (OSError, ValueError):
+            return []
+        return list(marker.get('files', [])) if isinstance(marker, dict) else []
+
+    @staticmethod
+    def _write_marker(root: str, marker: Dict):
+        temporary = os.path.join(root, f"{FLUSH_MARKER}.tmp")
+        with open(temporary, 'w') as file:
+            json.dump(marker, file)
+        os.replace(temporary, os.path.join(root, FLUSH_MARKER))
+
+    def flush(self, max_workers: Optional[int] = None) -> List[str]:
+        """
+        Write the whole tree under root.
+
+        Files are written concurrently into a staging directory on the same
+        filesystem. A new root is then renamed into place in one step. An existing
+        root receives every file through an atomic rename, one file at a time:
+        FLUSH_MARKER lists them until the last one is in place, so a run that
+        stopped halfway can be detected and repaired by the next one. On any error
+        before the renames the staging directory is removed and the root is left
+        untouched.
+
+        Returns:
+            The written paths, relative to root
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        root = os.path.abspath(self.root)
+        new_root = not os.path.exists(root)
+        staging_parent = os.path.dirname(root) if new_root else root
+        os.makedirs(staging_parent, exist_ok=True)
+        if not new_root and os.path.exists(os.path.join(root, FLUSH_MARKER)):
+            # The staging directory of a flush killed before its cleanup
+            try:
+                with open(os.path.join(root, FLUSH_MARKER)) as file:
+                    leftover = json.load(file).get('staging')
+            except (OSError, ValueError, AttributeError):
+                leftover = None
+            if leftover and os.path.basename(leftover) == leftover and leftover.startswith('.xpressgen-'):
+                shutil.rmtree(os.path.join(root, leftover), ignore_errors=True)
+        staging = tempfile.mkdtemp(prefix='.xpressgen-', dir=staging_parent)
+
+        try:
+            for directory in sorted(self.directories):
+                os.makedirs(os.path.join(staging, directory), exist_ok=True)
+
+            paths = sorted(self.files)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # sum() re-raises the first failed write
+                written = sum(executor.map(lambda path: self._write_file(staging, path), paths))
+
+            if new_root:
+                # mkdtemp creates the directory private to the user
+                os.chmod(staging, 0o755)
+                os.rename(staging, root)
+            else:
+                self._write_marker(root, {'staging': os.path.basename(staging), 'files': paths})
+                for directory in sorted(self.directories):
+                    os.makedirs(os.path.join(root, directory), exist_ok=True)
+                for path in paths:
+                    os.replace(os.path.join(staging, path), os.path.join(root, path))
+                os.remove(os.path.join(root, FLUSH_MARKER))
+        finally:
+            if os.path.exists(staging):
+                shutil.rmtree(staging, ignore_errors=True)
+
+        self.bytes_flushed += written
+        return paths
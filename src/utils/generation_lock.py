@@ -0,0 +1,179 @@
+import hashlib
+import json
+import logging
+import os
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
+
+from utils.file_tree import FileTree
+
+LOCK_FILE = '.xpressgen.lock'
+LOCK_VERSION = 1
+# Packages whose Python code shapes the generated files
+GENERATOR_PACKAGES = ['core', 'modules', 'templates', 'utils']
+SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def generator_fingerprint() -> str:
+    """Hash of the generator's Python modules, so that a change to one renders every unit again"""
+    digest = hashlib.sha256()
+    for package in GENERATOR_PACKAGES:
+        for root, directories, files in os.walk(os.path.join(SOURCE_ROOT, package)):
+            directories[:] = sorted(directory for directory in directories if directory != '__pycache__')
+            for name in sorted(files):
+                if not name.endswith('.py'):
+                    continue
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, SOURCE_ROOT).encode('utf-8') + b'\0')
+                with open(path, 'rb') as file:
+                    digest.update(file.read())
+    return digest.hexdigest()
+
+
+class GenerationLock:
+    """
+    Record of the last generation run in a project directory.
+
+    .xpressgen.lock holds the input spec, an input hash per render unit (one
+    model's files, index.js, .env, ...) and a content hash per generated file.
+    On a re-run, units whose inputs did not change are not rendered again and
+    only files whose bytes differ are written. A file whose bytes on disk no
+    longer match the lock was edited by hand and is left alone, unless an
+    interrupted flush (FileTree.interrupted_flush) may have written it.
+    """
+
+    def __init__(self, logger: logging.Logger, project_dir: str = '.', fingerprint: str = ''):
+        self.logger = logger
+        self.project_dir = project_dir
+        # Changes when the generator or its templates change, invalidating every unit
+        self.fingerprint = fingerprint
+        self.previous = self._load()
+        # Files of a flush that stopped halfway: what is on disk may be either version
+        self.interrupted = set(FileTree.interrupted_flush(project_dir))
+        if self.interrupted:
+            self.logger.warning(
+                f"⚠️ The last run stopped while writing {len(self.interrupted)} files, they are written again"
+            )
+        self.spec: Optional[Dict[str, Any]] = None
+        self.units: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, str] = {}
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.project_dir, LOCK_FILE)
+
+    @property
+    def exists(self) -> bool:
+        return bool(self.previous)
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path) as file:
+                lock = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(lock, dict) or lock.get('version') != LOCK_VERSION:
+            return {}
+        return lock
+
+    def _disk_hash(self, path: str) -> Optional[str]:
+        try:
+            with open(os.path.join(self.project_dir, path), 'rb') as file:
+                return content_hash(file.read())
+        except OSError:
+            return None
+
+    def input_hash(self, inputs: Any) -> str:
+        """Hash of everything a render unit reads"""
+        payload = json.dumps([self.fingerprint, inputs], sort_keys=True, default=str)
+        return content_hash(payload.encode('utf-8'))
+
+    def is_fresh(self, unit: str, input_hash: str) -> bool:
+        """The unit was rendered from the same inputs last time and its files are still there"""
+        previous = self.previous.get('units', {}).get(unit)
+        if previous is None or previous['inputs'] != input_hash:
+            return False
+        if self.interrupted.intersection(previous['files']):
+            return False
+        return all(os.path.exists(os.path.join(self.project_dir, path)) for path in previous['files'])
+
+    def reuse(self, unit: str):
+        """Carry a fresh unit and its file hashes over to the new lock"""
+        previous = self.previous['units'][unit]
+        self.units[unit] = previous
+        for path in previous['files']:
+            self.files[path] = self.previous['files'][path]
+
+    def record(self, unit: str, input_hash: str, paths: Iterable[str]):
+        self.units[unit] = {'inputs': input_hash, 'files': sorted(paths)}
+
+    def sync(self, file_tree: FileTree) -> bool:
+        """
+        Drop from the tree every file that must not be written before it is flushed:
+        files whose bytes are already on disk and files edited by hand.
+
+        Returns:
+            Whether any file is left to write
+        """
+        previous_files = self.previous.get('files', {})
+        for path in list(file_tree.files):
+            new_hash = content_hash(file_tree.files[path].encode('utf-8'))
+            disk_hash = self._disk_hash(path)
+            if disk_hash == new_hash:
+                # Same bytes: keep the mtime for nodemon and build caches
+                file_tree.discard(path)
+                self.files[path] = new_hash
+            elif disk_hash is not None and disk_hash != previous_files.get(path) and path not in self.interrupted:
+                self.logger.warning(f"⚠️ {path} was changed by hand, leaving it as is")
+                file_tree.discard(path)
+                if path in previous_files:
+                    self.files[path] = previous_files[path]
+            else:
+                self.files[path] = new_hash
+        return bool(file_tree.files)
+
+    def refresh(self, path: str):
+        """Record the bytes a tool (npm) rewrote in a generated file, so they are not taken for a hand edit"""
+        disk_hash = self._disk_hash(path)
+        if disk_hash is not None and path in self.files:
+            self.files[path] = disk_hash
+
+    def keep(self, prefix: str):
+        """Carry the files generated last time under a path prefix over, even though this run did not render them"""
+        for path, previous_hash in self.previous.get('files', {}).items():
+            if path.startswith(prefix) and path not in self.files and self._disk_hash(path) is not None:
+                self.files[path] = previous_hash
+
+    def remove_stale(self):
+        """Delete files generated last time but not this time, unless edited by hand"""
+        for path, previous_hash in self.previous.get('files', {}).items():
+            if path in self.files:
+                continue
+            disk_hash = self._disk_hash(path)
+            if disk_hash is None:
+                continue
+            if disk_hash != previous_hash and path not in self.interrupted:
+                self.logger.warning(f"⚠️ {path} is no longer generated but was changed by hand, keeping it")
+                continue
+            os.remove(os.path.join(self.project_dir, path))
+            self.logger.info(f"🗑️ Removed {path}, no longer generated")
+
+    def write(self, generator_version: str):
+        """Atomically write the new lock"""
+        lock = {
+            'version': LOCK_VERSION,
+            'generator': generator_version,
+            'spec': self.spec,
+            'units': dict(sorted(self.units.items())),
+            'files': dict(sorted(self.files.items())),
+        }
+        temporary = f"{self.path}.tmp"
+        with open(temporary, 'w') as file:
+            json.dump(lock, file, indent=2)
+            file.write('\n')
+        os.replace(temporary, self.path)
@@ -1,10 +1,19 @@
 import logging
 
-def setup_logger():
-    """Configure and return a logger"""
+def setup_logger(level=None, label=None):
+    """
+    Configure and return a logger (level overrides the default INFO level).
+
+    A label (e.g. a fleet service name) is put in front of every message and
+    replaces the configuration inherited from a parent process.
+    """
+    prefix = f'[{label}] ' if label else ''
     logging.basicConfig(
         level=logging.INFO, 
-        format='%(asctime)s - %(levelname)s: %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        format=f'%(asctime)s - {prefix}%(levelname)s: %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        force=label is not None
     )
+    if level is not None:
+        logging.getLogger().setLevel(level)
     return logging.getLogger(__name__)
\ No newline at end of file
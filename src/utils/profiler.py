@@ -0,0 +1,99 @@
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from utils.command_runner import RunLog
+from utils.file_tree import FileTree
+
+
+class PhaseProfiler:
+    """
+    Wall time, subprocess time and bytes produced by each phase of a generation run.
+
+    Subprocess time is the part of every logged command that overlaps the phase,
+    so a background install shows up in the phases it ran alongside.
+    """
+
+    def __init__(self, run_log: RunLog, file_tree: Optional[FileTree] = None):
+        self.run_log = run_log
+        self.file_tree = file_tree
+        self.phases: List[Dict] = []
+        self.started_at = time.time()
+
+    def _counters(self):
+        if self.file_tree is None:
+            return 0, 0
+        return self.file_tree.bytes_rendered, self.file_tree.bytes_flushed
+
+    @contextmanager
+    def phase(self, name: str):
+        """Measure the enclosed block as one phase"""
+        rendered_before, flushed_before = self._counters()
+        start = time.time()
+        try:
+            yield
+        finally:
+            end = time.time()
+            rendered_after, flushed_after = self._counters()
+            self.phases.append({
+                'name': name,
+                'start': start,
+                'end': end,
+                'bytes_rendered': rendered_after - rendered_before,
+                'bytes_written': flushed_after - flushed_before,
+            })
+
+    def _subprocess_time(self, start: float, end: float) -> float:
+        overlap = 0.0
+        for record in self.run_log.records():
+            overlap += max(0.0, min(end, record.finished_at) - max(start, record.started_at))
+        return overlap
+
+    def report(self) -> Dict:
+        """Machine-readable report"""
+        finished_at = max([phase['end'] for phase in self.phases] + [self.started_at])
+        return {
+            'started_at': self.started_at,
+            'wall_time': round(finished_at - self.started_at, 6),
+            'subprocess_time': round(self.run_log.total_duration(), 6),
+            'bytes_written': sum(phase['bytes_written'] for phase in self.phases),
+            'phases': [
+                {
+                    'name': phase['name'],
+                    'wall_time': round(phase['end'] - phase['start'], 6),
+                    'subprocess_time': round(self._subprocess_time(phase['start'], phase['end']), 6),
+                    'bytes_rendered': phase['bytes_rendered'],
+                    'bytes_written': phase['bytes_written'],
+                }
+                for phase in self.phases
+            ],
+            'commands': self.run_log.summary(),
+        }
+
+    def format_report(self, report: Dict = None) -> str:
+        """Human-readable table of a report"""
+        report = report or self.report()
+        width = max([len(phase['name']) for phase in report['phases']] + [5])
+        lines = [
+            f"{'phase':<{width}}  {'wall (s)':>9}  {'subproc (s)':>11}  {'rendered':>10}  {'written':>10}",
+            '-' * (width + 50),
+        ]
+        for phase in report['phases']:
+            lines.append(
+                f"{phase['name']:<{width}}  {phase['wall_time']:>9.3f}  {phase['subprocess_time']:>11.3f}"
+                f"  {phase['bytes_rendered']:>10}  {phase['bytes_written']:>10}"
+            )
+        lines.append('-' * (width + 50))
+        lines.append(
+            f"{'total':<{width}}  {report['wall_time']:>9.3f}  {report['subprocess_time']:>11.3f}"
+            f"  {'':>10}  {report['bytes_written']:>10}"
+        )
+        return '\n'.join(lines)
+
+    def write(self, path: str) -> Dict:
+        """Write the JSON report and return it"""
+        report = self.report()
+        with open(path, 'w') as file:
+            json.dump(report, file, indent=2)
+        return report
@@ -0,0 +1,12 @@
+class _LazyInquirer:
+    """
+    Stand-in for `InquirerPy.inquirer` that imports InquirerPy (and prompt_toolkit)
+    on the first prompt, so non-interactive runs never pay for loading them.
+    """
+
+    def __getattr__(self, name):
+        from InquirerPy import inquirer
+        return getattr(inquirer, name)
+
+
+inquirer = _LazyInquirer()
@@ -0,0 +1,46 @@
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.async_command_runner import AsyncCommandRunner  # noqa: E402
+
+
+class KillTest(unittest.TestCase):
+    @unittest.skipIf(os.name == 'nt', "needs a POSIX shell to start the child")
+    def test_windows_kill_of_an_asyncio_process(self):
+        """The Windows branch of _kill also takes the asyncio processes of AsyncCommandRunner"""
+        runner = AsyncCommandRunner(logging.getLogger(__name__))
+
+        async def kill_sleeping_child():
+            process = await asyncio.create_subprocess_exec('sleep', '30')
+            # The runner picks its Windows code paths from detect_os(), not os.name
+            with mock.patch.object(runner, 'detect_os', return_value='Windows'), \
+                    mock.patch('subprocess.run') as taskkill:
+                runner._kill(process)
+            self.assertEqual(taskkill.call_args[0][0], ['taskkill', '/T', '/F', '/PID', str(process.pid)])
+            return await asyncio.wait_for(process.wait(), 5)
+
+        self.assertIsNotNone(asyncio.run(kill_sleeping_child()))
+
+    def test_timeout_is_reported_on_windows(self):
+        """A timed out command raises TimeoutExpired, not an error of the kill"""
+        runner = AsyncCommandRunner(logging.getLogger(__name__))
+        with mock.patch.object(runner, 'detect_os', return_value='Windows'), \
+                mock.patch.object(runner, '_full_command', side_effect=lambda command: command), \
+                mock.patch.object(runner, '_popen_options', return_value={}), \
+                mock.patch('subprocess.run'):
+            try:
+                with self.assertRaises(subprocess.TimeoutExpired):
+                    runner.start([sys.executable, '-c', 'import time; time.sleep(30)'], timeout=0.5).result(10)
+            finally:
+                runner.close()
+
+
+if __name__ == '__main__':
+    unittest.main()